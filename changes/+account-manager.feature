@@ -0,0 +1 @@
+Add an AccountManager that refreshes many Microsoft sessions by order of expiry with a bounded pool of threads, with lookup by uuid or name and leases
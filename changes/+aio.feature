@@ -0,0 +1 @@
+Added the :py:mod:`mojang.aio` module, an asynchronous version of the API built on httpx
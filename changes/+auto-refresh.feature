@@ -0,0 +1 @@
+Microsoft users created with ``auto_refresh=True`` refresh their session in the background before their access token expires
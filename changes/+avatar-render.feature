@@ -0,0 +1 @@
+Added :py:mod:`mojang.skins.render` to render face, head and bust avatars from skins, with a batch mode running in a pool of processes
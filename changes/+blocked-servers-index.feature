@@ -0,0 +1 @@
+Added :py:class:`~mojang.api.blocked.BlockedServers`, an index of the blocked servers with wildcard hostname matching and conditional refresh
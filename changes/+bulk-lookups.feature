@@ -0,0 +1 @@
+Added :py:func:`~mojang.api.base.get_usernames`, :py:func:`~mojang.api.base.get_profiles` and their streaming versions to fetch multiple users concurrently
@@ -0,0 +1 @@
+Added the ``max_workers`` and ``rate_limit`` parameters to :py:func:`~mojang.api.base.get_uuids` to send the requests concurrently
@@ -0,0 +1 @@
+Skins and capes are now downloaded on first access to their ``data`` instead of when the profile is fetched, and :py:func:`~mojang.api.base.get_profile` and :py:func:`~mojang.api.session.get_profile` accept ``load_textures=False`` to never download them automatically
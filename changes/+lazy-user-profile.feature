@@ -0,0 +1 @@
+The profile of an authenticated user is loaded lazily and concurrently, and updated from the responses of the mutations
@@ -0,0 +1 @@
+Added an opt-in in-memory cache for the uuid, username and profile lookups, see :py:class:`~mojang.api.cache.LookupCache`
@@ -0,0 +1 @@
+Added :py:func:`~mojang.api.models.prefetch_textures` to load the textures of many skins, capes or profiles concurrently, downloading each url once
@@ -0,0 +1 @@
+Added a per-host rate limiter to the transports, the requests to the Mojang APIs are paced to stay below their documented limits. Requests answered with a ``429`` are retried after the ``Retry-After`` delay and raise :py:class:`~mojang.exceptions.TooManyRequests` once the retries are exhausted
@@ -0,0 +1 @@
+Skins and capes now use ``__slots__``, and the SHA-256 digest of their content is computed once when it is loaded, available as ``digest``. Hashing and comparing them uses this digest instead of the whole content
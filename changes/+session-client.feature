@@ -0,0 +1 @@
+Added :py:class:`~mojang.api.session.SessionClient` to send session requests with a bound token and a pooled connection
@@ -0,0 +1 @@
+Concurrent lookups of the same username or uuid now share a single in-flight request, in threads and with :py:mod:`mojang.aio`
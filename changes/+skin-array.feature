@@ -0,0 +1 @@
+Added the :py:mod:`mojang.skins` module and ``Skin.array``, a cached NumPy view of the skin pixels with region helpers, slim detection and batch stacking (requires the ``skins`` extra)
@@ -0,0 +1 @@
+Added :py:class:`~mojang.skins.fingerprint.FingerprintIndex` to find identical and similar skins with content and perceptual hashes
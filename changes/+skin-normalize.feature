@@ -0,0 +1 @@
+Added :py:meth:`Skin.normalize() <mojang.api.models.Skin.normalize>` and :py:func:`~mojang.skins.convert.normalize_batch` to convert legacy 64x32 skins and normalize skins in bulk
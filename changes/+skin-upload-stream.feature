@@ -0,0 +1 @@
+Skins can be uploaded from bytes, memoryviews or file objects, streamed without copy, and uploads of the active skin can be skipped
@@ -0,0 +1 @@
+Added :py:class:`~mojang.api.cache.SQLiteLookupCache`, a persistent lookup cache that can be shared between processes
@@ -0,0 +1 @@
+Skins and capes can be saved to a file or a file object with :py:meth:`~mojang.api.models.Skin.save` without loading them in memory, the content is streamed from the source in chunks
@@ -0,0 +1 @@
+Added :py:class:`~mojang.api.textures.TextureStore`, a bounded on-disk store of textures keyed by their hash, used by skins and capes before downloading them
@@ -0,0 +1 @@
+Added a pooled keep-alive transport shared by every API call, configurable with :py:class:`~mojang.api.transport.Transport` and :py:func:`~mojang.api.transport.use_transport`
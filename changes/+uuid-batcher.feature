@@ -0,0 +1 @@
+Added :py:class:`~mojang.api.batch.UUIDBatcher` and :py:class:`~mojang.aio.batch.AsyncUUIDBatcher`, which group concurrent single username lookups into bulk requests
@@ -0,0 +1 @@
+Microsoft sessions reuse their Xbox Live and XSTS tokens until they expire, a refresh only requests the expired steps
@@ -9,13 +9,19 @@ Checkout the [`documentation`](https://pymojang.readthedocs.io/en/latest/)
 """
 
 from mojang.api import (
+    BlockedServers,
     app,
     get_blocked_servers,
     get_profile,
+    get_profiles,
     get_status,
     get_username,
+    get_usernames,
     get_uuid,
     get_uuids,
+    iter_profiles,
+    iter_usernames,
+    prefetch_textures,
 )
 
 try:
@@ -24,12 +30,18 @@ except ImportError:
     __version__ = None
 
 __all__ = [
+    "BlockedServers",
     "__version__",
     "app",
     "get_blocked_servers",
     "get_profile",
+    "get_profiles",
     "get_status",
     "get_username",
+    "get_usernames",
     "get_uuid",
     "get_uuids",
+    "iter_profiles",
+    "iter_usernames",
+    "prefetch_textures",
 ]
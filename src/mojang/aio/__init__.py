@@ -0,0 +1,39 @@
+"""
+Asynchronous API
+----------------
+
+Coroutine versions of the functions of :mod:`mojang.api.base` and
+:mod:`mojang.api.session`, built on top of `httpx <https://www.python-httpx.org>`_.
+
+Requires the ``aio`` extra: ``pip install pymojang[aio]``
+"""
+
+from mojang.aio import session
+from mojang.aio.base import (
+    get_blocked_servers,
+    get_profile,
+    get_username,
+    get_uuid,
+    get_uuids,
+    refresh_blocked_servers,
+)
+from mojang.aio.transport import (
+    AsyncTransport,
+    get_transport,
+    set_transport,
+    use_transport,
+)
+
+__all__ = [
+    "AsyncTransport",
+    "get_blocked_servers",
+    "get_profile",
+    "get_transport",
+    "get_username",
+    "get_uuid",
+    "get_uuids",
+    "refresh_blocked_servers",
+    "session",
+    "set_transport",
+    "use_transport",
+]
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+from mojang.aio.transport import get_transport
+from mojang.api import base, urls
+from mojang.api.blocked import BlockedServers
+from mojang.api.cache import get_cache
+from mojang.api.singleflight import AsyncSingleFlight
+from mojang.api.structures import UnauthenticatedProfile
+
+_T = TypeVar("_T")
+
+
+#: Concurrent lookups of the same key share a single request
+_lookups = AsyncSingleFlight()
+
+
+async def _cached(kind: str, key: str, fetch: Callable[[], Awaitable[_T]]) -> _T:
+    cache = get_cache()
+    if cache is not None:
+        found, value = cache.get(kind, key)
+        if found:
+            return value
+
+    async def _fetch() -> _T:
+        value = await fetch()
+        if cache is not None:
+            cache.set(kind, key, value)
+        return value
+
+    return await _lookups.do((kind, key), _fetch)
+
+
+async def get_blocked_servers() -> list[str]:
+    """Get a list of blocked servers hashes. For more details checkout
+    :py:func:`~mojang.api.base.get_blocked_servers`"""
+    response = await get_transport().get(urls.api_get_blocked_servers)
+    return base._parse_blocked_servers(response)
+
+
+async def refresh_blocked_servers(servers: BlockedServers) -> bool:
+    """Refresh an index of blocked servers, unless the list didn't change
+    since its last refresh. For more details checkout
+    :py:meth:`~mojang.api.blocked.BlockedServers.refresh`
+
+    :param BlockedServers servers: The index to refresh
+
+    :returns: True if the list was updated, False if it didn't change
+    """
+    response = await get_transport().get(
+        urls.api_get_blocked_servers, headers=servers._request_headers()
+    )
+    return servers._update(response)
+
+
+async def get_uuid(username: str) -> str | None:
+    """Get uuid for a username. For more details checkout
+    :py:func:`~mojang.api.base.get_uuid`
+
+    :param str username: The username you want the uuid of
+
+    :Example:
+
+    >>> from mojang import aio
+    >>> await aio.get_uuid("Notch")
+    '069a79f444e94726a5befca90e38aaf5'
+    """
+    base._check_username(username)
+
+    async def _fetch() -> str | None:
+        response = await get_transport().get(urls.api_get_uuid(username))
+        return base._parse_uuid(response)
+
+    return await _cached("uuid", username.lower(), _fetch)
+
+
+async def get_uuids(usernames: Iterable[str]) -> dict[str, str | None]:
+    """Get uuids for multiple usernames. The requests for each chunk of
+    10 usernames are sent concurrently. For more details checkout
+    :py:func:`~mojang.api.base.get_uuids`
+
+    :param list usernames: The usernames you want the uuid of
+
+    :Example:
+
+    >>> from mojang import aio
+    >>> await aio.get_uuids(["Notch", "_jeb"])
+    {
+        'notch': '069a79f444e94726a5befca90e38aaf5',
+        '_jeb': '45f50155c09f4fdcb5cee30af2ebd1f0'
+    }
+    """
+    usernames = [u.lower() for u in usernames]
+    ret: dict[str, str | None] = dict.fromkeys(usernames, None)
+
+    # Check for invalid names
+    for username in usernames:
+        base._check_username(username)
+
+    transport = get_transport()
+    responses = await asyncio.gather(
+        *(
+            transport.post(urls.api_get_uuids, json=usernames[i : i + 10])
+            for i in range(0, len(usernames), 10)
+        )
+    )
+    for response in responses:
+        base._parse_uuids(response, ret)
+
+    return ret
+
+
+async def get_username(uuid: str) -> str | None:
+    """Get username for a uuid. For more details checkout
+    :py:func:`~mojang.api.base.get_username`
+
+    :param uuid str: The uuid you want the username of
+
+    :Example:
+
+    >>> from mojang import aio
+    >>> await aio.get_username("069a79f444e94726a5befca90e38aaf5")
+    'Notch'
+    """
+
+    async def _fetch() -> str | None:
+        response = await get_transport().get(urls.api_get_username(uuid))
+        return base._parse_username(response)
+
+    return await _cached("username", uuid.lower(), _fetch)
+
+
+async def get_profile(uuid: str) -> UnauthenticatedProfile | None:
+    """Returns the full profile of a user. The skin and cape are not
+    downloaded, call their :py:meth:`~mojang.api.models.Skin.load` method
+    to get their data. For more details checkout
+    :py:func:`~mojang.api.base.get_profile`
+
+    :param str uuid: The uuid of the profile
+    """
+
+    async def _fetch() -> UnauthenticatedProfile | None:
+        response = await get_transport().get(urls.api_user_profile(uuid))
+        return base._parse_profile(uuid, response)
+
+    # Loading the textures would block the event loop
+    return base._without_textures(await _cached("profile", uuid.lower(), _fetch))
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+
+from mojang.aio.transport import get_transport
+from mojang.api import base, urls
+from mojang.api.batch import DEFAULT_WINDOW, MAX_BATCH_SIZE
+from mojang.api.cache import get_cache
+
+
+class _Batch:
+    __slots__ = ("full", "futures", "task")
+
+    def __init__(self) -> None:
+        self.futures: dict[str, asyncio.Future] = {}
+        self.full = asyncio.Event()
+        self.task: asyncio.Future | None = None
+
+
+class AsyncUUIDBatcher:
+    """Lookup client that groups concurrent :py:func:`~mojang.aio.get_uuid`
+    calls into bulk requests. For more details checkout
+    :py:class:`~mojang.api.batch.UUIDBatcher`
+
+    The batches are sent by their own task, so cancelling a lookup doesn't
+    cancel the request of the other lookups of the same batch. A batcher
+    must only be used from one event loop.
+
+    :param float window: The time to wait for other lookups, in seconds
+    :param int max_batch: The maximum number of usernames in a request,
+        at most 10
+
+    :Example:
+
+    >>> import asyncio
+    >>> from mojang.aio.batch import AsyncUUIDBatcher
+    >>> batcher = AsyncUUIDBatcher()
+    >>> await asyncio.gather(batcher.get_uuid("Notch"), batcher.get_uuid("jeb_"))
+    ['069a79f444e94726a5befca90e38aaf5', '853c80ef3c3749fdaa49938b674adae6']
+    """
+
+    def __init__(
+        self, window: float = DEFAULT_WINDOW, max_batch: int = MAX_BATCH_SIZE
+    ) -> None:
+        if not 1 <= max_batch <= MAX_BATCH_SIZE:
+            msg = f"max_batch must be between 1 and {MAX_BATCH_SIZE}"
+            raise ValueError(msg)
+
+        self.__window = window
+        self.__max_batch = max_batch
+        self.__batch: _Batch | None = None
+
+    @property
+    def window(self) -> float:
+        return self.__window
+
+    @property
+    def max_batch(self) -> int:
+        return self.__max_batch
+
+    async def get_uuid(self, username: str) -> str | None:
+        """Get uuid for a username. For more details checkout
+        :py:func:`~mojang.api.base.get_uuid`
+
+        :param str username: The username you want the uuid of
+
+        :raises InvalidName: if the username is invalid
+        """
+        base._check_username(username)
+        username = username.lower()
+
+        cache = get_cache()
+        if cache is not None:
+            found, value = cache.get("uuid", username)
+            if found:
+                return value
+
+        # The event loop is single threaded, no lock is needed
+        batch = self.__batch
+        if batch is None:
+            batch = self.__batch = _Batch()
+            batch.task = asyncio.ensure_future(self._flush(batch))
+
+        future = batch.futures.get(username)
+        if future is None:
+            future = batch.futures[username] = (
+                asyncio.get_running_loop().create_future()
+            )
+
+        if len(batch.futures) >= self.__max_batch:
+            self.__batch = None
+            batch.full.set()
+
+        return await asyncio.shield(future)
+
+    async def _flush(self, batch: _Batch) -> None:
+        try:
+            await asyncio.wait_for(batch.full.wait(), self.__window)
+        except asyncio.TimeoutError:
+            pass
+
+        if self.__batch is batch:
+            self.__batch = None
+
+        usernames = list(batch.futures)
+        ret: dict[str, str | None] = dict.fromkeys(usernames, None)
+
+        try:
+            response = await get_transport().post(urls.api_get_uuids, json=usernames)
+            base._parse_uuids(response, ret)
+        except Exception as e:  # noqa: BLE001
+            for future in batch.futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        cache = get_cache()
+        for username, future in batch.futures.items():
+            if cache is not None:
+                cache.set("uuid", username, ret[username])
+            if not future.done():
+                future.set_result(ret[username])
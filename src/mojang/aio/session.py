@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+from typing import AsyncIterator
+
+import validators
+
+from mojang.aio.transport import get_transport
+from mojang.api import helpers, session, urls
+from mojang.api.models import DEFAULT_CHUNK_SIZE
+from mojang.api.structures import AuthenticatedUserProfile, NameChange
+
+
+async def check_product_voucher(access_token: str, voucher: str) -> bool:
+    """Check if a voucher is available. For more details checkout
+    :py:func:`~mojang.api.session.check_product_voucher`"""
+    headers = helpers.get_headers(bearer=access_token)
+    response = await get_transport().get(
+        urls.api_session_product_voucher(voucher), headers=headers
+    )
+    return session._parse_product_voucher(response)
+
+
+async def redeem_product_voucher(access_token: str, voucher: str) -> bool:
+    """Redeem a product voucher gift code. For more details checkout
+    :py:func:`~mojang.api.session.redeem_product_voucher`"""
+    headers = helpers.get_headers(bearer=access_token)
+    response = await get_transport().put(
+        urls.api_session_product_voucher(voucher), headers=headers
+    )
+    return session._parse_product_voucher(response)
+
+
+async def check_username(access_token: str, username: str) -> bool:
+    """Check if username is available. For more details checkout
+    :py:func:`~mojang.api.session.check_username`"""
+    headers = helpers.get_headers(bearer=access_token)
+    response = await get_transport().get(
+        urls.api_session_check_username(username), headers=headers
+    )
+    return session._parse_check_username(response)
+
+
+async def get_user_name_change(access_token: str) -> NameChange:
+    """Return if user can change name and when it was created. For more
+    details checkout :py:func:`~mojang.api.session.get_user_name_change`"""
+    headers = helpers.get_headers(bearer=access_token)
+    response = await get_transport().get(urls.api_session_name_change, headers=headers)
+    return session._parse_user_name_change(response)
+
+
+async def change_user_name(access_token: str, name: str) -> bool:
+    """Change name of authenticated user. For more details checkout
+    :py:func:`~mojang.api.session.change_user_name`"""
+    headers = helpers.get_headers(bearer=access_token)
+    response = await get_transport().put(
+        urls.api_session_change_name(name), headers=headers
+    )
+    return session._parse_change_user_name(response)
+
+
+async def _read_skin(path: str) -> bytes:
+    if validators.url(path):
+        response = await get_transport().get(path)
+        response.raise_for_status()
+        return response.content
+
+    def _read_file() -> bytes:
+        with open(path, "rb") as fp:
+            return fp.read()
+
+    return await asyncio.get_running_loop().run_in_executor(None, _read_file)
+
+
+class _AsyncSkinUpload:
+    # httpx reads an async iterable body, iterating the upload again
+    # rewinds it so the request can be retried
+    def __init__(self, upload: session._SkinUpload) -> None:
+        self.__upload = upload
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        self.__upload.seek(0)
+        for chunk in iter(
+            functools.partial(self.__upload.read, DEFAULT_CHUNK_SIZE), b""
+        ):
+            yield bytes(chunk)
+
+
+async def change_user_skin(
+    access_token: str,
+    path: session.SkinSource,
+    variant: str = "classic",
+    skip_unchanged: bool = False,
+) -> bool:
+    """Change skin of authenticated user. For more details checkout
+    :py:func:`~mojang.api.session.change_user_skin`"""
+    if isinstance(path, str):
+        path = await _read_skin(path)
+
+    with session._SkinUpload(path, variant) as upload:
+        if skip_unchanged:
+            profile = await get_profile(access_token)
+            active = next((s for s in profile.skins if s.state == "ACTIVE"), None)
+            if active is not None and not active.loaded:
+                active._fill("png", await _read_skin(active.source), None)
+            if session._is_active_skin(active, upload, variant):
+                return False
+
+        headers = helpers.get_headers(bearer=access_token)
+        headers["content-type"] = upload.content_type
+        headers["content-length"] = str(len(upload))
+        response = await get_transport().post(
+            urls.api_session_change_skin,
+            headers=headers,
+            content=_AsyncSkinUpload(upload),
+        )
+    return session._parse_change_user_skin(response)
+
+
+async def reset_user_skin(access_token: str) -> bool:
+    """Reset skin of authenticated user. For more details checkout
+    :py:func:`~mojang.api.session.reset_user_skin`"""
+    headers = helpers.get_headers(bearer=access_token)
+    response = await get_transport().delete(
+        urls.api_session_reset_skin, headers=headers
+    )
+    return session._parse_reset_user_skin(response)
+
+
+async def show_user_cape(access_token: str, cape_id: str) -> bool:
+    """Show user cape. For more details checkout
+    :py:func:`~mojang.api.session.show_user_cape`"""
+    payload = {"capeId": cape_id}
+    headers = helpers.get_headers(bearer=access_token)
+    response = await get_transport().put(
+        urls.api_session_cape_visibility, headers=headers, json=payload
+    )
+    return session._parse_show_user_cape(response)
+
+
+async def hide_user_cape(access_token: str) -> bool:
+    """Hide user cape. For more details checkout
+    :py:func:`~mojang.api.session.hide_user_cape`"""
+    headers = helpers.get_headers(bearer=access_token)
+    response = await get_transport().delete(
+        urls.api_session_cape_visibility, headers=headers
+    )
+    return session._parse_hide_user_cape(response)
+
+
+async def owns_minecraft(
+    access_token: str,
+    verify_sig: bool = False,
+    public_key: str | None = None,
+) -> bool:
+    """Returns True if the authenticated user owns minecraft. For more
+    details checkout :py:func:`~mojang.api.session.owns_minecraft`"""
+    headers = helpers.get_headers(bearer=access_token)
+    response = await get_transport().get(urls.api_session_ownership, headers=headers)
+    return session._parse_owns_minecraft(response, verify_sig, public_key)
+
+
+async def get_profile(access_token: str) -> AuthenticatedUserProfile:
+    """Returns the full profile of a authenticated user. The skins and capes
+    are not downloaded. For more details checkout
+    :py:func:`~mojang.api.session.get_profile`"""
+    headers = helpers.get_headers(bearer=access_token)
+    response = await get_transport().get(urls.api_session_profile, headers=headers)
+    return session._parse_profile(response, load_textures=False)
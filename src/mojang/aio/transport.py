@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import weakref
+from typing import TYPE_CHECKING, Any
+
+try:
+    import httpx
+except ImportError as e:  # no cov
+    msg = "mojang.aio requires httpx, install it with `pip install pymojang[aio]`"
+    raise ImportError(msg) from e
+
+from mojang.api.ratelimit import HostRateLimiter
+from mojang.api.transport import DEFAULT_TIMEOUT
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Iterator
+
+    from typing_extensions import Self
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+
+
+class AsyncTransport:
+    """Asynchronous HTTP transport used by every function of :mod:`mojang.aio`
+
+    The transport keeps a single :class:`httpx.AsyncClient` with a bounded
+    connection pool. When every connection is in use, new requests wait for
+    a free connection instead of failing, so thousands of lookups can be
+    started at once on the same event loop.
+
+    :param int max_connections: The maximum number of open connections
+    :param int max_keepalive_connections: The maximum number of idle
+        connections kept alive
+    :param float timeout: The default timeout of a request, in seconds.
+        The time spent waiting for a free connection is not limited
+    :param httpx.AsyncClient client: Use an already configured client, the
+        pool settings are ignored in this case
+    :param HostRateLimiter limiter: The per-host rate limiter used to schedule
+        the requests and retry them when they are rate limited (default to
+        a limiter with :data:`~mojang.api.ratelimit.MOJANG_RATE_LIMITS`)
+
+    :Example:
+
+    >>> from mojang import aio
+    >>> async with aio.AsyncTransport(max_connections=50) as transport:
+    ...     with aio.use_transport(transport):
+    ...         await aio.get_uuid("Notch")
+    '069a79f444e94726a5befca90e38aaf5'
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        client: httpx.AsyncClient | None = None,
+        limiter: HostRateLimiter | None = None,
+    ) -> None:
+        self.__limiter = limiter if limiter is not None else HostRateLimiter()
+
+        if client is None:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                ),
+                timeout=httpx.Timeout(timeout, pool=None),
+            )
+
+        self.__client = client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self.__client
+
+    @property
+    def limiter(self) -> HostRateLimiter:
+        return self.__limiter
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request using the pooled client. The request waits for
+        the rate limit of its host, and is sent again if the server answers
+        with the status code 429
+
+        :param str method: The HTTP method
+        :param str url: The url of the request
+        :param kwargs: Any argument accepted by :meth:`httpx.AsyncClient.request`
+        """
+        host_limiter = self.__limiter.limiter(url)
+
+        attempt = 0
+        while True:
+            await host_limiter.acquire_async()
+            response = await self.__client.request(method, url, **kwargs)
+            if response.status_code != 429:
+                return response
+
+            if self.__limiter.retry_delay(url, attempt, response.headers) is None:
+                return response
+            attempt += 1
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close every connection of the pool"""
+        await self.__client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+
+# Connections can't be shared between event loops, so each loop
+# gets its own default transport
+_default_transports: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, AsyncTransport
+] = weakref.WeakKeyDictionary()
+_scoped_transport: contextvars.ContextVar[AsyncTransport | None] = (
+    contextvars.ContextVar("mojang_aio_transport", default=None)
+)
+
+
+def get_transport() -> AsyncTransport:
+    """Returns the transport used by the functions of :mod:`mojang.aio`. This
+    is the transport set with :func:`use_transport` if any, otherwise the
+    default transport of the running event loop"""
+    transport = _scoped_transport.get()
+    if transport is not None:
+        return transport
+
+    loop = asyncio.get_running_loop()
+    transport = _default_transports.get(loop)
+    if transport is None:
+        transport = _default_transports[loop] = AsyncTransport()
+    return transport
+
+
+def set_transport(transport: AsyncTransport | None) -> None:
+    """Replace the default transport of the running event loop. The previous
+    default transport is not closed. If `transport` is None, a new default
+    transport will be created on the next request
+
+    :param AsyncTransport transport: The new default transport
+    """
+    loop = asyncio.get_running_loop()
+    if transport is None:
+        _default_transports.pop(loop, None)
+    else:
+        _default_transports[loop] = transport
+
+
+@contextlib.contextmanager
+def use_transport(transport: AsyncTransport) -> Iterator[AsyncTransport]:
+    """Use `transport` for every request made in the current task
+    until the end of the `with` block
+
+    :param AsyncTransport transport: The transport to use
+    """
+    token = _scoped_transport.set(transport)
+    try:
+        yield transport
+    finally:
+        _scoped_transport.reset(token)
@@ -2,18 +2,30 @@ from mojang.api.auth import app
 from mojang.api.base import (
     get_blocked_servers,
     get_profile,
+    get_profiles,
     get_status,
     get_username,
+    get_usernames,
     get_uuid,
     get_uuids,
+    iter_profiles,
+    iter_usernames,
 )
+from mojang.api.blocked import BlockedServers
+from mojang.api.models import prefetch_textures
 
 __all__ = [
+    "BlockedServers",
     "app",
     "get_blocked_servers",
     "get_profile",
+    "get_profiles",
     "get_status",
     "get_username",
+    "get_usernames",
     "get_uuid",
     "get_uuids",
+    "iter_profiles",
+    "iter_usernames",
+    "prefetch_textures",
 ]
@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from mojang.api import helpers
+from mojang.api.auth.models import DEFAULT_REFRESH_MARGIN, DEFAULT_RETRY_DELAY
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from mojang.api.auth.models import MicrosoftAuthenticatedUser
+
+#: Default number of sessions refreshed at the same time
+DEFAULT_MAX_WORKERS = 4
+# Minimum time between two refreshes of the same account, in seconds, in
+# case a new token is already in the refresh margin
+_MIN_REFRESH_DELAY = 1.0
+
+_logger = logging.getLogger(__name__)
+
+
+def _uuid_key(uuid: str) -> str:
+    return uuid.replace("-", "").lower()
+
+
+class _Account:
+    __slots__ = ("leased", "name", "user", "uuid", "version")
+
+    def __init__(self, user: MicrosoftAuthenticatedUser, uuid: str, name: str) -> None:
+        self.user = user
+        self.uuid = uuid
+        self.name = name
+        # Incremented when the account is rescheduled, older entries of the
+        # heap are skipped
+        self.version = 0
+        self.leased = False
+
+
+class AccountManager:
+    """Keep the sessions of many Microsoft users fresh
+
+    The accounts are kept in a heap ordered by the time they must be
+    refreshed, `refresh_margin` seconds before their access token expires.
+    A single scheduler thread waits for the first one, and the refreshes
+    are run by a pool of `max_workers` threads. The requests are sent with
+    the transport of the context that created the manager, so they respect
+    its per-host rate limits.
+
+    The users must be created with ``auto_refresh=False``, the manager
+    replaces their own refresh timer.
+
+    An account can be looked up by uuid or name, and leased for exclusive
+    use until it is returned. A leased account is still refreshed.
+
+    :param int max_workers: The number of sessions refreshed at the same time
+    :param float refresh_margin: The time before the expiry of the access
+        tokens when they are refreshed, in seconds
+    :param float retry_delay: The time before a failed refresh is tried
+        again, in seconds
+
+    :Example:
+
+    >>> from mojang.api.auth.manager import AccountManager
+    >>> manager = AccountManager(max_workers=8)
+    >>> manager.add_many(users)
+    >>> with manager.leased("Notch") as user:
+    ...     user.change_skin("skin.png")
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+    ) -> None:
+        self.__max_workers = max_workers
+        self.__refresh_margin = refresh_margin
+        self.__retry_delay = retry_delay
+        self.__context = contextvars.copy_context()
+
+        self.__lock = threading.Condition()
+        self.__heap: list[tuple[float, int, str, int]] = []
+        self.__counter = itertools.count()
+        self.__accounts: dict[str, _Account] = {}
+        self.__names: dict[str, str] = {}
+        # Accounts that are not leased, the least recently returned first
+        self.__idle: OrderedDict[str, None] = OrderedDict()
+        # Leased accounts, by id of their user
+        self.__leases: dict[int, _Account] = {}
+
+        self.__slots = threading.BoundedSemaphore(max_workers)
+        self.__pool: ThreadPoolExecutor | None = None
+        self.__thread: threading.Thread | None = None
+        self.__closed = False
+
+    def __len__(self) -> int:
+        return len(self.__accounts)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._find(key) is not None
+
+    def __iter__(self) -> Iterator[MicrosoftAuthenticatedUser]:
+        with self.__lock:
+            return iter([account.user for account in self.__accounts.values()])
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def max_workers(self) -> int:
+        return self.__max_workers
+
+    def _find(self, key: str) -> _Account | None:
+        with self.__lock:
+            account = self.__accounts.get(_uuid_key(key))
+            if account is None:
+                uuid = self.__names.get(key.lower())
+                account = self.__accounts.get(uuid) if uuid is not None else None
+            return account
+
+    def _index(self, account: _Account, name: str) -> None:
+        if self.__names.get(account.name) == account.uuid:
+            del self.__names[account.name]
+        account.name = name
+        self.__names[name] = account.uuid
+
+    def _due(self, user: MicrosoftAuthenticatedUser) -> float | None:
+        expires_at = user.expires_at
+        if expires_at is None:
+            return None
+        return expires_at - self.__refresh_margin
+
+    def _schedule(self, account: _Account, due: float | None) -> None:
+        account.version += 1
+        if due is not None:
+            entry = (due, next(self.__counter), account.uuid, account.version)
+            heapq.heappush(self.__heap, entry)
+            self.__lock.notify_all()
+
+    def _start(self) -> None:
+        if self.__closed:
+            msg = "the manager is closed"
+            raise RuntimeError(msg)
+
+        if self.__thread is None:
+            self.__pool = ThreadPoolExecutor(max_workers=self.__max_workers)
+            self.__thread = threading.Thread(
+                target=self.__context.copy().run, args=(self._run,), daemon=True
+            )
+            self.__thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self.__lock:
+                while not self.__closed:
+                    now = time.time()
+                    if self.__heap and self.__heap[0][0] <= now:
+                        break
+                    self.__lock.wait(self.__heap[0][0] - now if self.__heap else None)
+                if self.__closed:
+                    return
+
+                _, _, uuid, version = heapq.heappop(self.__heap)
+                account = self.__accounts.get(uuid)
+                if account is None or account.version != version:
+                    continue
+
+            # At most `max_workers` refreshes are in flight
+            self.__slots.acquire()
+            try:
+                ctx = contextvars.copy_context()
+                self.__pool.submit(ctx.run, self._refresh, account)
+            except RuntimeError:
+                self.__slots.release()
+                return
+
+    def _refresh(self, account: _Account) -> None:
+        try:
+            account.user.refresh()
+        except Exception:  # noqa: BLE001
+            due = time.time() + self.__retry_delay
+        else:
+            due = self._due(account.user)
+            if due is not None:
+                due = max(due, time.time() + _MIN_REFRESH_DELAY)
+        finally:
+            self.__slots.release()
+
+        with self.__lock:
+            if self.__accounts.get(account.uuid) is account:
+                self._schedule(account, due)
+
+    def add(self, user: MicrosoftAuthenticatedUser) -> None:
+        """Add a user to the manager. Its profile is fetched if needed, to
+        know its uuid and name
+
+        :param MicrosoftAuthenticatedUser user: The user
+
+        :raises KeyError: if a user with the same uuid is already managed
+        :raises ValueError: if the user refreshes its own session
+        """
+        if user.auto_refresh:
+            msg = "the user must be created with auto_refresh=False"
+            raise ValueError(msg)
+
+        account = _Account(user, _uuid_key(user.uuid), user.name.lower())
+        with self.__lock:
+            self._start()
+            if account.uuid in self.__accounts:
+                msg = f"user {user.uuid!r} is already managed"
+                raise KeyError(msg)
+
+            self.__accounts[account.uuid] = account
+            self.__names[account.name] = account.uuid
+            self.__idle[account.uuid] = None
+            self._schedule(account, self._due(user))
+            self.__lock.notify_all()
+
+    def add_many(self, users: Iterable[MicrosoftAuthenticatedUser]) -> int:
+        """Add many users to the manager, their profiles are fetched
+        concurrently. For more details checkout :meth:`add`
+
+        :param users: The users
+
+        :returns: The number of users added
+        """
+
+        def _fetch(user: MicrosoftAuthenticatedUser) -> None:
+            user.uuid  # noqa: B018
+
+        count = 0
+        for user, _ in helpers.imap_unordered(_fetch, users, self.__max_workers):
+            self.add(user)
+            count += 1
+        return count
+
+    def remove(self, key: str) -> MicrosoftAuthenticatedUser:
+        """Remove a user from the manager, its session is not closed
+
+        :param str key: The uuid or the name of the user
+
+        :raises KeyError: if the user is not managed
+        """
+        with self.__lock:
+            account = self._find(key)
+            if account is None:
+                raise KeyError(key)
+
+            del self.__accounts[account.uuid]
+            if self.__names.get(account.name) == account.uuid:
+                del self.__names[account.name]
+            self.__idle.pop(account.uuid, None)
+            if account.leased:
+                del self.__leases[id(account.user)]
+            account.version += 1
+            self.__lock.notify_all()
+            return account.user
+
+    def get(self, key: str) -> MicrosoftAuthenticatedUser:
+        """Returns a user, leased or not
+
+        :param str key: The uuid or the name of the user
+
+        :raises KeyError: if the user is not managed
+        """
+        account = self._find(key)
+        if account is None:
+            raise KeyError(key)
+        return account.user
+
+    def lease(
+        self, key: str | None = None, timeout: float | None = None
+    ) -> MicrosoftAuthenticatedUser:
+        """Lease a user for exclusive use, until it is returned with
+        :meth:`release`. If its session expired, it is refreshed first
+
+        :param str key: The uuid or the name of the user. If None, the idle
+            user that was returned the longest time ago is leased
+        :param float timeout: The maximum time to wait for the user to be
+            returned, in seconds. By default, wait forever
+
+        :raises KeyError: if the user is not managed
+        :raises TimeoutError: if no user is available within `timeout`
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self.__lock:
+            while True:
+                if key is None:
+                    uuid = next(iter(self.__idle), None)
+                    account = self.__accounts[uuid] if uuid is not None else None
+                else:
+                    account = self._find(key)
+                    if account is None:
+                        raise KeyError(key)
+                    if account.leased:
+                        account = None
+
+                if account is not None:
+                    break
+
+                remaining = (
+                    deadline - time.monotonic() if deadline is not None else None
+                )
+                if remaining is not None and remaining <= 0:
+                    msg = "no user is available"
+                    raise TimeoutError(msg)
+                self.__lock.wait(remaining)
+
+            account.leased = True
+            del self.__idle[account.uuid]
+            self.__leases[id(account.user)] = account
+
+        expires_at = account.user.expires_at
+        if expires_at is not None and time.time() >= expires_at:
+            try:
+                account.user.refresh()
+            except BaseException:
+                self.release(account.user)
+                raise
+        return account.user
+
+    def release(self, user: MicrosoftAuthenticatedUser) -> None:
+        """Return a leased user. Its name is indexed again, in case it was
+        changed during the lease
+
+        :param MicrosoftAuthenticatedUser user: The user
+        """
+        with self.__lock:
+            account = self.__leases.pop(id(user), None)
+            if account is None or account.user is not user:
+                return
+
+            account.leased = False
+            self.__idle[account.uuid] = None
+            self.__lock.notify_all()
+
+        # The name is read from the profile, which is updated when the user
+        # changes name. The profile may have to be fetched again, the user is
+        # returned first so a failure doesn't keep it leased
+        try:
+            name = user.name.lower()
+        except Exception:
+            _logger.warning(
+                "Failed to read the name of user %s", account.uuid, exc_info=True
+            )
+            return
+
+        with self.__lock:
+            if self.__accounts.get(account.uuid) is account:
+                self._index(account, name)
+
+    @contextlib.contextmanager
+    def leased(
+        self, key: str | None = None, timeout: float | None = None
+    ) -> Iterator[MicrosoftAuthenticatedUser]:
+        """Lease a user for the duration of a `with` block. For more details
+        checkout :meth:`lease`
+
+        :param str key: The uuid or the name of the user
+        :param float timeout: The maximum time to wait for the user
+        """
+        user = self.lease(key, timeout)
+        try:
+            yield user
+        finally:
+            self.release(user)
+
+    def next_refresh(self) -> float | None:
+        """Returns the time of the next scheduled refresh as a POSIX
+        timestamp, or None if no refresh is scheduled"""
+        with self.__lock:
+            return min(
+                (
+                    due
+                    for due, _, uuid, version in self.__heap
+                    if uuid in self.__accounts
+                    and self.__accounts[uuid].version == version
+                ),
+                default=None,
+            )
+
+    def close(self) -> None:
+        """Stop refreshing the sessions. The users are not closed"""
+        with self.__lock:
+            self.__closed = True
+            self.__lock.notify_all()
+
+        if self.__thread is not None:
+            self.__thread.join()
+        if self.__pool is not None:
+            self.__pool.shutdown(wait=True)
@@ -1,14 +1,67 @@
 from __future__ import annotations
 
-import requests
+import datetime as dt
+import re
+import threading
+from typing import TYPE_CHECKING, Callable, NamedTuple
+
+import jwt
 
 from mojang.api import helpers, urls
+from mojang.api.transport import get_transport
 from mojang.exceptions import (
     Unauthorized,
     XboxLiveAuthenticationError,
     XboxLiveInvalidUserHash,
 )
 
+if TYPE_CHECKING:
+    from requests import Response
+
+#: Default time before the expiry of a cached token when it is not used
+#: anymore, in seconds
+DEFAULT_TOKEN_MARGIN = 60
+
+_FRACTION_RE = re.compile(r"\.(\d+)")
+
+
+class XboxLiveToken(NamedTuple):
+    token: str
+    userhash: str
+    not_after: dt.datetime | None
+
+    def is_valid(self, margin: float = 0) -> bool:
+        """Returns True if the token doesn't expire in the next `margin`
+        seconds"""
+        if self.not_after is None:
+            return False
+        now = dt.datetime.now(dt.timezone.utc)
+        return self.not_after - dt.timedelta(seconds=margin) > now
+
+
+def _parse_not_after(value: str | None) -> dt.datetime | None:
+    # The dates have 1 to 7 digits of fraction, before Python 3.11
+    # fromisoformat only supports exactly 3 or 6
+    if value is None:
+        return None
+    value = _FRACTION_RE.sub(
+        lambda match: "." + match.group(1).ljust(6, "0")[:6],
+        value.replace("Z", "+00:00"),
+    )
+    try:
+        return dt.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _parse_xbox_token(response: Response) -> XboxLiveToken:
+    _, data = helpers.err_check(response, (400, XboxLiveAuthenticationError))
+    return XboxLiveToken(
+        data["Token"],
+        data["DisplayClaims"]["xui"][0]["uhs"],
+        _parse_not_after(data.get("NotAfter")),
+    )
+
 
 def authenticate_xbl(auth_token: str) -> tuple[str, str]:
     """Authenticate with Xbox Live using the Microsoft access token
@@ -20,6 +73,11 @@ def authenticate_xbl(auth_token: str) -> tuple[str, str]:
 
     :raises XboxLiveAuthenticationError: if the auth token is invalid
     """
+    xbl = _request_xbl(auth_token)
+    return xbl.token, xbl.userhash
+
+
+def _request_xbl(auth_token: str) -> XboxLiveToken:
     headers = helpers.get_headers(json_content=True)
     payload = {
         "Properties": {
@@ -31,11 +89,10 @@ def authenticate_xbl(auth_token: str) -> tuple[str, str]:
         "TokenType": "JWT",
     }
 
-    response = requests.post(
-        urls.api_ms_xbl_authenticate, headers=headers, json=payload, timeout=10
+    response = get_transport().post(
+        urls.api_ms_xbl_authenticate, headers=headers, json=payload
     )
-    _, data = helpers.err_check(response, (400, XboxLiveAuthenticationError))
-    return data["Token"], data["DisplayClaims"]["xui"][0]["uhs"]
+    return _parse_xbox_token(response)
 
 
 def authenticate_xsts(xbl_token: str) -> tuple[str, str]:
@@ -47,6 +104,11 @@ def authenticate_xsts(xbl_token: str) -> tuple[str, str]:
 
     :raises XboxLiveAuthenticationError: if xbl is invalid
     """
+    xsts = _request_xsts(xbl_token)
+    return xsts.token, xsts.userhash
+
+
+def _request_xsts(xbl_token: str) -> XboxLiveToken:
     headers = helpers.get_headers(json_content=True)
     payload = {
         "Properties": {"SandboxId": "RETAIL", "UserTokens": [xbl_token]},
@@ -54,11 +116,10 @@ def authenticate_xsts(xbl_token: str) -> tuple[str, str]:
         "TokenType": "JWT",
     }
 
-    response = requests.post(
-        urls.api_ms_xbl_authorize, headers=headers, json=payload, timeout=10
+    response = get_transport().post(
+        urls.api_ms_xbl_authorize, headers=headers, json=payload
     )
-    _, data = helpers.err_check(response, (400, XboxLiveAuthenticationError))
-    return data["Token"], data["DisplayClaims"]["xui"][0]["uhs"]
+    return _parse_xbox_token(response)
 
 
 def authenticate_minecraft(userhash: str, xsts_token: str) -> str:
@@ -83,10 +144,107 @@ def authenticate_minecraft(userhash: str, xsts_token: str) -> str:
     headers = helpers.get_headers(json_content=True)
     payload = {"identityToken": f"XBL3.0 x={userhash};{xsts_token}"}
 
-    response = requests.post(
-        urls.api_ms_xbl_login, headers=headers, json=payload, timeout=10
+    response = get_transport().post(
+        urls.api_ms_xbl_login, headers=headers, json=payload
     )
     _, data = helpers.err_check(
         response, (400, XboxLiveInvalidUserHash), (401, Unauthorized)
     )
     return data["access_token"]
+
+
+def get_token_expiry(access_token: str | None) -> float | None:
+    """Returns the expiry time of a Minecraft access token, read from the
+    ``exp`` claim of the token. The signature of the token is not verified
+
+    :param str access_token: The minecraft token
+
+    :returns: A POSIX timestamp, or None if the token has no expiry time
+    """
+    if access_token is None:
+        return None
+
+    try:
+        claims = jwt.decode(access_token, options={"verify_signature": False})
+    except jwt.InvalidTokenError:
+        return None
+
+    expiry = claims.get("exp")
+    return float(expiry) if isinstance(expiry, (int, float)) else None
+
+
+class XboxLiveTokenCache:
+    """Cache of the Xbox Live and XSTS tokens of one account
+
+    The Xbox Live and XSTS tokens are valid for much longer than the
+    Minecraft token. They are kept until their ``NotAfter`` date, so a new
+    Minecraft token only needs the steps whose token expired: usually only
+    the Minecraft login, and the XSTS token once in a while.
+
+    :param float margin: The time before the expiry of a token when it is
+        not used anymore, in seconds
+
+    :Example:
+
+    >>> from mojang.api.auth import microsoft
+    >>> tokens = microsoft.XboxLiveTokenCache()
+    >>> tokens.authenticate(lambda: acquire_microsoft_token())
+    'eyJhbGciOi...'
+    >>> tokens.authenticate(lambda: acquire_microsoft_token())  # Only one request
+    'eyJhbGciOi...'
+    """
+
+    def __init__(self, margin: float = DEFAULT_TOKEN_MARGIN) -> None:
+        self.__margin = margin
+        self.__lock = threading.Lock()
+        self.__xbl: XboxLiveToken | None = None
+        self.__xsts: XboxLiveToken | None = None
+
+    @property
+    def xbl(self) -> XboxLiveToken | None:
+        """The cached Xbox Live token, if any"""
+        return self.__xbl
+
+    @property
+    def xsts(self) -> XboxLiveToken | None:
+        """The cached XSTS token, if any"""
+        return self.__xsts
+
+    def clear(self) -> None:
+        """Forget the cached tokens"""
+        with self.__lock:
+            self.__xbl = self.__xsts = None
+
+    def _xsts(self, get_auth_token: Callable[[], str]) -> tuple[XboxLiveToken, bool]:
+        # Returns the XSTS token, and True if it was cached
+        with self.__lock:
+            if self.__xsts is not None and self.__xsts.is_valid(self.__margin):
+                return self.__xsts, True
+
+            if self.__xbl is None or not self.__xbl.is_valid(self.__margin):
+                self.__xbl = _request_xbl(get_auth_token())
+            self.__xsts = _request_xsts(self.__xbl.token)
+            return self.__xsts, False
+
+    def authenticate(self, get_auth_token: Callable[[], str]) -> str:
+        """Returns a new Minecraft access token, the Xbox Live and XSTS
+        tokens are only requested if they are not cached
+
+        :param get_auth_token: A function returning the Microsoft access
+            token, only called if the Xbox Live token must be requested
+
+        :raises XboxLiveAuthenticationError: if the auth token is invalid
+        :raises XboxLiveInvalidUserHash: if the user hash is invalid
+        :raises Unauthorized: if the XSTS token is invalid
+        """
+        xsts, cached = self._xsts(get_auth_token)
+        try:
+            return authenticate_minecraft(xsts.userhash, xsts.token)
+        except Unauthorized:
+            if not cached:
+                raise
+
+        # The cached tokens were revoked before their expiry
+        self.clear()
+        xsts, _ = self._xsts(get_auth_token)
+        return authenticate_minecraft(xsts.userhash, xsts.token)
@@ -1,20 +1,43 @@
 from __future__ import annotations
 
+import logging
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
-from mojang.api import session
+from mojang.api import helpers, session
 from mojang.api.auth import microsoft
-from mojang.exceptions import MicrosoftInvalidGrant, MicrosoftUserNotOwner
+from mojang.api.singleflight import SingleFlight
+from mojang.api.transport import get_transport
+from mojang.exceptions import MicrosoftInvalidGrant, MicrosoftUserNotOwner, Unauthorized
 
 if TYPE_CHECKING:
     import datetime
 
     import msal
+    from requests import Response
 
     from mojang.api.models import Cape, Skin
+    from mojang.api.structures import AuthenticatedUserProfile, NameChange
 
 _DEFAULT_SCOPES = ["XboxLive.signin"]
+#: Default time before the expiry of the access token when it is refreshed,
+#: in seconds
+DEFAULT_REFRESH_MARGIN = 300
+#: Default time before a failed refresh is tried again, in seconds
+DEFAULT_RETRY_DELAY = 60
+
+_logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+def _checked(response: Response, parse: Callable[[Response], Any]) -> Response:
+    # Raise the errors of the response, and return it to update the profile
+    parse(response)
+    return response
 
 
 # User
@@ -22,6 +45,10 @@ class AuthenticatedUser(ABC):
     """
     Base class for every authenticated user
 
+    The profile is fetched the first time one of its fields is accessed,
+    the profile and the name change are fetched concurrently. The
+    mutations update the profile from their response.
+
     :param str access_token: The session token
     :param str refresh_token: The refresh token
 
@@ -38,21 +65,13 @@ class AuthenticatedUser(ABC):
     """
 
     def __init__(self, access_token: str, refresh_token: str) -> None:
-        self.__name = None
-        self.__uuid = None
-        self.__is_legacy = False
-        self.__is_demo = False
-        self.__skins = None
-        self.__capes = None
-
-        self.__name_change_allowed = False
-        self.__created_at = None
+        self.__lock = threading.RLock()
+        self.__profile: AuthenticatedUserProfile | None = None
+        self.__name_change: NameChange | None = None
 
         self._access_token = access_token
         self._refresh_token = refresh_token
 
-        self._fetch_profile()
-
     @abstractmethod
     def refresh(self):
         raise NotImplementedError
@@ -63,30 +82,27 @@ class AuthenticatedUser(ABC):
 
     @property
     def name(self) -> str | None:
-        return self.__name
+        return self._profile().name
 
     @property
     def uuid(self) -> str | None:
-        return self.__uuid
+        return self._profile().uuid
 
     @property
     def is_legacy(self) -> bool:
-        return self.__is_legacy
+        return self._profile().is_legacy
 
     @property
     def is_demo(self) -> bool:
-        return self.__is_demo
+        return self._profile().is_demo
 
     @property
     def skins(self) -> list[Skin] | None:
-        return self.__skins
+        return self._profile().skins
 
     @property
     def skin(self) -> Skin | None:
-        if self.__skins is None:
-            return None
-
-        res = list(filter(lambda s: s.state == "ACTIVE", self.__skins))
+        res = list(filter(lambda s: s.state == "ACTIVE", self.skins))
         if len(res) > 0:
             return res[0]
 
@@ -94,14 +110,11 @@ class AuthenticatedUser(ABC):
 
     @property
     def capes(self) -> list[Cape] | None:
-        return self.__capes
+        return self._profile().capes
 
     @property
     def cape(self) -> Cape | None:
-        if self.__capes is None:
-            return None
-
-        res = list(filter(lambda cape: cape.state == "ACTIVE", self.__capes))
+        res = list(filter(lambda cape: cape.state == "ACTIVE", self.capes))
         if len(res) > 0:
             return res[0]
 
@@ -109,49 +122,131 @@ class AuthenticatedUser(ABC):
 
     @property
     def name_change_allowed(self) -> bool:
-        return self.__name_change_allowed
+        return self._name_change().allowed
 
     @property
     def created_at(self) -> datetime.datetime | None:
-        return self.__created_at
+        return self._name_change().created_at
+
+    def _profile(self) -> AuthenticatedUserProfile:
+        with self.__lock:
+            if self.__profile is None:
+                self._fetch_profile()
+            return self.__profile
+
+    def _name_change(self) -> NameChange:
+        with self.__lock:
+            if self.__name_change is None:
+                self._fetch_profile()
+            return self.__name_change
 
     def _fetch_profile(self):
-        # Load profile
-        profile = session.get_profile(self._access_token)
-        self.__name = profile.name
-        self.__uuid = profile.uuid
-        self.__skins = profile.skins
-        self.__capes = profile.capes
-        self.__is_legacy = profile.is_legacy
-        self.__is_demo = profile.is_demo
-        del profile
-
-        # Load name change
-        name_change = session.get_user_name_change(self._access_token)
-        self.__name_change_allowed = name_change.allowed
-        self.__created_at = name_change.created_at
+        # The profile and the name change are fetched concurrently, only
+        # the ones not loaded yet
+        fetches: dict[str, Callable[[session.SessionClient], Any]] = {}
+        with self.__lock:
+            if self.__profile is None:
+                fetches["profile"] = lambda client: client.get_profile()
+            if self.__name_change is None:
+                fetches["name_change"] = lambda client: client.get_user_name_change()
+
+            results = dict(
+                helpers.imap_unordered(
+                    lambda key: self._call(fetches[key]),
+                    fetches,
+                    max_workers=len(fetches) or 1,
+                )
+            )
+            self.__profile = results.get("profile", self.__profile)
+            self.__name_change = results.get("name_change", self.__name_change)
+
+    def _before_request(self) -> None:
+        pass
+
+    def _on_unauthorized(self, access_token: str) -> bool:
+        # Returns True if the request should be sent again
+        return False
+
+    def _call(self, func: Callable[[session.SessionClient], _T]) -> _T:
+        # Send a request with the current token. If the token was rejected
+        # and a new one is available, the request is sent again with it
+        self._before_request()
+        access_token = self._access_token
+        try:
+            return func(session.SessionClient(access_token, get_transport()))
+        except Unauthorized:
+            if not self._on_unauthorized(access_token):
+                raise
+
+        return func(session.SessionClient(self._access_token, get_transport()))
+
+    def _update(self, response: Response) -> None:
+        # Use the profile sent back by a mutation, or fetch it again on
+        # the next access
+        profile = session._parse_mutation_profile(response)
+        with self.__lock:
+            self.__profile = profile
+
+    def invalidate(self):
+        """Forget the loaded profile, it is fetched again the next time one
+        of its fields is accessed"""
+        with self.__lock:
+            self.__profile = None
+            self.__name_change = None
 
     def change_name(self, name: str):
         """Change user name. For more details checkout :py:meth:`~mojang.account.session.change_user_name`
 
         :param str name: The new name
         """
-        session.change_user_name(self._access_token, name)
-        self._fetch_profile()
+        response = self._call(
+            lambda client: _checked(
+                client._send_change_name(name), session._parse_change_user_name
+            )
+        )
+        self._update(response)
+        with self.__lock:
+            # The name can't be changed again for a while
+            self.__name_change = None
 
-    def change_skin(self, path: str, variant: str | None = "classic"):
+    def change_skin(
+        self,
+        path: session.SkinSource,
+        variant: str | None = "classic",
+        skip_unchanged: bool = False,
+    ):
         """Change user skin. For more details checkout :py:meth:`~mojang.account.session.change_user_skin`
 
-        :param str path: The path to the skin, either local or remote
+        :param path: The new skin: a local path or an url, the content of the
+            image, or a binary file object
         :param str variant: The variant of skin (default to 'classic')
+        :param bool skip_unchanged: If True, the skin is not uploaded if its
+            pixels and variant are the ones of the active skin. The profile
+            and the active skin are fetched if they weren't already.
+            Requires the ``skins`` extra
         """
-        session.change_user_skin(self._access_token, path, variant)
-        self._fetch_profile()
+        variant = variant or "classic"
+        with session._SkinUpload(path, variant) as upload:
+            if skip_unchanged and session._is_active_skin(self.skin, upload, variant):
+                return
+
+            def _send(client: session.SessionClient) -> Response:
+                upload.seek(0)
+                return _checked(
+                    client._send_skin(upload), session._parse_change_user_skin
+                )
+
+            response = self._call(_send)
+        self._update(response)
 
     def reset_skin(self):
         """Reset user skin. For more details checkout :py:meth:`~mojang.account.session.reset_user_skin`"""
-        session.reset_user_skin(self._access_token)
-        self._fetch_profile()
+        response = self._call(
+            lambda client: _checked(
+                client._send_reset_skin(), session._parse_reset_user_skin
+            )
+        )
+        self._update(response)
 
     def show_cape(self, cape_index: int = 0):
         """Show user cape. For more details checkout :py:meth:`~mojang.account.session.show_user_cape`
@@ -166,42 +261,163 @@ class AuthenticatedUser(ABC):
 
         cape = self.capes[cape_index]
         if isinstance(cape.id, str):
-            session.show_user_cape(self._access_token, cape.id)
+            response = self._call(
+                lambda client: _checked(
+                    client._send_show_cape(cape.id), session._parse_show_user_cape
+                )
+            )
+            self._update(response)
 
     def hide_cape(self):
         """Hide user cape. For more details checkout :py:meth:`~mojang.account.session.hide_user_cape`"""
-        session.hide_user_cape(self._access_token)
+        response = self._call(
+            lambda client: _checked(
+                client._send_hide_cape(), session._parse_hide_user_cape
+            )
+        )
+        self._update(response)
 
 
 class MicrosoftAuthenticatedUser(AuthenticatedUser):
-    """Class for user with a Microsoft account"""
+    """Class for user with a Microsoft account
+
+    With `auto_refresh`, the session is refreshed in a background thread,
+    `refresh_margin` seconds before the access token expires. Concurrent
+    refreshes of the same user are done only once, and a request rejected
+    because its token expired is sent again with the new token.
+
+    :param str access_token: The session token
+    :param str refresh_token: The refresh token
+    :param msal.ClientApplication oauth_client: The Microsoft OAuth client
+    :param bool auto_refresh: If True, the session is refreshed in the
+        background before it expires. Otherwise, it is only refreshed when
+        :meth:`refresh` is called or when its token is rejected
+    :param float refresh_margin: The time before the expiry of the access
+        token when it is refreshed, in seconds
+    :param float retry_delay: The time before a failed background refresh
+        is tried again, in seconds
+    :param XboxLiveTokenCache xbox_tokens: The Xbox Live and XSTS tokens of
+        the user, reused by the refreshes while they are valid
+    """
 
     def __init__(
         self,
         access_token: str,
         refresh_token: str,
         oauth_client: msal.ClientApplication,
+        auto_refresh: bool = False,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        xbox_tokens: microsoft.XboxLiveTokenCache | None = None,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
     ) -> None:
         super().__init__(access_token, refresh_token)
         self.__oauth_client = oauth_client
-
-    def refresh(self):
-        """Refresh current session"""
-        response = self.__oauth_client.acquire_token_by_refresh_token(
-            self._refresh_token, ["XboxLive.signin"]
+        self.__xbox_tokens = (
+            xbox_tokens if xbox_tokens is not None else microsoft.XboxLiveTokenCache()
         )
-        xbl_token, userhash = microsoft.authenticate_xbl(response["access_token"])
-        xsts_token, userhash = microsoft.authenticate_xsts(xbl_token)
-        mc_token = microsoft.authenticate_minecraft(userhash, xsts_token)
+        self.__auto_refresh = auto_refresh
+        self.__refresh_margin = refresh_margin
+        self.__retry_delay = retry_delay
+        self.__refreshes = SingleFlight()
+        self.__timer_lock = threading.Lock()
+        self.__timer: threading.Timer | None = None
+        self.__finalizer: weakref.finalize | None = None
+        self.__expiry: tuple[str | None, float | None] = (None, None)
 
-        self._access_token, self._refresh_token = (
-            mc_token,
-            response["refresh_token"],
-        )
+        self._schedule_refresh()
+
+    @property
+    def auto_refresh(self) -> bool:
+        return self.__auto_refresh
+
+    @property
+    def expires_at(self) -> float | None:
+        """The expiry time of the access token as a POSIX timestamp, or None
+        if it is unknown"""
+        access_token = self._access_token
+        if self.__expiry[0] != access_token:
+            self.__expiry = (access_token, microsoft.get_token_expiry(access_token))
+        return self.__expiry[1]
+
+    def _schedule_refresh(self, delay: float | None = None):
+        with self.__timer_lock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__finalizer.detach()
+                self.__timer = self.__finalizer = None
+
+            expires_at = self.expires_at
+            if not self.__auto_refresh or expires_at is None:
+                return
+
+            if delay is None:
+                delay = max(0.0, expires_at - self.__refresh_margin - time.time())
+            # The timer only holds a weak reference, so a user dropped
+            # without being closed can still be collected, and its timer is
+            # cancelled then
+            self.__timer = threading.Timer(
+                delay, _background_refresh, (weakref.ref(self),)
+            )
+            self.__timer.daemon = True
+            self.__finalizer = weakref.finalize(self, self.__timer.cancel)
+            self.__timer.start()
+
+    def _background_refresh(self):
+        try:
+            self.refresh()
+        except Exception:
+            _logger.warning(
+                "Failed to refresh the session, retrying in %s seconds",
+                self.__retry_delay,
+                exc_info=True,
+            )
+            self._schedule_refresh(self.__retry_delay)
+
+    def _before_request(self) -> None:
+        expires_at = self.expires_at
+        if expires_at is not None and time.time() >= expires_at:
+            self._on_unauthorized(self._access_token)
+
+    def _on_unauthorized(self, access_token: str) -> bool:
+        if self._refresh_token is None:
+            return False
+
+        # The token was maybe refreshed while the request was in flight
+        if self._access_token == access_token:
+            self.refresh()
+        return True
+
+    def refresh(self):
+        """Refresh current session. If the session is already being
+        refreshed by another thread, wait for it instead"""
+        self.__refreshes.do("refresh", self._refresh)
+
+    def _refresh(self):
+        refresh_token = self._refresh_token
+
+        def _auth_token() -> str:
+            # Only called when the Xbox Live token expired
+            nonlocal refresh_token
+            response = self.__oauth_client.acquire_token_by_refresh_token(
+                refresh_token, ["XboxLive.signin"]
+            )
+            refresh_token = response["refresh_token"]
+            return response["access_token"]
+
+        mc_token = self.__xbox_tokens.authenticate(_auth_token)
+        self._access_token, self._refresh_token = mc_token, refresh_token
+        self._schedule_refresh()
 
     def close(self):
         """Close current session"""
         self._access_token, self._refresh_token = None, None
+        self._schedule_refresh()
+
+
+def _background_refresh(ref: weakref.ref[MicrosoftAuthenticatedUser]) -> None:
+    user = ref()
+    if user is not None:
+        user._background_refresh()
 
 
 # Authentication
@@ -218,7 +434,9 @@ class MojangAuthenticationApp:
             redirect_uri=(self.__redirect_uri),
         )
 
-    def _acquire_microsoft_token(self, code: str) -> tuple[str, str]:
+    def _acquire_microsoft_token(
+        self, code: str
+    ) -> tuple[str, str, microsoft.XboxLiveTokenCache]:
         response = self.__client.acquire_token_by_authorization_code(
             code,
             scopes=_DEFAULT_SCOPES,
@@ -227,15 +445,30 @@ class MojangAuthenticationApp:
         if response.get("error", False):
             raise MicrosoftInvalidGrant(*response.values())
 
-        xbl_token, userhash = microsoft.authenticate_xbl(response["access_token"])
-        xsts_token, userhash = microsoft.authenticate_xsts(xbl_token)
-        access_token = microsoft.authenticate_minecraft(userhash, xsts_token)
+        xbox_tokens = microsoft.XboxLiveTokenCache()
+        access_token = xbox_tokens.authenticate(lambda: response["access_token"])
 
         if not session.owns_minecraft(access_token):
             raise MicrosoftUserNotOwner
 
-        return access_token, str(response["refresh_token"])
+        return access_token, str(response["refresh_token"]), xbox_tokens
+
+    def get_session(
+        self, code: str, auto_refresh: bool = False
+    ) -> MicrosoftAuthenticatedUser:
+        """Returns the session of the user who authorized the app
 
-    def get_session(self, code: str) -> MicrosoftAuthenticatedUser:
-        access_token, refresh_token = self._acquire_microsoft_token(code)
-        return MicrosoftAuthenticatedUser(access_token, refresh_token, self.__client)
+        :param str code: The authorization code
+        :param bool auto_refresh: If True, the session is refreshed in the
+            background before it expires. Otherwise, it is refreshed when
+            asked to, for instance by an
+            :py:class:`~mojang.api.auth.manager.AccountManager`
+        """
+        access_token, refresh_token, xbox_tokens = self._acquire_microsoft_token(code)
+        return MicrosoftAuthenticatedUser(
+            access_token,
+            refresh_token,
+            self.__client,
+            auto_refresh=auto_refresh,
+            xbox_tokens=xbox_tokens,
+        )
@@ -2,14 +2,24 @@ from __future__ import annotations
 
 import base64
 import json
-from typing import Iterable
-
-import requests
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, TypeVar
 
 from mojang.api import helpers, urls
+from mojang.api.cache import get_cache
 from mojang.api.models import Cape, Skin
+from mojang.api.ratelimit import RateLimiter
+from mojang.api.singleflight import SingleFlight
 from mojang.api.structures import ServiceStatus, UnauthenticatedProfile
-from mojang.exceptions import InvalidName, NotFound
+from mojang.api.transport import get_transport
+from mojang.exceptions import ChunkLookupError, InvalidName, NotFound
+
+if TYPE_CHECKING:
+    from requests import Response
+
+    from mojang.api.transport import Transport
+
+_T = TypeVar("_T")
 
 
 def get_status() -> list[ServiceStatus]:
@@ -43,29 +53,37 @@ def get_status() -> list[ServiceStatus]:
     ]
 
 
-def get_blocked_servers() -> list[str]:
-    """Get a list of blocked servers hashes"""
-    response = requests.get(urls.api_get_blocked_servers, timeout=10)
-    _, data = helpers.err_check(response)
+#: Concurrent lookups of the same key share a single request
+_lookups = SingleFlight()
 
-    return data.split("\n")
 
+def _cached(kind: str, key: str, fetch: Callable[[], _T]) -> _T:
+    cache = get_cache()
+    if cache is not None:
+        found, value = cache.get(kind, key)
+        if found:
+            return value
 
-def get_uuid(username: str) -> str | None:
-    """Get uuid for a username
+    def _fetch() -> _T:
+        value = fetch()
+        if cache is not None:
+            cache.set(kind, key, value)
+        return value
 
-    :param str username: The username you want the uuid of
+    return _lookups.do((kind, key), _fetch)
 
-    :Example:
 
-    >>> import mojang
-    >>> mojang.get_uuid("Notch")
-    '069a79f444e94726a5befca90e38aaf5'
-    """
+def _parse_blocked_servers(response: Response) -> list[str]:
+    _, data = helpers.err_check(response)
+    return data.split("\n")
+
+
+def _check_username(username: str) -> None:
     if len(username) == 0 or len(username) > 16:  # noqa: PLR2004
         raise InvalidName
 
-    response = requests.get(urls.api_get_uuid(username), timeout=10)
+
+def _parse_uuid(response: Response) -> str | None:
     try:
         code, data = helpers.err_check(
             response,
@@ -80,7 +98,146 @@ def get_uuid(username: str) -> str | None:
     return data["id"]
 
 
-def get_uuids(usernames: Iterable[str]) -> dict[str, str | None]:
+def _parse_uuids(response: Response, ret: dict[str, str | None]) -> None:
+    _, data = helpers.err_check(response)
+
+    for item in data:
+        ret[item["name"].lower()] = item["id"]
+
+
+def _fetch_uuids_chunk(
+    transport: Transport,
+    chunk: list[str],
+    ret: dict[str, str | None],
+    limiter: RateLimiter | None = None,
+) -> None:
+    if limiter is not None:
+        limiter.acquire()
+
+    response = transport.post(urls.api_get_uuids, json=chunk)
+    _parse_uuids(response, ret)
+
+
+def _fetch_uuids_chunk_or_raise(
+    transport: Transport,
+    chunk: list[str],
+    ret: dict[str, str | None],
+    limiter: RateLimiter | None = None,
+) -> None:
+    try:
+        _fetch_uuids_chunk(transport, chunk, ret, limiter)
+    except Exception as e:
+        # Let the caller know which names were not resolved
+        raise ChunkLookupError(chunk) from e
+
+
+def _parse_username(response: Response) -> str | None:
+    try:
+        code, data = helpers.err_check(
+            response,
+            (400, ValueError),
+            use_defaults=True,
+        )
+    except NotFound:
+        return None
+
+    if code == 204:
+        return None
+
+    return data["name"]
+
+
+def _parse_profile(
+    uuid: str, response: Response, load_textures: bool = True
+) -> UnauthenticatedProfile | None:
+    # The textures are never downloaded here, they are loaded on first
+    # access to their data, or only on demand if `load_textures` is False
+    code, data = helpers.err_check(response, (400, ValueError))
+
+    if code == 204:
+        return None
+
+    # Load skin and cape
+    textures_data = json.loads(base64.b64decode(data["properties"][0]["value"]))
+
+    skin = None
+    skin_data = textures_data["textures"].get("SKIN", None)
+    if skin_data is not None:
+        skin = Skin(
+            skin_data["url"],
+            skin_data.get("metadata", {"model": "classic"})["model"],
+            autoload=load_textures,
+        )
+
+    cape = None
+    cape_data = textures_data["textures"].get("CAPE", None)
+    if cape_data is not None:
+        cape = Cape(cape_data["url"], autoload=load_textures)
+
+    return UnauthenticatedProfile(
+        name=data["name"],
+        uuid=uuid,
+        is_legacy=data.get("legacy", False),
+        is_demo=data.get("demo", False),
+        skin=skin,
+        cape=cape,
+    )
+
+
+def _without_textures(
+    profile: UnauthenticatedProfile | None,
+) -> UnauthenticatedProfile | None:
+    # Cached profiles are shared, give the caller its own textures
+    # that are never downloaded automatically
+    if profile is None:
+        return None
+
+    return profile._replace(
+        skin=(
+            Skin(profile.skin.source, profile.skin.variant, autoload=False)
+            if profile.skin is not None
+            else None
+        ),
+        cape=(
+            Cape(profile.cape.source, autoload=False)
+            if profile.cape is not None
+            else None
+        ),
+    )
+
+
+def get_blocked_servers() -> list[str]:
+    """Get a list of blocked servers hashes"""
+    response = get_transport().get(urls.api_get_blocked_servers)
+    return _parse_blocked_servers(response)
+
+
+def get_uuid(username: str) -> str | None:
+    """Get uuid for a username
+
+    :param str username: The username you want the uuid of
+
+    :Example:
+
+    >>> import mojang
+    >>> mojang.get_uuid("Notch")
+    '069a79f444e94726a5befca90e38aaf5'
+    """
+    _check_username(username)
+
+    def _fetch() -> str | None:
+        response = get_transport().get(urls.api_get_uuid(username))
+        return _parse_uuid(response)
+
+    return _cached("uuid", username.lower(), _fetch)
+
+
+def get_uuids(
+    usernames: Iterable[str],
+    max_workers: int = 1,
+    rate_limit: float | None = None,
+    limiter: RateLimiter | None = None,
+) -> dict[str, str | None]:
     """Get uuids for multiple usernames
 
     .. admonition:: Limited Endpoint
@@ -90,6 +247,15 @@ def get_uuids(usernames: Iterable[str]) -> dict[str, str | None]:
         given to the function, multiple request will be made.
 
     :param list usernames: The usernames you want the uuid of
+    :param int max_workers: The number of requests sent concurrently
+        (default to 1, the requests are sent one after another)
+    :param float rate_limit: The maximum number of requests per second
+    :param RateLimiter limiter: The limiter to use, for instance to share
+        a limit between multiple calls. Takes precedence over `rate_limit`
+
+    :raises InvalidName: if one of the usernames is invalid
+    :raises ChunkLookupError: if the request for one of the chunks fails,
+        with the usernames of that chunk
 
     :Example:
 
@@ -101,22 +267,65 @@ def get_uuids(usernames: Iterable[str]) -> dict[str, str | None]:
     }
     """
     usernames = [u.lower() for u in usernames]
-    ret = dict.fromkeys(usernames, None)
+    ret: dict[str, str | None] = dict.fromkeys(usernames, None)
 
     # Check for invalid names
-    if any(not (0 < len(u) <= 16) for u in usernames):  # noqa: PLR2004
-        raise InvalidName
+    for username in usernames:
+        _check_username(username)
+
+    if limiter is None and rate_limit is not None:
+        limiter = RateLimiter(rate_limit)
+
+    cache = get_cache()
+    missing = usernames
+    if cache is not None:
+        missing = []
+        for username in usernames:
+            found, value = cache.get("uuid", username)
+            if found:
+                ret[username] = value
+            else:
+                missing.append(username)
+
+    if not missing:
+        return ret
+
+    transport = get_transport()
+    chunks = [missing[i : i + 10] for i in range(0, len(missing), 10)]
+    if max_workers <= 1 or len(chunks) == 1:
+        for chunk in chunks:
+            _fetch_uuids_chunk_or_raise(transport, chunk, ret, limiter)
+    else:
+        _fetch_uuids_chunks(transport, chunks, ret, limiter, max_workers)
+
+    if cache is not None:
+        for username in missing:
+            cache.set("uuid", username, ret[username])
 
-    for i in range(0, len(usernames), 10):
-        response = requests.post(
-            urls.api_get_uuids, json=usernames[i : i + 10], timeout=10
-        )
-        _, data = helpers.err_check(response)
+    return ret
 
-        for item in data:
-            ret[item["name"].lower()] = item["id"]
 
-    return ret
+def _fetch_uuids_chunks(
+    transport: Transport,
+    chunks: list[list[str]],
+    ret: dict[str, str | None],
+    limiter: RateLimiter | None,
+    max_workers: int,
+) -> None:
+    # Each chunk writes distinct keys of `ret`, which are created
+    # beforehand, so the workers can fill it without a lock
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        futures = [
+            executor.submit(_fetch_uuids_chunk_or_raise, transport, chunk, ret, limiter)
+            for chunk in chunks
+        ]
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in not_done:
+            future.cancel()
+
+        for future in futures:
+            if future in done and future.exception() is not None:
+                raise future.exception()  # type: ignore[misc]
 
 
 def get_username(uuid: str) -> str | None:
@@ -130,26 +339,68 @@ def get_username(uuid: str) -> str | None:
     >>> mojang.get_username("069a79f444e94726a5befca90e38aaf5")
     'Notch'
     """
-    response = requests.get(urls.api_get_username(uuid), timeout=10)
-    try:
-        code, data = helpers.err_check(
-            response,
-            (400, ValueError),
-            use_defaults=True,
-        )
-    except NotFound:
-        return None
 
-    if code == 204:  # noqa: PLR2004
-        return None
+    def _fetch() -> str | None:
+        response = get_transport().get(urls.api_get_username(uuid))
+        return _parse_username(response)
 
-    return data["name"]
+    return _cached("username", uuid.lower(), _fetch)
+
+
+def iter_usernames(
+    uuids: Iterable[str], max_workers: int = 8
+) -> Iterator[tuple[str, str | None]]:
+    """Get usernames for multiple uuids. The requests are sent concurrently and
+    the results are yielded as soon as they are received, so they might not be
+    in the same order as `uuids`
+
+    :param list uuids: The uuids you want the username of
+    :param int max_workers: The number of requests sent concurrently
+
+    :returns: An iterator of ``(uuid, username)`` tuples, the username is None
+        if the uuid doesn't exist
+
+    :Example:
+
+    >>> import mojang
+    >>> for uuid, username in mojang.iter_usernames(uuids):
+    ...     print(uuid, username)
+    """
+    return helpers.imap_unordered(get_username, uuids, max_workers)
+
+
+def get_usernames(uuids: Iterable[str], max_workers: int = 8) -> dict[str, str | None]:
+    """Get usernames for multiple uuids. The requests are sent concurrently,
+    for more details checkout :py:func:`iter_usernames`
+
+    :param list uuids: The uuids you want the username of
+    :param int max_workers: The number of requests sent concurrently
+
+    :Example:
 
+    >>> import mojang
+    >>> mojang.get_usernames(["069a79f444e94726a5befca90e38aaf5", "853c80ef3c3749fdaa49938b674adae6"])
+    {
+        '069a79f444e94726a5befca90e38aaf5': 'Notch',
+        '853c80ef3c3749fdaa49938b674adae6': 'jeb_'
+    }
+    """
+    uuids = list(uuids)
+    ret: dict[str, str | None] = dict.fromkeys(uuids, None)
+    ret.update(iter_usernames(list(ret), max_workers))
+    return ret
 
-def get_profile(uuid: str) -> UnauthenticatedProfile | None:
+
+def get_profile(uuid: str, load_textures: bool = True) -> UnauthenticatedProfile | None:
     """Returns the full profile of a user
 
+    The skin and cape are not downloaded with the profile, their content is
+    downloaded the first time their `data` is accessed.
+
     :param str uuid: The uuid of the profile
+    :param bool load_textures: If False, the skin and cape are never
+        downloaded automatically, only their url is available until their
+        :py:meth:`~mojang.api.models.Skin.load` method is called
 
     :Example:
 
@@ -164,33 +415,49 @@ def get_profile(uuid: str) -> UnauthenticatedProfile | None:
         cape=None
     )
     """
-    response = requests.get(urls.api_user_profile(uuid), timeout=10)
-    code, data = helpers.err_check(response, (400, ValueError))
 
-    if code == 204:  # noqa: PLR2004
-        return None
+    def _fetch() -> UnauthenticatedProfile | None:
+        response = get_transport().get(urls.api_user_profile(uuid))
+        return _parse_profile(uuid, response)
 
-    # Load skin and cape
-    textures_data = json.loads(base64.b64decode(data["properties"][0]["value"]))
+    profile = _cached("profile", uuid.lower(), _fetch)
+    if not load_textures:
+        return _without_textures(profile)
+    return profile
 
-    skin = None
-    skin_data = textures_data["textures"].get("SKIN", None)
-    if skin_data is not None:
-        skin = Skin(
-            skin_data["url"],
-            skin_data.get("metadata", {"model": "classic"})["model"],
-        )
 
-    cape = None
-    cape_data = textures_data["textures"].get("CAPE", None)
-    if cape_data is not None:
-        cape = Cape(cape_data["url"])
+def iter_profiles(
+    uuids: Iterable[str], max_workers: int = 8
+) -> Iterator[tuple[str, UnauthenticatedProfile | None]]:
+    """Get the profiles of multiple uuids. The requests are sent concurrently
+    and the profiles are yielded as soon as they are received, so they might
+    not be in the same order as `uuids`
 
-    return UnauthenticatedProfile(
-        name=data["name"],
-        uuid=uuid,
-        is_legacy=data.get("legacy", False),
-        is_demo=data.get("demo", False),
-        skin=skin,
-        cape=cape,
-    )
+    :param list uuids: The uuids of the profiles
+    :param int max_workers: The number of requests sent concurrently
+
+    :returns: An iterator of ``(uuid, profile)`` tuples, the profile is None
+        if the uuid doesn't exist
+
+    :Example:
+
+    >>> import mojang
+    >>> for uuid, profile in mojang.iter_profiles(uuids):
+    ...     print(uuid, profile.name)
+    """
+    return helpers.imap_unordered(get_profile, uuids, max_workers)
+
+
+def get_profiles(
+    uuids: Iterable[str], max_workers: int = 8
+) -> dict[str, UnauthenticatedProfile | None]:
+    """Get the profiles of multiple uuids. The requests are sent concurrently,
+    for more details checkout :py:func:`iter_profiles`
+
+    :param list uuids: The uuids of the profiles
+    :param int max_workers: The number of requests sent concurrently
+    """
+    uuids = list(uuids)
+    ret: dict[str, UnauthenticatedProfile | None] = dict.fromkeys(uuids, None)
+    ret.update(iter_profiles(list(ret), max_workers))
+    return ret
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+
+from mojang.api.base import _check_username, _fetch_uuids_chunk
+from mojang.api.cache import get_cache
+from mojang.api.transport import get_transport
+
+DEFAULT_WINDOW = 0.01
+MAX_BATCH_SIZE = 10
+
+
+class _Batch:
+    __slots__ = ("full", "futures")
+
+    def __init__(self) -> None:
+        self.futures: dict[str, Future] = {}
+        self.full = threading.Event()
+
+
+class UUIDBatcher:
+    """Lookup client that groups concurrent :py:func:`~mojang.api.base.get_uuid`
+    calls into bulk requests
+
+    The first lookup opens a batch and waits for `window` seconds, or until
+    the batch holds `max_batch` usernames. The usernames looked up in the
+    meantime by other threads are added to the batch, then a single request
+    is sent to the bulk endpoint and each caller receives its own uuid.
+
+    The lookups use the cache set with :py:func:`~mojang.api.cache.set_cache`,
+    and the requests are sent with the transport of the thread that opened
+    the batch.
+
+    :param float window: The time to wait for other lookups, in seconds
+    :param int max_batch: The maximum number of usernames in a request,
+        at most 10
+
+    :Example:
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> from mojang.api.batch import UUIDBatcher
+    >>> batcher = UUIDBatcher(window=0.05)
+    >>> with ThreadPoolExecutor(max_workers=10) as executor:
+    ...     list(executor.map(batcher.get_uuid, ["Notch", "jeb_"]))
+    ['069a79f444e94726a5befca90e38aaf5', '853c80ef3c3749fdaa49938b674adae6']
+    """
+
+    def __init__(
+        self, window: float = DEFAULT_WINDOW, max_batch: int = MAX_BATCH_SIZE
+    ) -> None:
+        if not 1 <= max_batch <= MAX_BATCH_SIZE:
+            msg = f"max_batch must be between 1 and {MAX_BATCH_SIZE}"
+            raise ValueError(msg)
+
+        self.__window = window
+        self.__max_batch = max_batch
+        self.__lock = threading.Lock()
+        self.__batch: _Batch | None = None
+
+    @property
+    def window(self) -> float:
+        return self.__window
+
+    @property
+    def max_batch(self) -> int:
+        return self.__max_batch
+
+    def get_uuid(self, username: str) -> str | None:
+        """Get uuid for a username. For more details checkout
+        :py:func:`~mojang.api.base.get_uuid`
+
+        :param str username: The username you want the uuid of
+
+        :raises InvalidName: if the username is invalid
+        :raises concurrent.futures.CancelledError: if the thread that sends
+            the request was interrupted
+        """
+        _check_username(username)
+        username = username.lower()
+
+        cache = get_cache()
+        if cache is not None:
+            found, value = cache.get("uuid", username)
+            if found:
+                return value
+
+        with self.__lock:
+            batch = self.__batch
+            leader = batch is None
+            if batch is None:
+                batch = self.__batch = _Batch()
+
+            future = batch.futures.get(username)
+            if future is None:
+                future = batch.futures[username] = Future()
+
+            if len(batch.futures) >= self.__max_batch:
+                # Later lookups go to a new batch
+                self.__batch = None
+                batch.full.set()
+
+        if leader:
+            try:
+                batch.full.wait(self.__window)
+                with self.__lock:
+                    if self.__batch is batch:
+                        self.__batch = None
+                self._send(batch)
+            finally:
+                # If the leader was interrupted, the other lookups of the
+                # batch are cancelled instead of waiting forever
+                with self.__lock:
+                    if self.__batch is batch:
+                        self.__batch = None
+                for pending in batch.futures.values():
+                    pending.cancel()
+
+        return future.result()
+
+    def _send(self, batch: _Batch) -> None:
+        usernames = list(batch.futures)
+        ret: dict[str, str | None] = dict.fromkeys(usernames, None)
+
+        try:
+            _fetch_uuids_chunk(get_transport(), usernames, ret)
+        except Exception as e:  # noqa: BLE001
+            for future in batch.futures.values():
+                future.set_exception(e)
+            return
+
+        cache = get_cache()
+        for username, future in batch.futures.items():
+            if cache is not None:
+                cache.set("uuid", username, ret[username])
+            future.set_result(ret[username])
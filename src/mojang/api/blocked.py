@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import hashlib
+import ipaddress
+import threading
+from typing import TYPE_CHECKING, Iterable
+
+from mojang.api import helpers, urls
+from mojang.api.transport import get_transport
+
+if TYPE_CHECKING:
+    from requests import Response
+
+
+def _hash(pattern: str) -> str:
+    # The client hashes the patterns encoded in ISO-8859-1
+    data = pattern.encode("iso-8859-1", errors="replace")
+    return hashlib.sha1(data).hexdigest()
+
+
+def _is_ip(hostname: str) -> bool:
+    try:
+        ipaddress.IPv4Address(hostname)
+    except ValueError:
+        return False
+    return True
+
+
+def server_patterns(hostname: str) -> list[str]:
+    """Returns the patterns a server is checked against, in the same order
+    as the Minecraft client
+
+    For a domain name, the patterns are the domain itself and each of its
+    parent domains with a wildcard: ``mc.example.com``, ``*.example.com``
+    and ``*.com``. For an IPv4 address, the patterns are the address itself
+    and its ranges: ``192.168.0.1``, ``192.168.0.*``, ``192.168.*`` and
+    ``192.*``
+
+    :param str hostname: The hostname or ip address of the server
+    """
+    hostname = hostname.strip().lower().rstrip(".")
+    if hostname == "":
+        return []
+
+    patterns = [hostname]
+    parts = hostname.split(".")
+    if _is_ip(hostname):
+        patterns += [".".join(parts[:i] + ["*"]) for i in range(3, 0, -1)]
+    else:
+        patterns += ["*." + ".".join(parts[i:]) for i in range(1, len(parts))]
+
+    return patterns
+
+
+class BlockedServers:
+    """Index of the servers blocked by Mojang
+
+    The SHA-1 hashes of the blocked servers are kept in a set, so a server
+    is checked in constant time. The list is refreshed with a conditional
+    request, when it didn't change since the last refresh, the server only
+    answers with the status code 304.
+
+    :param list hashes: The initial hashes, if None the list is empty until
+        :meth:`refresh` is called
+
+    :Example:
+
+    >>> from mojang.api.blocked import BlockedServers
+    >>> blocked = BlockedServers()
+    >>> blocked.refresh()
+    True
+    >>> blocked.is_blocked("mc.example.com")
+    False
+    >>> blocked.refresh()
+    False
+    """
+
+    def __init__(self, hashes: Iterable[str] | None = None) -> None:
+        self.__lock = threading.Lock()
+        self.__hashes: frozenset[str] = frozenset(
+            h.strip().lower() for h in (hashes or []) if h.strip()
+        )
+        self.__etag: str | None = None
+        self.__last_modified: str | None = None
+
+    @property
+    def hashes(self) -> frozenset[str]:
+        return self.__hashes
+
+    @property
+    def etag(self) -> str | None:
+        return self.__etag
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.__last_modified
+
+    def __len__(self) -> int:
+        return len(self.__hashes)
+
+    def __contains__(self, hostname: object) -> bool:
+        return isinstance(hostname, str) and self.is_blocked(hostname)
+
+    def match(self, hostname: str) -> str | None:
+        """Returns the first pattern of `hostname` that is blocked,
+        or None if the server is not blocked
+
+        :param str hostname: The hostname or ip address of the server
+        """
+        hashes = self.__hashes
+        for pattern in server_patterns(hostname):
+            if _hash(pattern) in hashes:
+                return pattern
+        return None
+
+    def is_blocked(self, hostname: str) -> bool:
+        """Returns True if the server is blocked, either directly or by
+        a wildcard pattern. For the patterns checked, see
+        :func:`server_patterns`
+
+        :param str hostname: The hostname or ip address of the server
+        """
+        return self.match(hostname) is not None
+
+    def _request_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.__etag is not None:
+            headers["if-none-match"] = self.__etag
+        if self.__last_modified is not None:
+            headers["if-modified-since"] = self.__last_modified
+        return headers
+
+    def _update(self, response: Response) -> bool:
+        if response.status_code == 304:
+            return False
+
+        helpers.err_check(response)
+        hashes = frozenset(
+            h.strip().lower() for h in response.text.split("\n") if h.strip()
+        )
+
+        with self.__lock:
+            self.__hashes = hashes
+            self.__etag = response.headers.get("etag")
+            self.__last_modified = response.headers.get("last-modified")
+
+        return True
+
+    def refresh(self) -> bool:
+        """Download the list of blocked servers, unless it didn't change
+        since the last refresh
+
+        :returns: True if the list was updated, False if it didn't change
+        """
+        response = get_transport().get(
+            urls.api_get_blocked_servers, headers=self._request_headers()
+        )
+        return self._update(response)
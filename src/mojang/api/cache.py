@@ -0,0 +1,483 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Iterable, NamedTuple
+
+from mojang.api.models import Cape, Skin
+from mojang.api.structures import UnauthenticatedProfile
+
+if TYPE_CHECKING:
+    from typing import Iterator
+
+#: Default time to live, in seconds, of each kind of lookup
+DEFAULT_TTL = {"uuid": 3600.0, "username": 3600.0, "profile": 300.0}
+#: Default time to live, in seconds, of "no such player" answers
+DEFAULT_NEGATIVE_TTL = 60.0
+DEFAULT_MAXSIZE = 10_000
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+
+class CacheEntry(NamedTuple):
+    kind: str
+    key: str
+    value: Any
+    #: When the entry expires, as a unix timestamp
+    expires_at: float
+
+
+class BaseCache(ABC):
+    """Base class for the caches of the lookups of :mod:`mojang.api.base`
+
+    Entries are stored by kind (``uuid``, ``username``, ``profile``) and key,
+    and expire after the time to live of their kind. A ``None`` value means
+    the player doesn't exist, it expires after `negative_ttl`.
+
+    :param dict ttl: The time to live of each kind, in seconds. Kinds that
+        are not given use :data:`DEFAULT_TTL`
+    :param float negative_ttl: The time to live of ``None`` values, in seconds
+    """
+
+    def __init__(
+        self,
+        ttl: dict[str, float] | None = None,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+    ) -> None:
+        self.__ttl = {**DEFAULT_TTL, **(ttl or {})}
+        self.__negative_ttl = negative_ttl
+
+    def ttl(self, kind: str, value: Any) -> float:
+        """Returns the time to live of `value` for this kind of lookup"""
+        if value is None:
+            return self.__negative_ttl
+        return self.__ttl.get(kind, 0.0)
+
+    @property
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """The hit, miss, eviction and expiration counters"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, kind: str, key: str) -> tuple[bool, Any]:
+        """Get a cached value
+
+        :param str kind: The kind of lookup
+        :param str key: The key of the lookup
+
+        :returns: A tuple with True and the value if the entry is cached,
+            otherwise a tuple with False and None
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, kind: str, key: str, value: Any, ttl: float | None = None) -> None:
+        """Cache a value
+
+        :param str kind: The kind of lookup
+        :param str key: The key of the lookup
+        :param value: The value, None if the player doesn't exist
+        :param float ttl: Override the time to live of the entry, in seconds
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self, kind: str, key: str) -> None:
+        """Remove an entry from the cache"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry from the cache"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def export(self) -> Iterator[CacheEntry]:
+        """Returns an iterator over the entries that are not expired"""
+        raise NotImplementedError
+
+    def warm(self, entries: Iterable[CacheEntry]) -> int:
+        """Add entries, for instance exported from another cache. The entries
+        keep their expiration date, the expired ones are skipped
+
+        :param entries: The entries to add
+
+        :returns: The number of entries added
+        """
+        now = time.time()
+        count = 0
+        for entry in entries:
+            if entry.expires_at > now:
+                self.set(entry.kind, entry.key, entry.value, entry.expires_at - now)
+                count += 1
+        return count
+
+
+class LookupCache(BaseCache):
+    """In-memory cache for the lookups of :mod:`mojang.api.base`. When the
+    cache is full, the least recently used entry is evicted.
+
+    The cache is thread-safe.
+
+    :param int maxsize: The maximum number of entries
+    :param dict ttl: The time to live of each kind, in seconds. Kinds that
+        are not given use :data:`DEFAULT_TTL`
+    :param float negative_ttl: The time to live of ``None`` values, in seconds
+
+    :Example:
+
+    >>> import mojang
+    >>> from mojang.api.cache import LookupCache, set_cache
+    >>> set_cache(LookupCache(maxsize=50_000, ttl={"profile": 60}))
+    >>> mojang.get_uuid("Notch")  # Request sent
+    '069a79f444e94726a5befca90e38aaf5'
+    >>> mojang.get_uuid("Notch")  # Cached
+    '069a79f444e94726a5befca90e38aaf5'
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: dict[str, float] | None = None,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(ttl, negative_ttl)
+        self.__maxsize = maxsize
+        self.__clock = clock
+
+        self.__lock = threading.Lock()
+        self.__entries: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__expirations = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    @property
+    def stats(self) -> CacheStats:
+        """The hit, miss, eviction and expiration counters"""
+        with self.__lock:
+            return CacheStats(
+                self.__hits, self.__misses, self.__evictions, self.__expirations
+            )
+
+    def get(self, kind: str, key: str) -> tuple[bool, Any]:
+        with self.__lock:
+            entry = self.__entries.get((kind, key))
+            if entry is not None and entry[0] <= self.__clock():
+                del self.__entries[(kind, key)]
+                self.__expirations += 1
+                entry = None
+
+            if entry is None:
+                self.__misses += 1
+                return False, None
+
+            self.__entries.move_to_end((kind, key))
+            self.__hits += 1
+            return True, entry[1]
+
+    def set(self, kind: str, key: str, value: Any, ttl: float | None = None) -> None:
+        if ttl is None:
+            ttl = self.ttl(kind, value)
+        if ttl <= 0 or self.__maxsize <= 0:
+            return
+
+        with self.__lock:
+            self.__entries[(kind, key)] = (self.__clock() + ttl, value)
+            self.__entries.move_to_end((kind, key))
+            while len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+                self.__evictions += 1
+
+    def invalidate(self, kind: str, key: str) -> None:
+        with self.__lock:
+            self.__entries.pop((kind, key), None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def export(self) -> Iterator[CacheEntry]:
+        with self.__lock:
+            now = self.__clock()
+            offset = time.time() - now
+            entries = [
+                CacheEntry(kind, key, value, expires_at + offset)
+                for (kind, key), (expires_at, value) in self.__entries.items()
+                if expires_at > now
+            ]
+        return iter(entries)
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+
+def _encode_value(value: Any) -> str:
+    if isinstance(value, UnauthenticatedProfile):
+        value = {
+            "name": value.name,
+            "uuid": value.uuid,
+            "is_legacy": value.is_legacy,
+            "is_demo": value.is_demo,
+            "skin": (
+                {"source": value.skin.source, "variant": value.skin.variant}
+                if value.skin is not None
+                else None
+            ),
+            "cape": {"source": value.cape.source} if value.cape is not None else None,
+        }
+    return json.dumps(value)
+
+
+def _decode_value(kind: str, data: str) -> Any:
+    value = json.loads(data)
+    if kind != "profile" or value is None:
+        return value
+
+    skin, cape = value["skin"], value["cape"]
+    return UnauthenticatedProfile(
+        name=value["name"],
+        uuid=value["uuid"],
+        is_legacy=value["is_legacy"],
+        is_demo=value["is_demo"],
+        skin=Skin(skin["source"], skin["variant"], load=False) if skin else None,
+        cape=Cape(cape["source"], load=False) if cape else None,
+    )
+
+
+class SQLiteLookupCache(BaseCache):
+    """Persistent cache for the lookups of :mod:`mojang.api.base`, stored in
+    a single SQLite file
+
+    The database uses the WAL journal mode, so multiple threads and processes
+    on the same host can read and write the cache at the same time, and a
+    restarted process can reuse the entries fetched before.
+
+    :param str path: The path of the database file
+    :param dict ttl: The time to live of each kind, in seconds. Kinds that
+        are not given use :data:`DEFAULT_TTL`
+    :param float negative_ttl: The time to live of ``None`` values, in seconds
+    :param float busy_timeout: How long to wait for a lock held by another
+        connection, in seconds
+
+    :Example:
+
+    >>> from mojang.api.cache import SQLiteLookupCache, set_cache
+    >>> set_cache(SQLiteLookupCache("/var/cache/pymojang.sqlite3"))
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        ttl: dict[str, float] | None = None,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        busy_timeout: float = 30.0,
+    ) -> None:
+        super().__init__(ttl, negative_ttl)
+        self.__path = os.fspath(path)
+        self.__busy_timeout = busy_timeout
+        self.__local = threading.local()
+
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__expirations = 0
+
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS lookups ("
+                " kind TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " PRIMARY KEY (kind, key)"
+                ") WITHOUT ROWID"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS lookups_expires_at ON lookups (expires_at)"
+            )
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def _connection(self) -> sqlite3.Connection:
+        # SQLite connections can't be shared between threads
+        conn = getattr(self.__local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.__path, timeout=self.__busy_timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.__local.conn = conn
+        return conn
+
+    @property
+    def stats(self) -> CacheStats:
+        with self.__lock:
+            return CacheStats(self.__hits, self.__misses, 0, self.__expirations)
+
+    def get(self, kind: str, key: str) -> tuple[bool, Any]:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value, expires_at FROM lookups WHERE kind = ? AND key = ?",
+                (kind, key),
+            )
+            .fetchone()
+        )
+
+        expired = row is not None and row[1] <= time.time()
+        with self.__lock:
+            if row is None or expired:
+                self.__misses += 1
+                self.__expirations += expired
+                return False, None
+            self.__hits += 1
+
+        return True, _decode_value(kind, row[0])
+
+    def set(self, kind: str, key: str, value: Any, ttl: float | None = None) -> None:
+        self.set_many(kind, [(key, value)], ttl)
+
+    def set_many(
+        self,
+        kind: str,
+        items: Iterable[tuple[str, Any]],
+        ttl: float | None = None,
+    ) -> None:
+        """Cache multiple values of the same kind in a single transaction
+
+        :param str kind: The kind of lookup
+        :param items: The ``(key, value)`` tuples to cache
+        :param float ttl: Override the time to live of the entries, in seconds
+        """
+        now = time.time()
+        rows = []
+        for key, value in items:
+            entry_ttl = self.ttl(kind, value) if ttl is None else ttl
+            if entry_ttl > 0:
+                rows.append((kind, key, _encode_value(value), now + entry_ttl))
+
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO lookups (kind, key, value, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def warm(self, entries: Iterable[CacheEntry]) -> int:
+        now = time.time()
+        rows = [
+            (entry.kind, entry.key, _encode_value(entry.value), entry.expires_at)
+            for entry in entries
+            if entry.expires_at > now
+        ]
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO lookups (kind, key, value, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def export(self) -> Iterator[CacheEntry]:
+        cursor = self._connection().execute(
+            "SELECT kind, key, value, expires_at FROM lookups WHERE expires_at > ?",
+            (time.time(),),
+        )
+        for kind, key, value, expires_at in cursor:
+            yield CacheEntry(kind, key, _decode_value(kind, value), expires_at)
+
+    def invalidate(self, kind: str, key: str) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM lookups WHERE kind = ? AND key = ?", (kind, key))
+
+    def clear(self) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM lookups")
+
+    def purge(self) -> int:
+        """Remove the expired entries from the database
+
+        :returns: The number of entries removed
+        """
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM lookups WHERE expires_at <= ?", (time.time(),)
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the connection of the current thread"""
+        conn = getattr(self.__local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self.__local.conn = None
+
+    def __len__(self) -> int:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT COUNT(*) FROM lookups WHERE expires_at > ?", (time.time(),)
+            )
+            .fetchone()
+        )
+        return int(row[0])
+
+
+_default_cache: BaseCache | None = None
+_scoped_cache: contextvars.ContextVar[BaseCache | None] = contextvars.ContextVar(
+    "mojang_cache", default=None
+)
+
+
+def get_cache() -> BaseCache | None:
+    """Returns the cache used by the lookups. This is the cache set with
+    :func:`use_cache` if any, otherwise the default one. The lookups are
+    not cached by default"""
+    cache = _scoped_cache.get()
+    if cache is not None:
+        return cache
+    return _default_cache
+
+
+def set_cache(cache: BaseCache | None) -> None:
+    """Set the default cache used by the lookups. If `cache` is None, the
+    lookups are not cached anymore
+
+    :param BaseCache cache: The new default cache
+    """
+    global _default_cache
+    _default_cache = cache
+
+
+@contextlib.contextmanager
+def use_cache(cache: BaseCache) -> Iterator[BaseCache]:
+    """Use `cache` for every lookup made in the current thread or task
+    until the end of the `with` block
+
+    :param BaseCache cache: The cache to use
+    """
+    token = _scoped_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _scoped_cache.reset(token)
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+import contextvars
 import inspect
 import json
-from typing import TYPE_CHECKING
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, TypeVar
 
-from mojang.exceptions import MethodNotAllowed, NotFound, ServerError
+from mojang.exceptions import (
+    MethodNotAllowed,
+    NotFound,
+    ServerError,
+    TooManyRequests,
+)
 
 if TYPE_CHECKING:
     import requests
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
 
 def get_headers(json_content: bool | None = False, bearer: str | None = None):
     headers = {}
@@ -25,7 +35,12 @@ def get_headers(json_content: bool | None = False, bearer: str | None = None):
 
 def err_check(response: requests.Response, *args, use_defaults: bool | None = True):
     if use_defaults:
-        args += ((404, NotFound), (405, MethodNotAllowed), (500, ServerError))
+        args += (
+            (404, NotFound),
+            (405, MethodNotAllowed),
+            (429, TooManyRequests),
+            (500, ServerError),
+        )
 
     status_code = response.status_code
     for codes, exception in args:
@@ -45,3 +60,42 @@ def err_check(response: requests.Response, *args, use_defaults: bool | None = Tr
         data = response.text
 
     return status_code, data
+
+
+def imap_unordered(
+    func: Callable[[_T], _R], items: Iterable[_T], max_workers: int = 8
+) -> Iterator[tuple[_T, _R]]:
+    """Call `func` on every item using a pool of threads, and yield
+    ``(item, result)`` tuples as soon as each call completes.
+
+    At most ``2 * max_workers`` items are consumed ahead of the results, so
+    `items` can be a large or lazy iterable. Each call runs in a copy of the
+    caller context, so a transport set with
+    :func:`~mojang.api.transport.use_transport` is used by the workers.
+    If a call raises, the pending calls are cancelled and the exception
+    is raised.
+    """
+    items = iter(items)
+    pending: dict[Future[_R], _T] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def _submit(n: int) -> None:
+            for item in items:
+                ctx = contextvars.copy_context()
+                pending[executor.submit(ctx.run, func, item)] = item
+                n -= 1
+                if n == 0:
+                    break
+
+        try:
+            _submit(2 * max_workers)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    yield item, future.result()
+                _submit(len(done))
+        finally:
+            for future in pending:
+                future.cancel()
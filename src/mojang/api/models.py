@@ -1,45 +1,112 @@
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
 import os
 import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterable, Iterator
 from urllib.parse import urlparse
 
-import requests
 import validators
 
+from mojang.api import helpers
+from mojang.api.textures import get_texture_store, texture_hash
+from mojang.api.transport import get_transport
+
 if TYPE_CHECKING:
+    import numpy as np
     from requests.structures import CaseInsensitiveDict
 
+DEFAULT_CHUNK_SIZE = 64 * 1024
+_EMPTY_DIGEST = hashlib.sha256(b"").hexdigest()
+
 
 class _Resource:
     """Base class for downloadable resources
 
+    The content is loaded lazily, the first time `data` or `extension`
+    is accessed, unless `load` is True.
+
+    :param str source: The source where the resource is located
+    :param bool load: If True, load the content right away
+    :param bool autoload: If False, the content is only loaded when
+        :meth:`load` is called, and `data` is empty until then
+
     :var str source: The source where the skin is located
     :var bytes data: Content of the resources in bytes
     :var str extension: The type of file, if detected
+    :var bool loaded: True if the content was loaded
+    :var str digest: The SHA-256 digest of the content, computed once
+        when it is loaded
     """
 
-    def __init__(self, source: str, load: bool = True) -> None:
+    __slots__ = (
+        "__array",
+        "__autoload",
+        "__data",
+        "__digest",
+        "__extension",
+        "__loaded",
+        "__source",
+    )
+
+    def __init__(self, source: str, load: bool = False, autoload: bool = True) -> None:
         self.__source = source
         self.__data = b""
+        self.__digest = _EMPTY_DIGEST
+        self.__array = None
         self.__extension = None
+        self.__loaded = False
+        self.__autoload = autoload
 
         if load is True:
             self.load()
 
+    def _ensure_loaded(self) -> None:
+        if not self.__loaded and self.__autoload:
+            self.load()
+
     @property
     def source(self) -> str:
         return self.__source
 
     @property
     def data(self) -> bytes:
+        self._ensure_loaded()
         return self.__data
 
     @property
     def extension(self) -> str | None:
+        if self.__extension is None:
+            self._ensure_loaded()
         return self.__extension
 
+    @property
+    def digest(self) -> str:
+        self._ensure_loaded()
+        return self.__digest
+
+    @property
+    def array(self) -> np.ndarray:
+        """The pixels of the image, as a read-only ``(H, W, 4)`` array of RGBA
+        values. The image is decoded once and the array is cached. Requires
+        the ``skins`` extra, for more details checkout
+        :py:mod:`mojang.skins.array`"""
+        if self.__array is None:
+            from mojang.skins.array import decode
+
+            self.__array = decode(self.data)
+        return self.__array
+
+    @property
+    def loaded(self) -> bool:
+        return self.__loaded
+
+    @property
+    def autoload(self) -> bool:
+        return self.__autoload
+
     @classmethod
     def _filename_from_url(cls, url: str):
         url_path = urlparse(url).path
@@ -65,45 +132,124 @@ class _Resource:
             return None
         return None
 
-    @classmethod
-    def _download_bytes(cls, url: str):
-        response = requests.get(url, timeout=10)
-        if response.ok:
-            filename = (
-                cls._filename_from_url(url)
-                or cls._filename_from_headers(response.headers)
-                or ["download", None]
-            )
-            return filename, response.content
-        return None
-
-    def load(self):
-        """Load data from the source"""
+    @contextlib.contextmanager
+    def _open_source(
+        self, chunk_size: int
+    ) -> Iterator[tuple[str | None, Iterable[bytes]]]:
+        # Yields the extension and an iterator over the chunks of the
+        # content, raises if the source can't be read
         if validators.url(self.source):
-            response = self._download_bytes(self.source)
-            if response:
-                self.__extension = response[0][1]
-                self.__data = response[1]
+            key = texture_hash(self.source)
+            store = get_texture_store() if key is not None else None
+            if store is not None:
+                fp = store.open(key)
+                if fp is not None:
+                    with fp:
+                        # The texture server only serves png images
+                        yield "png", iter(functools.partial(fp.read, chunk_size), b"")
+                    return
+
+            response = get_transport().get(self.source, stream=True)
+            try:
+                if not response.ok:
+                    helpers.err_check(response)
+                    response.raise_for_status()
+
+                filename = (
+                    self._filename_from_url(self.source)
+                    or self._filename_from_headers(response.headers)
+                    or ["download", None]
+                )
+                chunks = response.iter_content(chunk_size)
+                if store is not None:
+                    chunks = store.tee(key, chunks)
+                yield filename[1], chunks
+            finally:
+                response.close()
         elif os.path.exists(self.source):
             basename = os.path.basename(self.source)
-            self.__extension = os.path.splitext(basename)[1][1:]
-
             with open(self.source, "rb") as fp:
-                self.__data = fp.read()
+                yield (
+                    os.path.splitext(basename)[1][1:],
+                    iter(functools.partial(fp.read, chunk_size), b""),
+                )
         else:
-            pass  # TODO: Raise Exception
+            msg = f"the source {self.source!r} is not an url or a file"
+            raise FileNotFoundError(msg)
+
+    def _fill(self, extension: str | None, data: bytes, digest: str | None) -> None:
+        self.__extension = extension
+        self._set_data(data, digest)
+        self.__loaded = True
+
+    def _set_data(self, data: bytes, digest: str | None = None) -> None:
+        self.__data = data
+        self.__digest = digest or hashlib.sha256(data).hexdigest()
+        self.__array = None
 
-    def save(self, dest: str, add_extension: bool = True):
-        """Save resource in a file"""
+    def load(self):
+        """Load data from the source. If it fails, the resource stays
+        unloaded and the next access tries again
+
+        :raises FileNotFoundError: if the source is neither an url nor a file
+        :raises requests.HTTPError: if the source can't be downloaded
+        """
+        with self._open_source(DEFAULT_CHUNK_SIZE) as (extension, chunks):
+            data = b"".join(chunks)
+        self.__extension = extension
+        self._set_data(data)
+        self.__loaded = True
+
+    def save(
+        self,
+        dest: str | BinaryIO,
+        add_extension: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """Save resource in a file
+
+        If the content was not loaded yet, it is streamed from the source to
+        `dest` in chunks, without being kept in memory.
+
+        :param dest: The path of the file, or a binary file object
+        :param bool add_extension: If True and `dest` is a path without
+            extension, add the extension of the resource
+        :param int chunk_size: The size of the chunks written, in bytes
+
+        :returns: The path of the file, or `dest` if it is a file object
+        """
+        if self.__loaded:
+            return self._write(dest, self.__extension, [self.__data], add_extension)
+
+        with self._open_source(chunk_size) as (extension, chunks):
+            if extension is not None:
+                self.__extension = extension
+            return self._write(dest, extension, chunks, add_extension)
+
+    @classmethod
+    def _write(
+        cls,
+        dest: str | BinaryIO,
+        extension: str | None,
+        chunks: Iterable[bytes],
+        add_extension: bool,
+    ):
+        if not isinstance(dest, (str, os.PathLike)):
+            for chunk in chunks:
+                dest.write(chunk)
+            return dest
+
+        dest = os.fspath(dest)
         if (
             len(os.path.splitext(dest)[1]) == 0
-            and self.__extension is not None
+            and extension is not None
             and add_extension is True
         ):
-            dest += "." + self.__extension
+            dest += "." + extension
 
         with open(dest, "wb") as fp:
-            fp.write(self.__data)
+            for chunk in chunks:
+                fp.write(chunk)
 
         return dest
 
@@ -115,15 +261,18 @@ class Skin(_Resource):
     :var str state: The state of the skin
     """
 
+    __slots__ = ("__id", "__state", "__variant")
+
     def __init__(
         self,
         source: str,
         variant: str,
         id: str | None = None,  # noqa: A002
         state: str | None = None,
-        load: bool = True,
+        load: bool = False,
+        autoload: bool = True,
     ) -> None:
-        super().__init__(source, load=load)
+        super().__init__(source, load=load, autoload=autoload)
         self.__variant = variant
         self.__id = id
         self.__state = state
@@ -140,12 +289,26 @@ class Skin(_Resource):
     def state(self) -> str | None:
         return self.__state
 
+    def normalize(self) -> Skin:
+        """Returns a copy of the skin with normalized pixels, encoded as a PNG
+        image. Legacy 64x32 skins are converted to 64x64 skins. Requires the
+        ``skins`` extra, for more details checkout
+        :py:func:`mojang.skins.convert.normalize`"""
+        from mojang.skins.convert import encode, normalize
+
+        skin = Skin(self.source, self.variant, self.id, self.state, autoload=False)
+        skin._fill("png", encode(normalize(self)), None)
+        return skin
+
+    def _key(self) -> tuple:
+        return (self.source, self.id, self.state, self.variant, self.digest)
+
     def __hash__(self) -> int:
-        return hash((self.source, self.id, self.state, self.variant, self.data))
+        return hash(self._key())
 
     def __eq__(self, o: object) -> bool:
         if isinstance(o, Skin):
-            return hash(self) == hash(o)
+            return self._key() == o._key()
 
         return False
 
@@ -161,14 +324,17 @@ class Cape(_Resource):
     :var str state: The state of the cape
     """
 
+    __slots__ = ("__id", "__state")
+
     def __init__(
         self,
         source: str,
         id: str | None = None,  # noqa: A002
         state: str | None = None,
-        load: bool = True,
+        load: bool = False,
+        autoload: bool = True,
     ) -> None:
-        super().__init__(source, load=load)
+        super().__init__(source, load=load, autoload=autoload)
         self.__id = id
         self.__state = state
 
@@ -180,12 +346,15 @@ class Cape(_Resource):
     def state(self) -> str | None:
         return self.__state
 
+    def _key(self) -> tuple:
+        return (self.source, self.id, self.state, self.digest)
+
     def __hash__(self) -> int:
-        return hash((self.source, self.id, self.state, self.data))
+        return hash(self._key())
 
     def __eq__(self, o: object) -> bool:
         if isinstance(o, Cape):
-            return hash(self) == hash(o)
+            return self._key() == o._key()
 
         return False
 
@@ -193,3 +362,63 @@ class Cape(_Resource):
         return f"Cape(source='{self.source}', id='{self.id}', state='{self.state}')"
 
     __str__ = __repr__
+
+
+def _iter_resources(items: Iterable[Any]) -> Iterator[_Resource]:
+    for item in items:
+        if item is None:
+            continue
+        if isinstance(item, _Resource):
+            yield item
+            continue
+
+        # Profiles, either with a single skin and cape or with lists of them
+        for attr in ("skin", "cape"):
+            resource = getattr(item, attr, None)
+            if resource is not None:
+                yield resource
+        for attr in ("skins", "capes"):
+            yield from getattr(item, attr, None) or []
+
+
+def prefetch_textures(items: Iterable[Any], max_workers: int = 8) -> int:
+    """Load the skins and capes that are not loaded yet, concurrently
+
+    Each url is only downloaded once, the resources sharing a url are all
+    filled with the same content. The resources whose url can't be
+    downloaded stay unloaded, and are downloaded again on first access.
+    The downloads go through the texture store set with
+    :py:func:`~mojang.api.textures.set_texture_store` if any.
+
+    :param list items: The skins, capes or profiles to load
+    :param int max_workers: The number of downloads made concurrently
+
+    :returns: The number of distinct urls loaded
+
+    :Example:
+
+    >>> import mojang
+    >>> profiles = mojang.get_profiles(uuids)
+    >>> mojang.prefetch_textures(profiles.values(), max_workers=16)
+    42
+    """
+    groups: dict[str, list[_Resource]] = {}
+    for resource in _iter_resources(items):
+        if not resource.loaded:
+            groups.setdefault(resource.source, []).append(resource)
+
+    def _load(resources: list[_Resource]) -> bool:
+        first = resources[0]
+        try:
+            first.load()
+        except Exception:  # noqa: BLE001
+            return False
+
+        for resource in resources[1:]:
+            resource._fill(first.extension, first.data, first.digest)
+        return True
+
+    return sum(
+        loaded
+        for _, loaded in helpers.imap_unordered(_load, groups.values(), max_workers)
+    )
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import datetime as dt
+import email.utils
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Tuple, Union
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    from typing import Iterator, Mapping
+
+#: A rate limit, either a number of requests per second or a tuple
+#: with the number of requests per second and the burst size
+RateLimit = Union[float, Tuple[float, int]]
+
+#: The documented rate limits of the Mojang APIs, 600 requests per 10 minutes
+MOJANG_RATE_LIMITS: dict[str, RateLimit] = {
+    "api.mojang.com": (1.0, 60),
+    "sessionserver.mojang.com": (1.0, 60),
+    "api.minecraftservices.com": (1.0, 60),
+}
+
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_BACKOFF = 0.25
+DEFAULT_MAX_RETRY_AFTER = 60.0
+
+
+class RateLimiter:
+    """Token bucket rate limiter
+
+    Each request takes one token from the bucket, which is refilled at
+    `rate` tokens per second up to `burst` tokens. When the bucket is empty,
+    callers are queued and wait for their turn instead of failing.
+
+    The limiter is thread-safe and can be shared between threads.
+
+    :param float rate: The number of requests allowed per second, if None
+        the requests are only delayed when the limiter is paused
+    :param int burst: The maximum number of requests that can be sent at once
+        (default to one second worth of requests)
+
+    :Example:
+
+    >>> import mojang
+    >>> from mojang.api.ratelimit import RateLimiter
+    >>> limiter = RateLimiter(rate=10)
+    >>> mojang.get_uuids(usernames, max_workers=8, limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: float | None,
+        burst: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate is not None and rate <= 0:
+            msg = "rate must be greater than 0"
+            raise ValueError(msg)
+
+        self.__rate = rate
+        self.__capacity = float(burst if burst is not None else max(1, int(rate or 1)))
+        self.__clock = clock
+        self.__sleep = sleep
+
+        self.__lock = threading.Lock()
+        self.__tokens = self.__capacity
+        self.__updated_at = clock()
+        self.__paused_until = 0.0
+        self.__waiting = 0
+
+    @property
+    def rate(self) -> float | None:
+        return self.__rate
+
+    @property
+    def burst(self) -> int:
+        return int(self.__capacity)
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of callers waiting for a token"""
+        return self.__waiting
+
+    def _refill(self) -> None:
+        now = self.__clock()
+        if self.__rate is not None:
+            elapsed = max(0.0, now - self.__updated_at)
+            self.__tokens = min(self.__capacity, self.__tokens + elapsed * self.__rate)
+        self.__updated_at = now
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available, without waiting
+
+        :returns: True if a token was taken
+        """
+        with self.__lock:
+            self._refill()
+            if self.__paused_until > self.__updated_at:
+                return False
+            if self.__rate is None:
+                return True
+            if self.__tokens >= 1:
+                self.__tokens -= 1
+                return True
+            return False
+
+    def reserve(self) -> float:
+        """Take a token without waiting for it
+
+        :returns: The time the caller must wait before sending its request,
+            in seconds
+        """
+        with self.__lock:
+            self._refill()
+            delay = 0.0
+            if self.__rate is not None:
+                # Reserve the token right away, the bucket goes negative
+                # when callers are waiting so they are served in order
+                self.__tokens -= 1
+                if self.__tokens < 0:
+                    delay = -self.__tokens / self.__rate
+            return max(delay, self.__paused_until - self.__updated_at)
+
+    @contextlib.contextmanager
+    def _waiting(self) -> Iterator[None]:
+        with self.__lock:
+            self.__waiting += 1
+        try:
+            yield
+        finally:
+            with self.__lock:
+                self.__waiting -= 1
+
+    def acquire(self) -> float:
+        """Take a token, waiting until one is available
+
+        :returns: The time waited, in seconds
+        """
+        delay = self.reserve()
+        if delay > 0:
+            with self._waiting():
+                self.__sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        """Take a token, waiting until one is available without blocking
+        the event loop
+
+        :returns: The time waited, in seconds
+        """
+        delay = self.reserve()
+        if delay > 0:
+            with self._waiting():
+                await asyncio.sleep(delay)
+        return delay
+
+    def pause(self, delay: float) -> None:
+        """Hold every request for `delay` seconds, for instance after
+        the server answered with a ``Retry-After`` header
+
+        :param float delay: The time to wait, in seconds
+        """
+        with self.__lock:
+            self.__paused_until = max(self.__paused_until, self.__clock() + delay)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    now = dt.datetime.now(date.tzinfo or dt.timezone.utc)
+    return max(0.0, (date - now).total_seconds())
+
+
+class HostRateLimiter:
+    """Rate limiter with one :class:`RateLimiter` per host, used by the
+    transports to schedule every request
+
+    When a server answers with the status code 429, the host is paused for
+    the time given by the ``Retry-After`` header (or an exponential backoff
+    when there is none), and the request is sent again. The callers of the
+    same host are queued until the pause is over.
+
+    :param dict limits: The rate limit of each host (default to
+        :data:`MOJANG_RATE_LIMITS`). Hosts without a limit are not throttled
+        until they answer with a 429, pass an empty dict to only throttle
+        the hosts after a 429
+    :param int max_retries: The number of times a request is retried after
+        a 429 response
+    :param float backoff: The base delay of the exponential backoff used when
+        a 429 response has no ``Retry-After`` header, in seconds
+    :param float max_retry_after: The maximum time to wait before retrying.
+        When the server asks to wait longer, the 429 response is returned
+
+    :Example:
+
+    >>> from mojang.api.ratelimit import HostRateLimiter
+    >>> from mojang.api.transport import Transport, set_transport
+    >>> limiter = HostRateLimiter(max_retries=3)
+    >>> set_transport(Transport(limiter=limiter))
+    >>> limiter.queue_depth("api.mojang.com")
+    0
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, RateLimit] | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        max_retry_after: float = DEFAULT_MAX_RETRY_AFTER,
+    ) -> None:
+        self.__limits = dict(MOJANG_RATE_LIMITS if limits is None else limits)
+        self.__max_retries = max_retries
+        self.__backoff = backoff
+        self.__max_retry_after = max_retry_after
+
+        self.__lock = threading.Lock()
+        self.__limiters: dict[str, RateLimiter] = {}
+
+    @property
+    def max_retries(self) -> int:
+        return self.__max_retries
+
+    @classmethod
+    def _host(cls, url: str) -> str:
+        return (urlparse(url).hostname or "").lower()
+
+    def limiter(self, host: str) -> RateLimiter:
+        """Returns the limiter of a host
+
+        :param str host: The host name, or an url
+        """
+        host = self._host(host) if "/" in host else host.lower()
+        limiter = self.__limiters.get(host)
+        if limiter is None:
+            with self.__lock:
+                limiter = self.__limiters.get(host)
+                if limiter is None:
+                    limit = self.__limits.get(host)
+                    if isinstance(limit, tuple):
+                        limiter = RateLimiter(limit[0], limit[1])
+                    else:
+                        limiter = RateLimiter(limit)
+                    self.__limiters[host] = limiter
+        return limiter
+
+    def queue_depth(self, host: str | None = None) -> int:
+        """Returns the number of requests waiting to be sent
+
+        :param str host: Only count the requests of this host
+        """
+        if host is not None:
+            return self.limiter(host).queue_depth
+        return sum(limiter.queue_depth for limiter in list(self.__limiters.values()))
+
+    def queue_depths(self) -> dict[str, int]:
+        """Returns the number of requests waiting to be sent for each host"""
+        return {
+            host: limiter.queue_depth for host, limiter in list(self.__limiters.items())
+        }
+
+    def retry_delay(
+        self,
+        url: str,
+        attempt: int,
+        headers: Mapping[str, str],
+    ) -> float | None:
+        """Called when a request was rate limited. Pause the host and returns
+        the time to wait before retrying, or None if the request must not
+        be retried
+
+        :param str url: The url of the request
+        :param int attempt: The number of retries already done
+        :param headers: The headers of the 429 response
+        """
+        if attempt >= self.__max_retries:
+            return None
+
+        delay = _parse_retry_after(headers.get("retry-after"))
+        if delay is None:
+            delay = self.__backoff * (2**attempt)
+        if delay > self.__max_retry_after:
+            return None
+
+        self.limiter(url).pause(delay)
+        return delay
@@ -1,20 +1,474 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
+import io
+import mmap
+import uuid
+from typing import TYPE_CHECKING, Any, BinaryIO, Union
 
 import jwt
-import requests
+import validators
 
 from mojang.api import helpers, urls
-from mojang.api.models import Cape, Skin
+from mojang.api.models import DEFAULT_CHUNK_SIZE, Cape, Skin
 from mojang.api.structures import AuthenticatedUserProfile, NameChange
+from mojang.api.transport import Transport, get_transport
 from mojang.exceptions import (
     InvalidName,
     NotCapeOwner,
+    TooManyRequests,
     Unauthorized,
     UnavailableName,
 )
 
+if TYPE_CHECKING:
+    from requests import Response
+    from typing_extensions import Self
+
+#: The sources accepted for a skin upload: a local path or an url, the
+#: content of the image, or a binary file object
+SkinSource = Union[str, bytes, bytearray, memoryview, BinaryIO]
+
+
+def _as_bytes_view(source: Any) -> memoryview:
+    # Buffers like bytes, memoryview or mmap are sliced without copy, only
+    # the non contiguous ones are copied
+    try:
+        view = memoryview(source)
+    except TypeError:
+        msg = f"unsupported skin source: {type(source).__name__}"
+        raise TypeError(msg) from None
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+    return view.cast("B")
+
+
+class _SkinUpload:
+    """Multipart body of a skin upload
+
+    The content of the skin is not copied in the body: the transport reads
+    the body in chunks, and the chunks are slices of the buffer of the skin
+    or are read from its file. The body can be rewound, to be sent again.
+    """
+
+    def __init__(self, source: SkinSource, variant: str) -> None:
+        self.__file: BinaryIO | None = None
+        self.__start = 0
+        self.__owned = False
+
+        if isinstance(source, str):
+            if validators.url(source):
+                source = Skin(source=source, variant=variant).data
+            else:
+                source = open(source, "rb")  # noqa: SIM115
+                self.__owned = True
+
+        # mmap objects have a file interface, but are sliced like buffers
+        if hasattr(source, "read") and not isinstance(source, mmap.mmap):
+            self.__content = None
+            self.__file = source
+            self.__start = source.tell()
+            size = source.seek(0, io.SEEK_END) - self.__start
+            source.seek(self.__start)
+        else:
+            self.__content = _as_bytes_view(source)
+            size = len(self.__content)
+
+        boundary = uuid.uuid4().hex
+        self.__content_type = f"multipart/form-data; boundary={boundary}"
+        self.__head = memoryview(
+            (
+                f"--{boundary}\r\n"
+                'Content-Disposition: form-data; name="variant"\r\n\r\n'
+                f"{variant}\r\n"
+                f"--{boundary}\r\n"
+                'Content-Disposition: form-data; name="file"; filename="image.png"\r\n'
+                "Content-Type: image/png\r\n\r\n"
+            ).encode()
+        )
+        self.__tail = memoryview(f"\r\n--{boundary}--\r\n".encode())
+        self.__length = len(self.__head) + size + len(self.__tail)
+        self.__content_hash: str | None = None
+        self.seek(0)
+
+    @property
+    def content_type(self) -> str:
+        return self.__content_type
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def content_hash(self) -> str:
+        """Returns the digest of the pixels of the skin, like
+        :py:func:`~mojang.skins.fingerprint.content_hash`. Requires the
+        ``skins`` extra"""
+        from mojang.skins.fingerprint import content_hash
+
+        if self.__content_hash is None:
+            if self.__content is not None:
+                data = self.__content
+            else:
+                self.__file.seek(self.__start)
+                data = self.__file.read()
+                self.__file.seek(self.__start)
+            self.__content_hash = content_hash(data)
+        return self.__content_hash
+
+    def tell(self) -> int:
+        return self.__position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if offset != 0 or whence != io.SEEK_SET:
+            msg = "the body can only be rewound"
+            raise io.UnsupportedOperation(msg)
+
+        self.__part = 0
+        self.__offset = 0
+        self.__position = 0
+        if self.__file is not None:
+            self.__file.seek(self.__start)
+        return 0
+
+    def read(self, size: int = -1) -> bytes | memoryview:
+        if size is None or size < 0:
+            return b"".join(iter(functools.partial(self.read, DEFAULT_CHUNK_SIZE), b""))
+
+        content = self.__content if self.__content is not None else self.__file
+        parts = (self.__head, content, self.__tail)
+        while self.__part < len(parts):
+            part = parts[self.__part]
+            if isinstance(part, memoryview):
+                chunk = part[self.__offset : self.__offset + size]
+                self.__offset += len(chunk)
+            else:
+                chunk = part.read(size)
+
+            if len(chunk) > 0:
+                self.__position += len(chunk)
+                return chunk
+
+            self.__part += 1
+            self.__offset = 0
+
+        return b""
+
+    def close(self) -> None:
+        if self.__owned and self.__file is not None:
+            self.__file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+def _is_active_skin(active: Skin | None, upload: _SkinUpload, variant: str) -> bool:
+    # The texture server serves the skin encoded again, so the pixels are
+    # compared instead of the files
+    if active is None or active.variant.lower() != variant.lower():
+        return False
+
+    from mojang.skins.fingerprint import content_hash
+
+    return content_hash(active) == upload.content_hash()
+
+
+def _parse_product_voucher(response: Response) -> bool:
+    code, data = helpers.err_check(response, (401, Unauthorized), use_defaults=False)
+
+    if code == 404 and "errorMessage" not in data:
+        msg = "Invalid voucher"
+        raise ValueError(msg)
+
+    return code == 200
+
+
+def _parse_check_username(response: Response) -> bool:
+    _, data = helpers.err_check(response, (401, Unauthorized), (429, TooManyRequests))
+
+    return data["status"] == "AVAILABLE"
+
+
+def _parse_user_name_change(response: Response) -> NameChange:
+    _, data = helpers.err_check(response, (400, ValueError), (401, Unauthorized))
+
+    data["created_at"] = dt.datetime.fromisoformat(
+        data.pop("createdAt").replace("Z", "+00:00")
+    )
+
+    data["allowed"] = data.pop("nameChangeAllowed")
+
+    return NameChange(allowed=data["allowed"], created_at=data["created_at"])
+
+
+def _parse_change_user_name(response: Response) -> bool:
+    code, _ = helpers.err_check(
+        response,
+        (400, InvalidName),
+        (403, UnavailableName),
+        (401, Unauthorized),
+    )
+    return code == 200
+
+
+def _parse_change_user_skin(response: Response) -> bool:
+    code, _ = helpers.err_check(response, (400, ValueError), (401, Unauthorized))
+    return code in (200, 204)
+
+
+def _parse_reset_user_skin(response: Response) -> bool:
+    code, _ = helpers.err_check(response, (400, ValueError), (401, Unauthorized))
+    return code == 200
+
+
+def _parse_show_user_cape(response: Response) -> bool:
+    code, _ = helpers.err_check(response, (400, NotCapeOwner), (401, Unauthorized))
+    return code == 200
+
+
+def _parse_hide_user_cape(response: Response) -> bool:
+    code, _ = helpers.err_check(response, (401, Unauthorized))
+    return code == 200
+
+
+def _parse_owns_minecraft(
+    response: Response, verify_sig: bool = False, public_key: str | None = None
+) -> bool:
+    _, data = helpers.err_check(response, (401, Unauthorized))
+
+    if verify_sig is True:
+        for i in data.get("items", []):
+            jwt.decode(i["signature"], public_key, algorithms=["RS256"])
+
+        jwt.decode(data["signature"], public_key, algorithms=["RS256"])
+
+    return len(data["items"]) != 0
+
+
+def _parse_profile(
+    response: Response, load_textures: bool = True
+) -> AuthenticatedUserProfile:
+    _, data = helpers.err_check(response, (401, Unauthorized))
+    return _profile_from_data(data, load_textures)
+
+
+def _parse_mutation_profile(
+    response: Response, load_textures: bool = True
+) -> AuthenticatedUserProfile | None:
+    # Most mutations answer with the updated profile, the others answer
+    # without content
+    try:
+        data = response.json()
+    except ValueError:
+        return None
+
+    if not isinstance(data, dict) or "skins" not in data:
+        return None
+    return _profile_from_data(data, load_textures)
+
+
+def _profile_from_data(
+    data: dict, load_textures: bool = True
+) -> AuthenticatedUserProfile:
+    skins = [
+        Skin(
+            item["url"],
+            item["variant"],
+            id=item["id"],
+            state=item["state"],
+            autoload=load_textures,
+        )
+        for item in data["skins"]
+    ]
+
+    capes = [
+        Cape(
+            item["url"],
+            id=item["id"],
+            state=item["state"],
+            autoload=load_textures,
+        )
+        for item in data.get("capes", [])
+    ]
+
+    return AuthenticatedUserProfile(
+        name=data["name"],
+        uuid=data["id"],
+        is_legacy=False,
+        is_demo=False,
+        skins=skins,
+        capes=capes,
+    )
+
+
+class SessionClient:
+    """Client of the session endpoints, bound to an access token
+
+    The headers are built once, and the requests share the connections of
+    one transport, so the connection to the API is reused between calls.
+    The functions of this module use a client with the current transport.
+
+    :param str access_token: The session access token
+    :param Transport transport: The transport of the requests. By default,
+        the client has its own pool, closed with :meth:`close`
+
+    :Example:
+
+    >>> from mojang.api.session import SessionClient
+    >>> with SessionClient("ACCESS_TOKEN") as client:
+    ...     client.get_profile()
+    ...     client.check_username("Notch")
+    """
+
+    def __init__(self, access_token: str, transport: Transport | None = None) -> None:
+        self.__owned = transport is None
+        self.__transport = (
+            transport if transport is not None else Transport(pool_connections=1)
+        )
+        self.access_token = access_token
+
+    @property
+    def access_token(self) -> str:
+        return self.__access_token
+
+    @access_token.setter
+    def access_token(self, access_token: str) -> None:
+        # The headers are replaced at once, the requests already sent keep
+        # the previous token
+        self.__access_token = access_token
+        self.__headers = helpers.get_headers(bearer=access_token)
+
+    @property
+    def transport(self) -> Transport:
+        return self.__transport
+
+    def check_product_voucher(self, voucher: str) -> bool:
+        """Check if a voucher is available. For more details checkout
+        :py:func:`check_product_voucher`"""
+        response = self.__transport.get(
+            urls.api_session_product_voucher(voucher), headers=self.__headers
+        )
+        return _parse_product_voucher(response)
+
+    def redeem_product_voucher(self, voucher: str) -> bool:
+        """Redeem a product voucher gift code. For more details checkout
+        :py:func:`redeem_product_voucher`"""
+        response = self.__transport.put(
+            urls.api_session_product_voucher(voucher), headers=self.__headers
+        )
+        return _parse_product_voucher(response)
+
+    def check_username(self, username: str) -> bool:
+        """Check if username is available. For more details checkout
+        :py:func:`check_username`"""
+        response = self.__transport.get(
+            urls.api_session_check_username(username), headers=self.__headers
+        )
+        return _parse_check_username(response)
+
+    def get_user_name_change(self) -> NameChange:
+        """Return if user can change name and when it was created. For more
+        details checkout :py:func:`get_user_name_change`"""
+        response = self.__transport.get(
+            urls.api_session_name_change, headers=self.__headers
+        )
+        return _parse_user_name_change(response)
+
+    def _send_change_name(self, name: str) -> Response:
+        return self.__transport.put(
+            urls.api_session_change_name(name), headers=self.__headers
+        )
+
+    def change_user_name(self, name: str) -> bool:
+        """Change name of authenticated user. For more details checkout
+        :py:func:`change_user_name`"""
+        return _parse_change_user_name(self._send_change_name(name))
+
+    def _send_skin(self, upload: _SkinUpload) -> Response:
+        headers = {**self.__headers, "content-type": upload.content_type}
+        return self.__transport.post(
+            urls.api_session_change_skin, headers=headers, data=upload
+        )
+
+    def change_user_skin(
+        self,
+        path: SkinSource,
+        variant: str = "classic",
+        skip_unchanged: bool = False,
+    ) -> bool:
+        """Change skin of authenticated user. For more details checkout
+        :py:func:`change_user_skin`"""
+        with _SkinUpload(path, variant) as upload:
+            if skip_unchanged:
+                profile = self.get_profile()
+                active = next((s for s in profile.skins if s.state == "ACTIVE"), None)
+                if _is_active_skin(active, upload, variant):
+                    return False
+
+            return _parse_change_user_skin(self._send_skin(upload))
+
+    def _send_reset_skin(self) -> Response:
+        return self.__transport.delete(
+            urls.api_session_reset_skin, headers=self.__headers
+        )
+
+    def reset_user_skin(self) -> bool:
+        """Reset skin of authenticated user. For more details checkout
+        :py:func:`reset_user_skin`"""
+        return _parse_reset_user_skin(self._send_reset_skin())
+
+    def _send_show_cape(self, cape_id: str) -> Response:
+        return self.__transport.put(
+            urls.api_session_cape_visibility,
+            headers=self.__headers,
+            json={"capeId": cape_id},
+        )
+
+    def show_user_cape(self, cape_id: str) -> bool:
+        """Show user cape. For more details checkout :py:func:`show_user_cape`"""
+        return _parse_show_user_cape(self._send_show_cape(cape_id))
+
+    def _send_hide_cape(self) -> Response:
+        return self.__transport.delete(
+            urls.api_session_cape_visibility, headers=self.__headers
+        )
+
+    def hide_user_cape(self) -> bool:
+        """Hide user cape. For more details checkout :py:func:`hide_user_cape`"""
+        return _parse_hide_user_cape(self._send_hide_cape())
+
+    def owns_minecraft(
+        self, verify_sig: bool = False, public_key: str | None = None
+    ) -> bool:
+        """Returns True if the authenticated user owns minecraft. For more
+        details checkout :py:func:`owns_minecraft`"""
+        response = self.__transport.get(
+            urls.api_session_ownership, headers=self.__headers
+        )
+        return _parse_owns_minecraft(response, verify_sig, public_key)
+
+    def get_profile(self, load_textures: bool = True) -> AuthenticatedUserProfile:
+        """Returns the full profile of a authenticated user. For more details
+        checkout :py:func:`get_profile`"""
+        response = self.__transport.get(
+            urls.api_session_profile, headers=self.__headers
+        )
+        return _parse_profile(response, load_textures)
+
+    def close(self) -> None:
+        """Close the transport of the client, if it was created by the
+        client"""
+        if self.__owned:
+            self.__transport.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
 
 def check_product_voucher(access_token: str, voucher: str) -> bool:
     """Check if a voucher is available.
@@ -31,17 +485,7 @@ def check_product_voucher(access_token: str, voucher: str) -> bool:
     >>> session.check_product_voucher("ACCESS_TOKEN", "JHRD2-HWGTY-WP3MW-QR4MC-CGGHZ")
     True
     """
-    headers = helpers.get_headers(bearer=access_token)
-    response = requests.get(
-        urls.api_session_product_voucher(voucher), headers=headers, timeout=10
-    )
-    code, data = helpers.err_check(response, (401, Unauthorized), use_defaults=False)
-
-    if code == 404 and "errorMessage" not in data:  # noqa: PLR2004
-        msg = "Invalid voucher"
-        raise ValueError(msg)
-
-    return code == 200  # noqa: PLR2004
+    return SessionClient(access_token, get_transport()).check_product_voucher(voucher)
 
 
 def redeem_product_voucher(access_token: str, voucher: str) -> bool:
@@ -60,17 +504,7 @@ def redeem_product_voucher(access_token: str, voucher: str) -> bool:
     >>> session.redeem_product_voucher("ACCESS_TOKEN", "JHRD2-HWGTY-WP3MW-QR4MC-CGGHZ")
     True
     """
-    headers = helpers.get_headers(bearer=access_token)
-    response = requests.put(
-        urls.api_session_product_voucher(voucher), headers=headers, timeout=10
-    )
-    code, data = helpers.err_check(response, (401, Unauthorized), use_defaults=False)
-
-    if code == 404 and "errorMessage" not in data:  # noqa: PLR2004
-        msg = "Invalid voucher"
-        raise ValueError(msg)
-
-    return code == 200  # noqa: PLR2004
+    return SessionClient(access_token, get_transport()).redeem_product_voucher(voucher)
 
 
 def check_username(access_token: str, username: str) -> bool:
@@ -78,24 +512,16 @@ def check_username(access_token: str, username: str) -> bool:
 
     .. caution::
 
-        This endpoint is limited, the function will return a RuntimeError if
-        you sent too many requests.
+        This endpoint is limited, the request is retried when the server asks
+        to wait, and a TooManyRequests error is raised if it is still limited.
 
     :param str access_token: The session access token
     :param str username: The username you want to checkt
 
     :raises Unauthorized: if the access token is invalid
-    :raises RuntimeError: if you sent to many requests
+    :raises TooManyRequests: if you sent to many requests
     """
-    headers = helpers.get_headers(bearer=access_token)
-    response = requests.get(
-        urls.api_session_check_username(username), headers=headers, timeout=10
-    )
-    code, data = helpers.err_check(
-        response, (401, Unauthorized), (429, RuntimeError("Limited Endpoint"))
-    )
-
-    return data["status"] == "AVAILABLE"
+    return SessionClient(access_token, get_transport()).check_username(username)
 
 
 def get_user_name_change(access_token: str) -> NameChange:
@@ -111,17 +537,7 @@ def get_user_name_change(access_token: str) -> NameChange:
     >>> session.get_username_change("ACCESS_TOKEN")
     NameChange(allowed=True, created_at=datetime.datetime(2006, 4, 29, 10, 10, 10))
     """
-    headers = helpers.get_headers(bearer=access_token)
-    response = requests.get(urls.api_session_name_change, headers=headers, timeout=10)
-    _, data = helpers.err_check(response, (400, ValueError), (401, Unauthorized))
-
-    data["created_at"] = dt.datetime.fromisoformat(
-        data.pop("createdAt").replace("Z", "+00:00")
-    )
-
-    data["allowed"] = data.pop("nameChangeAllowed")
-
-    return NameChange(allowed=data["allowed"], created_at=data["created_at"])
+    return SessionClient(access_token, get_transport()).get_user_name_change()
 
 
 def change_user_name(access_token: str, name: str):
@@ -139,45 +555,43 @@ def change_user_name(access_token: str, name: str):
     >>> from mojang.account import session
     >>> session.change_user_name("ACCESS_NAME", "NEW_NAME")
     """
-    headers = helpers.get_headers(bearer=access_token)
-    response = requests.put(
-        urls.api_session_change_name(name), headers=headers, timeout=10
-    )
-    code, _ = helpers.err_check(
-        response,
-        (400, InvalidName),
-        (403, UnavailableName),
-        (401, Unauthorized),
-    )
-    return code == 200  # noqa: PLR2004
+    return SessionClient(access_token, get_transport()).change_user_name(name)
 
 
-def change_user_skin(access_token: str, path: str, variant="classic"):
+def change_user_skin(
+    access_token: str,
+    path: SkinSource,
+    variant: str = "classic",
+    skip_unchanged: bool = False,
+) -> bool:
     """Change skin of authenticated user
 
+    The skin is streamed in the body of the request: the content of a file
+    or a buffer (``bytes``, ``memoryview``, ``mmap``, ...) is not copied
+    in memory. Only a remote skin is downloaded first.
+
     :param str access_token: The session access token
-    :param str path: The the path to the new skin, either local or remote
-    :parama str variant: The skin variant, either `classic` or `slim`
+    :param path: The new skin: a local path or an url, the content of the
+        image, or a binary file object, read from its current position
+    :param str variant: The skin variant, either `classic` or `slim`
+    :param bool skip_unchanged: If True, the profile is fetched and the
+        skin is only uploaded if its pixels or its variant are not the ones
+        of the active skin. Requires the ``skins`` extra
 
     :raises Unauthorized: if the access token is invalid
 
+    :returns: True if the skin was changed, False if it was skipped
+
     :Example:
 
     >>> from mojang.account import session
     >>> session.change_user_skin("ACCESS_TOKEN", "http://...")
+    >>> with open("skin.png", "rb") as fp:
+    ...     session.change_user_skin("ACCESS_TOKEN", fp, skip_unchanged=True)
     """
-    skin = Skin(source=path, variant=variant)
-    files = {
-        "variant": (None, skin.variant),
-        "file": ("image.png", skin.data, "image/png"),
-    }
-    headers = helpers.get_headers(bearer=access_token)
-    headers["content-type"] = None
-    response = requests.post(
-        urls.api_session_change_skin, headers=headers, files=files, timeout=10
+    return SessionClient(access_token, get_transport()).change_user_skin(
+        path, variant, skip_unchanged
     )
-    code, _ = helpers.err_check(response, (400, ValueError), (401, Unauthorized))
-    return code == 204  # noqa: PLR2004
 
 
 def reset_user_skin(access_token: str):
@@ -192,10 +606,7 @@ def reset_user_skin(access_token: str):
     >>> from mojang.account import session
     >>> session.reset_user_skin("ACCESS_TOKEN", "USER_UUID")
     """
-    headers = helpers.get_headers(bearer=access_token)
-    response = requests.delete(urls.api_session_reset_skin, headers=headers, timeout=10)
-    code, _ = helpers.err_check(response, (400, ValueError), (401, Unauthorized))
-    return code == 200  # noqa: PLR2004
+    return SessionClient(access_token, get_transport()).reset_user_skin()
 
 
 def show_user_cape(access_token: str, cape_id: str):
@@ -210,13 +621,7 @@ def show_user_cape(access_token: str, cape_id: str):
     >>> from mojang.account import session
     >>> session.show_user_cape("ACCESS_TOKEN")
     """
-    payload = {"capeId": cape_id}
-    headers = helpers.get_headers(bearer=access_token)
-    response = requests.put(
-        urls.api_session_cape_visibility, headers=headers, json=payload, timeout=10
-    )
-    code, _ = helpers.err_check(response, (400, NotCapeOwner), (401, Unauthorized))
-    return code == 200  # noqa: PLR2004
+    return SessionClient(access_token, get_transport()).show_user_cape(cape_id)
 
 
 def hide_user_cape(access_token: str):
@@ -231,12 +636,7 @@ def hide_user_cape(access_token: str):
     >>> from mojang.account import session
     >>> session.hide_user_cape("ACCESS_TOKEN")
     """
-    headers = helpers.get_headers(bearer=access_token)
-    response = requests.delete(
-        urls.api_session_cape_visibility, headers=headers, timeout=10
-    )
-    code, _ = helpers.err_check(response, (401, Unauthorized))
-    return code == 200  # noqa: PLR2004
+    return SessionClient(access_token, get_transport()).hide_user_cape()
 
 
 def owns_minecraft(
@@ -258,55 +658,24 @@ def owns_minecraft(
     >>> session.owns_minecraft("ACCESS_TOKEN")
     True
     """
-    headers = helpers.get_headers(bearer=access_token)
-    response = requests.get(urls.api_session_ownership, headers=headers, timeout=10)
-    _, data = helpers.err_check(response, (401, Unauthorized))
-
-    if verify_sig is True:
-        for i in data.get("items", []):
-            jwt.decode(i["signature"], public_key, algorithms=["RS256"])
-
-        jwt.decode(data["signature"], public_key, algorithms=["RS256"])
-
-    return len(data["items"]) != 0
+    return SessionClient(access_token, get_transport()).owns_minecraft(
+        verify_sig, public_key
+    )
 
 
-def get_profile(access_token: str) -> AuthenticatedUserProfile:
+def get_profile(
+    access_token: str, load_textures: bool = True
+) -> AuthenticatedUserProfile:
     """Returns the full profile of a authenticated user
 
+    The skins and capes are not downloaded with the profile, their content
+    is downloaded the first time their `data` is accessed.
+
     :param str access_token: The session access token
+    :param bool load_textures: If False, the skins and capes are never
+        downloaded automatically, only their url is available until their
+        :py:meth:`~mojang.api.models.Skin.load` method is called
 
     :raises Unauthorized: if the access token is invalid
     """
-
-    headers = helpers.get_headers(bearer=access_token)
-    response = requests.get(urls.api_session_profile, headers=headers, timeout=10)
-    _, data = helpers.err_check(response, (401, Unauthorized))
-
-    skins = [
-        Skin(
-            item["url"],
-            item["variant"],
-            id=item["id"],
-            state=item["state"],
-        )
-        for item in data["skins"]
-    ]
-
-    capes = [
-        Cape(
-            item["url"],
-            id=item["id"],
-            state=item["state"],
-        )
-        for item in data["capes"]
-    ]
-
-    return AuthenticatedUserProfile(
-        name=data["name"],
-        uuid=data["id"],
-        is_legacy=False,
-        is_demo=False,
-        skins=skins,
-        capes=capes,
-    )
+    return SessionClient(access_token, get_transport()).get_profile(load_textures)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+_T = TypeVar("_T")
+
+
+class _Call:
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesce identical concurrent calls
+
+    While a call for a key is in flight, the other calls for the same key
+    don't run their function, they wait for the first one and all receive
+    its result or its exception. Once the call is done, the key is forgotten
+    and the next call runs the function again.
+
+    The group is thread-safe and is used by the lookup functions of
+    :py:mod:`mojang.api.base`.
+
+    :Example:
+
+    >>> from mojang.api.singleflight import SingleFlight
+    >>> group = SingleFlight()
+    >>> group.do(("uuid", "notch"), lambda: fetch_uuid("Notch"))
+    '069a79f444e94726a5befca90e38aaf5'
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__calls: dict[Hashable, _Call] = {}
+
+    def in_flight(self) -> int:
+        """Returns the number of keys with a call in flight"""
+        return len(self.__calls)
+
+    def do(self, key: Hashable, func: Callable[[], _T]) -> _T:
+        """Run `func`, or wait for the call already in flight for `key`
+
+        :param key: The key identifying the call
+        :param func: The function to run, without arguments
+        """
+        with self.__lock:
+            call = self.__calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self.__calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+            call.done.set()
+
+        return call.result
+
+
+class AsyncSingleFlight:
+    """Coalesce identical concurrent coroutines, the asynchronous version
+    of :class:`SingleFlight`
+
+    The coroutine of the first caller runs in its own task, so cancelling
+    one of the callers doesn't cancel the call for the others. Calls are
+    only shared between callers of the same event loop.
+
+    :Example:
+
+    >>> from mojang.api.singleflight import AsyncSingleFlight
+    >>> group = AsyncSingleFlight()
+    >>> await group.do(("uuid", "notch"), lambda: fetch_uuid("Notch"))
+    '069a79f444e94726a5befca90e38aaf5'
+    """
+
+    def __init__(self) -> None:
+        self.__calls: dict[tuple[int, Hashable], asyncio.Future] = {}
+
+    def in_flight(self) -> int:
+        """Returns the number of keys with a call in flight"""
+        return len(self.__calls)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[_T]]) -> _T:
+        """Await `func()`, or the call already in flight for `key`
+
+        :param key: The key identifying the call
+        :param func: The coroutine function to call, without arguments
+        """
+        # The event loop is single threaded, no lock is needed
+        loop_key = (id(asyncio.get_running_loop()), key)
+        future = self.__calls.get(loop_key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self.__calls[loop_key] = future
+            future.add_done_callback(lambda _: self.__calls.pop(loop_key, None))
+
+        return await asyncio.shield(future)
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import os
+import re
+import tempfile
+import threading
+from typing import TYPE_CHECKING, BinaryIO, Iterable, NamedTuple
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    from typing import Iterator
+
+#: The hosts serving the textures, their urls end with the texture hash
+TEXTURE_HOSTS = frozenset(["textures.minecraft.net"])
+#: Default maximum size of the store on disk, in bytes
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+_HASH_RE = re.compile(r"^[0-9a-f]{32,128}$")
+
+
+class TextureStoreStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+
+
+def texture_hash(url: str) -> str | None:
+    """Returns the hash of a texture from its url, or None if the url
+    is not a texture url
+
+    :param str url: The url of the texture
+
+    :Example:
+
+    >>> from mojang.api.textures import texture_hash
+    >>> texture_hash("http://textures.minecraft.net/texture/1a4af718455d4aab528e7a61f86fa25e6a369d1768dcb13f7df319a713eb810b")
+    '1a4af718455d4aab528e7a61f86fa25e6a369d1768dcb13f7df319a713eb810b'
+    """
+    parsed = urlparse(url)
+    if (parsed.hostname or "").lower() not in TEXTURE_HOSTS:
+        return None
+
+    key = parsed.path.rstrip("/").rsplit("/", 1)[-1].lower()
+    if _HASH_RE.match(key) is None:
+        return None
+    return key
+
+
+class TextureStore:
+    """Content-addressed store of textures on disk
+
+    Textures are stored by hash, so the textures shared by many profiles
+    are only downloaded once. The directory can be shared by multiple
+    processes. When the store grows above `max_size`, the least recently
+    used textures are removed.
+
+    :param str directory: The directory of the store, created if needed
+    :param int max_size: The maximum size of the store, in bytes
+
+    :Example:
+
+    >>> import mojang
+    >>> from mojang.api.textures import TextureStore, set_texture_store
+    >>> set_texture_store(TextureStore("./textures", max_size=64 * 1024 * 1024))
+    >>> profile = mojang.get_profile("069a79f444e94726a5befca90e38aaf5")
+    >>> profile.skin.data  # Downloaded once, then read from the store
+    b'...'
+    """
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.__directory = os.fspath(directory)
+        self.__max_size = max_size
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+        os.makedirs(self.__directory, exist_ok=True)
+        self.__size = sum(os.path.getsize(path) for path in self._files())
+
+    @property
+    def directory(self) -> str:
+        return self.__directory
+
+    @property
+    def max_size(self) -> int:
+        return self.__max_size
+
+    @property
+    def size(self) -> int:
+        """The size of the textures in the store, in bytes"""
+        return self.__size
+
+    @property
+    def stats(self) -> TextureStoreStats:
+        """The hit, miss and eviction counters"""
+        return TextureStoreStats(self.__hits, self.__misses, self.__evictions)
+
+    def _path(self, key: str) -> str:
+        if _HASH_RE.match(key) is None:
+            msg = f"invalid texture hash: {key!r}"
+            raise ValueError(msg)
+        return os.path.join(self.__directory, key[:2], key)
+
+    def _files(self) -> Iterator[str]:
+        for root, _, files in os.walk(self.__directory):
+            for name in files:
+                if _HASH_RE.match(name):
+                    yield os.path.join(root, name)
+
+    def __contains__(self, key: object) -> bool:
+        return (
+            isinstance(key, str)
+            and _HASH_RE.match(key) is not None
+            and os.path.exists(self._path(key))
+        )
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._files())
+
+    def open(self, key: str) -> BinaryIO | None:
+        """Open a texture for reading, and mark it as recently used
+
+        :param str key: The hash of the texture
+        :returns: A binary file object, or None if the texture is not stored
+        """
+        path = self._path(key)
+        try:
+            fp = open(path, "rb")  # noqa: SIM115
+        except FileNotFoundError:
+            with self.__lock:
+                self.__misses += 1
+            return None
+
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        with self.__lock:
+            self.__hits += 1
+        return fp
+
+    def get(self, key: str) -> bytes | None:
+        """Returns the content of a texture, or None if it is not stored
+
+        :param str key: The hash of the texture
+        """
+        fp = self.open(key)
+        if fp is None:
+            return None
+        with fp:
+            return fp.read()
+
+    @contextlib.contextmanager
+    def _writer(self, key: str) -> Iterator[BinaryIO]:
+        # The file is written under a temporary name and renamed once
+        # complete, so readers never see a partial texture
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                yield fp
+                size = fp.tell()
+
+            previous = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+        with self.__lock:
+            self.__size += size - previous
+            full = self.__size > self.__max_size
+
+        if full:
+            self._evict()
+
+    def put(self, key: str, chunks: bytes | Iterable[bytes]) -> None:
+        """Store a texture
+
+        :param str key: The hash of the texture
+        :param chunks: The content of the texture, or an iterable of chunks
+        """
+        if isinstance(chunks, bytes):
+            chunks = [chunks]
+
+        with self._writer(key) as fp:
+            for chunk in chunks:
+                fp.write(chunk)
+
+    def tee(self, key: str, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Yield the chunks of a texture while storing them. The texture is
+        only stored if every chunk was consumed
+
+        :param str key: The hash of the texture
+        :param chunks: The chunks of the texture
+        """
+        with self._writer(key) as fp:
+            for chunk in chunks:
+                fp.write(chunk)
+                yield chunk
+
+    def _evict(self) -> None:
+        with self.__lock:
+            # The directory might be shared, start from what is on disk
+            files = []
+            for path in self._files():
+                with contextlib.suppress(OSError):
+                    stat = os.stat(path)
+                    files.append((stat.st_mtime, stat.st_size, path))
+
+            size = sum(item[1] for item in files)
+            for _, file_size, path in sorted(files):
+                if size <= self.__max_size:
+                    break
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path)
+                    self.__evictions += 1
+                size -= file_size
+
+            self.__size = size
+
+    def remove(self, key: str) -> None:
+        """Remove a texture from the store
+
+        :param str key: The hash of the texture
+        """
+        path = self._path(key)
+        with self.__lock, contextlib.suppress(FileNotFoundError):
+            size = os.path.getsize(path)
+            os.remove(path)
+            self.__size -= size
+
+    def clear(self) -> None:
+        """Remove every texture from the store"""
+        with self.__lock:
+            for path in self._files():
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path)
+            self.__size = 0
+
+
+_default_store: TextureStore | None = None
+_scoped_store: contextvars.ContextVar[TextureStore | None] = contextvars.ContextVar(
+    "mojang_texture_store", default=None
+)
+
+
+def get_texture_store() -> TextureStore | None:
+    """Returns the store used by the skins and capes. This is the store set
+    with :func:`use_texture_store` if any, otherwise the default one. The
+    textures are not stored by default"""
+    store = _scoped_store.get()
+    if store is not None:
+        return store
+    return _default_store
+
+
+def set_texture_store(store: TextureStore | None) -> None:
+    """Set the default store used by the skins and capes. If `store` is None,
+    the textures are not stored anymore
+
+    :param TextureStore store: The new default store
+    """
+    global _default_store
+    _default_store = store
+
+
+@contextlib.contextmanager
+def use_texture_store(store: TextureStore) -> Iterator[TextureStore]:
+    """Use `store` for every texture loaded in the current thread or task
+    until the end of the `with` block
+
+    :param TextureStore store: The store to use
+    """
+    token = _scoped_store.set(store)
+    try:
+        yield store
+    finally:
+        _scoped_store.reset(token)
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import threading
+from typing import TYPE_CHECKING, Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from mojang.api.ratelimit import HostRateLimiter
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Iterator
+
+    from typing_extensions import Self
+
+DEFAULT_TIMEOUT = 10
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+class Transport:
+    """HTTP transport used by every function of the API
+
+    The transport keeps a single :class:`requests.Session` with one
+    keep-alive connection pool per host, so consecutive requests to the
+    same host reuse an open connection instead of doing a new TCP and TLS
+    handshake each time.
+
+    :param int pool_connections: The number of hosts to keep a pool for
+    :param int pool_maxsize: The maximum number of connections kept per host
+    :param bool pool_block: If True, wait for a free connection when the pool
+        is full instead of opening a connection that won't be kept
+    :param float timeout: The default timeout of a request, in seconds
+    :param int max_retries: The number of retries on connection errors
+    :param requests.Session session: Use an already configured session, the
+        pool settings are ignored in this case
+    :param HostRateLimiter limiter: The per-host rate limiter used to schedule
+        the requests and retry them when they are rate limited (default to
+        a limiter with :data:`~mojang.api.ratelimit.MOJANG_RATE_LIMITS`)
+
+    :Example:
+
+    >>> import mojang
+    >>> from mojang.api.transport import Transport, use_transport
+    >>> with Transport(pool_maxsize=32, timeout=5) as transport:
+    ...     with use_transport(transport):
+    ...         mojang.get_uuid("Notch")
+    '069a79f444e94726a5befca90e38aaf5'
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        max_retries: int = 0,
+        session: requests.Session | None = None,
+        limiter: HostRateLimiter | None = None,
+    ) -> None:
+        self.__timeout = timeout
+        self.__limiter = limiter if limiter is not None else HostRateLimiter()
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                max_retries=max_retries,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+        self.__session = session
+
+    @property
+    def session(self) -> requests.Session:
+        return self.__session
+
+    @property
+    def timeout(self) -> float | None:
+        return self.__timeout
+
+    @property
+    def limiter(self) -> HostRateLimiter:
+        return self.__limiter
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request using the pooled session. The request waits for
+        the rate limit of its host, and is sent again if the server answers
+        with the status code 429. A file object body is rewound before it
+        is sent again
+
+        :param str method: The HTTP method
+        :param str url: The url of the request
+        :param kwargs: Any argument accepted by :meth:`requests.Session.request`
+        """
+        kwargs.setdefault("timeout", self.__timeout)
+        host_limiter = self.__limiter.limiter(url)
+
+        data = kwargs.get("data")
+        position = data.tell() if hasattr(data, "seek") else None
+
+        attempt = 0
+        while True:
+            if attempt > 0 and position is not None:
+                data.seek(position)
+            host_limiter.acquire()
+            response = self.__session.request(method, url, **kwargs)
+            if response.status_code != 429:
+                return response
+
+            if self.__limiter.retry_delay(url, attempt, response.headers) is None:
+                return response
+            attempt += 1
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        """Close every connection of the pool"""
+        self.__session.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+_default_transport: Transport | None = None
+_default_lock = threading.Lock()
+_scoped_transport: contextvars.ContextVar[Transport | None] = contextvars.ContextVar(
+    "mojang_transport", default=None
+)
+
+
+def get_transport() -> Transport:
+    """Returns the transport used by the API functions. This is the transport
+    set with :func:`use_transport` if any, otherwise the default one"""
+    global _default_transport
+
+    transport = _scoped_transport.get()
+    if transport is not None:
+        return transport
+
+    if _default_transport is None:
+        with _default_lock:
+            if _default_transport is None:
+                _default_transport = Transport()
+    return _default_transport
+
+
+def set_transport(transport: Transport | None) -> None:
+    """Replace the default transport. The previous default transport is
+    not closed. If `transport` is None, a new default transport will be
+    created on the next request
+
+    :param Transport transport: The new default transport
+    """
+    global _default_transport
+
+    with _default_lock:
+        _default_transport = transport
+
+
+@contextlib.contextmanager
+def use_transport(transport: Transport) -> Iterator[Transport]:
+    """Use `transport` for every request made in the current thread or task
+    until the end of the `with` block
+
+    :param Transport transport: The transport to use
+    """
+    token = _scoped_transport.set(transport)
+    try:
+        yield transport
+    finally:
+        _scoped_transport.reset(token)
@@ -1,5 +1,8 @@
 # ruff: noqa: N818
 
+from __future__ import annotations
+
+
 # Global
 class MethodNotAllowed(Exception):
     """The method used for the request is not allowed"""
@@ -17,6 +20,23 @@ class PayloadError(Exception):
     """The data sent to the server has an invalid format"""
 
 
+class TooManyRequests(RuntimeError):
+    """The server is rate limiting the requests, and the request was still
+    rate limited after being retried"""
+
+
+class ChunkLookupError(Exception):
+    """The request for a chunk of usernames failed. The exception that
+    made it fail is available as ``__cause__``
+
+    :var list usernames: The usernames of the chunk
+    """
+
+    def __init__(self, usernames: list[str]) -> None:
+        super().__init__(f"The lookup of {len(usernames)} usernames failed")
+        self.usernames = usernames
+
+
 # Authentication Errors
 class CredentialsError(Exception):
     """The credentials sent to the server are wrong"""
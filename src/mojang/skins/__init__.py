@@ -0,0 +1,43 @@
+"""
+Skins
+-----
+
+Tools to analyse and transform skin images, built on top of
+`NumPy <https://numpy.org>`_ and `Pillow <https://python-pillow.org>`_.
+
+Requires the ``skins`` extra: ``pip install pymojang[skins]``
+"""
+
+from mojang.skins.array import (
+    REGIONS,
+    Region,
+    as_array,
+    decode,
+    detect_variant,
+    is_slim,
+    region,
+    stack,
+)
+from mojang.skins.convert import convert_legacy, is_legacy, normalize, normalize_batch
+from mojang.skins.fingerprint import FingerprintIndex, fingerprint
+from mojang.skins.render import VIEWS, render, render_batch
+
+__all__ = [
+    "REGIONS",
+    "VIEWS",
+    "FingerprintIndex",
+    "Region",
+    "as_array",
+    "convert_legacy",
+    "decode",
+    "detect_variant",
+    "fingerprint",
+    "is_legacy",
+    "is_slim",
+    "normalize",
+    "normalize_batch",
+    "region",
+    "render",
+    "render_batch",
+    "stack",
+]
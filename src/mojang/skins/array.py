@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Union
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError as e:  # no cov
+    msg = (
+        "mojang.skins requires numpy and pillow, "
+        "install them with `pip install pymojang[skins]`"
+    )
+    raise ImportError(msg) from e
+
+if TYPE_CHECKING:
+    from mojang.api.models import Skin
+
+#: The size of a standard skin, in pixels
+SKIN_SIZE = 64
+
+
+class Region(NamedTuple):
+    """A rectangle of the skin texture, in pixels of a 64x64 skin"""
+
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+#: The regions of the skin texture. The ``*_overlay`` regions are the
+#: second layer, drawn on top of the first one
+REGIONS: dict[str, Region] = {
+    "head": Region(0, 0, 32, 16),
+    "head_overlay": Region(32, 0, 32, 16),
+    "face": Region(8, 8, 8, 8),
+    "face_overlay": Region(40, 8, 8, 8),
+    "right_leg": Region(0, 16, 16, 16),
+    "body": Region(16, 16, 24, 16),
+    "right_arm": Region(40, 16, 16, 16),
+    "right_leg_overlay": Region(0, 32, 16, 16),
+    "body_overlay": Region(16, 32, 24, 16),
+    "right_arm_overlay": Region(40, 32, 16, 16),
+    "left_leg_overlay": Region(0, 48, 16, 16),
+    "left_leg": Region(16, 48, 16, 16),
+    "left_arm": Region(32, 48, 16, 16),
+    "left_arm_overlay": Region(48, 48, 16, 16),
+}
+
+SkinLike = Union["Skin", bytes, "np.ndarray"]
+
+
+def decode(data: bytes) -> np.ndarray:
+    """Decode a skin image into a read-only ``(H, W, 4)`` array of RGBA
+    pixels, with one ``uint8`` per channel
+
+    :param bytes data: The content of the skin image
+    """
+    with Image.open(io.BytesIO(data)) as image:
+        array = np.asarray(image.convert("RGBA"), dtype=np.uint8).copy()
+
+    array.setflags(write=False)
+    return array
+
+
+def as_array(skin: SkinLike) -> np.ndarray:
+    """Returns the pixels of a skin, a skin image or an array as an array.
+    The array of a :class:`~mojang.api.models.Skin` is decoded once and
+    cached on the skin
+
+    :param skin: A skin, the content of a skin image, or an array
+    """
+    if isinstance(skin, np.ndarray):
+        return skin
+    if isinstance(skin, (bytes, bytearray, memoryview)):
+        return decode(bytes(skin))
+    return skin.array
+
+
+def _scale(array: np.ndarray) -> int:
+    width = array.shape[-2]
+    if width % SKIN_SIZE != 0:
+        msg = f"invalid skin width: {width}"
+        raise ValueError(msg)
+    return width // SKIN_SIZE
+
+
+def region(skin: SkinLike, name: str | Region) -> np.ndarray:
+    """Returns a view of a region of a skin
+
+    Works on a single skin ``(H, W, 4)`` as well as on a batch of skins
+    ``(N, H, W, 4)``, and on high resolution skins whose width is a
+    multiple of 64.
+
+    :param skin: A skin, the content of a skin image, or an array
+    :param name: The name of a region of :data:`REGIONS`, or a region
+
+    :raises KeyError: if the region doesn't exist
+    :raises ValueError: if the region is outside of a legacy skin
+    """
+    array = as_array(skin)
+    x, y, width, height = REGIONS[name] if isinstance(name, str) else name
+
+    scale = _scale(array)
+    if (y + height) * scale > array.shape[-3]:
+        msg = f"region {name!r} is outside of the skin"
+        raise ValueError(msg)
+
+    return array[
+        ...,
+        y * scale : (y + height) * scale,
+        x * scale : (x + width) * scale,
+        :,
+    ]
+
+
+def is_slim(skin: SkinLike) -> bool | np.ndarray:
+    """Returns True if a skin uses the slim model
+
+    The arms of the slim model are 3 pixels wide instead of 4, the pixels
+    left unused on the right of the right arm are transparent. Legacy skins
+    are always classic.
+
+    :param skin: A skin, the content of a skin image, or an array. For a
+        batch of skins, returns an array of booleans
+    """
+    array = as_array(skin)
+    scale = _scale(array)
+    if array.shape[-3] < SKIN_SIZE * scale:
+        slim = np.zeros(array.shape[:-3], dtype=bool)
+    else:
+        # The unused columns of the front and back of the right arm
+        alpha = array[..., 20 * scale : 32 * scale, 54 * scale : 56 * scale, 3]
+        slim = (alpha == 0).all(axis=(-2, -1))
+
+    return bool(slim) if slim.ndim == 0 else slim
+
+
+def detect_variant(skin: SkinLike) -> str:
+    """Returns the variant of a skin, either ``classic`` or ``slim``.
+    For more details checkout :func:`is_slim`
+
+    :param skin: A skin, the content of a skin image, or an array
+    """
+    return "slim" if is_slim(skin) else "classic"
+
+
+def stack(skins: Iterable[SkinLike]) -> np.ndarray:
+    """Stack many skins into one ``(N, H, W, 4)`` array. Legacy skins are
+    padded with transparent pixels to the size of standard skins
+
+    :param list skins: The skins, contents of skin images, or arrays
+
+    :raises ValueError: if the skins don't have the same size
+    """
+    arrays = []
+    for skin in skins:
+        array = as_array(skin)
+        if array.shape[0] * 2 == array.shape[1]:
+            padding = np.zeros_like(array)
+            array = np.concatenate([array, padding], axis=0)
+        arrays.append(array)
+
+    if len(arrays) == 0:
+        return np.zeros((0, SKIN_SIZE, SKIN_SIZE, 4), dtype=np.uint8)
+    if any(array.shape != arrays[0].shape for array in arrays):
+        msg = "the skins must have the same size"
+        raise ValueError(msg)
+
+    return np.stack(arrays)
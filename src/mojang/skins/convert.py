@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Hashable, Iterable, Iterator, Mapping, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+from mojang.skins.array import SKIN_SIZE, SkinLike, _scale, as_array, is_slim
+
+if TYPE_CHECKING:
+    from mojang.api.models import Skin
+
+#: The number of skins converted at once by :func:`normalize_batch`
+DEFAULT_CHUNK_SIZE = 256
+
+# Rectangles copied from a legacy skin to the left leg and the left arm, as
+# (x, y, width, height, dx, dy), mirrored horizontally, like in game
+_LEGACY_COPIES = (
+    (4, 16, 4, 4, 16, 32),
+    (8, 16, 4, 4, 16, 32),
+    (0, 20, 4, 12, 24, 32),
+    (4, 20, 4, 12, 16, 32),
+    (8, 20, 4, 12, 8, 32),
+    (12, 20, 4, 12, 16, 32),
+    (44, 16, 4, 4, -8, 32),
+    (48, 16, 4, 4, -8, 32),
+    (40, 20, 4, 12, 0, 32),
+    (44, 20, 4, 12, -8, 32),
+    (48, 20, 4, 12, -16, 32),
+    (52, 20, 4, 12, -8, 32),
+)
+
+# The layers drawn without transparency, as (x, y, width, height)
+_OPAQUE = ((0, 0, 32, 16), (0, 16, 64, 16), (16, 48, 32, 16))
+# The hat of legacy skins, made transparent if it has no transparent pixel
+_LEGACY_HAT = (32, 0, 32, 16)
+
+
+def _box(u: int, v: int, width: int, height: int, depth: int) -> list:
+    # The faces of a cuboid unfolded on the texture
+    return [
+        (u + depth, v, width, depth),
+        (u + depth + width, v, width, depth),
+        (u, v + depth, 2 * (width + depth), height),
+    ]
+
+
+def _used_mask(arm_width: int) -> np.ndarray:
+    boxes = [
+        (0, 0, 8, 8, 8),  # Head
+        (32, 0, 8, 8, 8),  # Hat
+    ]
+    for v in (16, 32):  # Base layer and overlay
+        boxes += [(0, v, 4, 12, 4), (16, v, 8, 12, 4), (40, v, arm_width, 12, 4)]
+    boxes += [
+        (16, 48, 4, 12, 4),  # Left leg
+        (0, 48, 4, 12, 4),
+        (32, 48, arm_width, 12, 4),  # Left arm
+        (48, 48, arm_width, 12, 4),
+    ]
+
+    mask = np.zeros((SKIN_SIZE, SKIN_SIZE), dtype=bool)
+    for box in boxes:
+        for x, y, width, height in _box(*box):
+            mask[y : y + height, x : x + width] = True
+    return mask
+
+
+_CLASSIC_MASK = _used_mask(4)
+_SLIM_MASK = _used_mask(3)
+
+
+def _rect(scale: int, x: int, y: int, width: int, height: int) -> tuple:
+    return (
+        Ellipsis,
+        slice(y * scale, (y + height) * scale),
+        slice(x * scale, (x + width) * scale),
+        slice(None),
+    )
+
+
+def is_legacy(skin: SkinLike) -> bool:
+    """Returns True if a skin uses the legacy 64x32 format
+
+    :param skin: A skin, the content of a skin image, or an array
+    """
+    array = as_array(skin)
+    return array.shape[-3] * 2 == array.shape[-2]
+
+
+def convert_legacy(skin: SkinLike) -> np.ndarray:
+    """Convert a legacy 64x32 skin to a 64x64 skin, the way the game does.
+    The right leg and the right arm are mirrored to create the left leg and
+    the left arm, the rest of the texture is transparent. Standard skins
+    are returned as a copy.
+
+    Works on a single skin ``(H, W, 4)`` as well as on a batch of skins
+    ``(N, H, W, 4)``, and on high resolution skins.
+
+    :param skin: A skin, the content of a skin image, or an array
+    """
+    array = as_array(skin)
+    if not is_legacy(array):
+        return np.array(array, dtype=np.uint8, copy=True)
+
+    scale = _scale(array)
+    shape = array.shape[:-3] + (array.shape[-2], array.shape[-2], 4)
+    converted = np.zeros(shape, dtype=np.uint8)
+    converted[..., : array.shape[-3], :, :] = array
+
+    for x, y, width, height, dx, dy in _LEGACY_COPIES:
+        source = array[_rect(scale, x, y, width, height)]
+        converted[_rect(scale, x + dx, y + dy, width, height)] = source[..., ::-1, :]
+
+    return converted
+
+
+def normalize(
+    skin: SkinLike,
+    variant: str | None = None,
+    slim: bool | np.ndarray | None = None,
+) -> np.ndarray:
+    """Normalize a skin before compositing
+
+    - legacy skins are converted with :func:`convert_legacy`
+    - the base layer is made opaque, and the fully opaque hat of legacy
+      skins is made transparent, like in game
+    - the pixels that are not part of the model are cleared, and the color
+      of the transparent pixels is set to 0
+
+    Two skins that look the same in game have the same normalized pixels.
+    Works on a single skin as well as on a batch of skins.
+
+    :param skin: A skin, the content of a skin image, or an array
+    :param str variant: The variant of the skin, it decides which pixels of
+        the arms are used. Defaults to the variant of `skin`, or is detected
+    :param slim: For a batch of skins, an array of booleans to use instead
+        of `variant`
+
+    :returns: A new ``(H, W, 4)`` or ``(N, H, W, 4)`` array
+    """
+    if variant is None:
+        variant = getattr(skin, "variant", None)
+
+    array = as_array(skin)
+    legacy = is_legacy(array)
+    array = convert_legacy(array)
+    scale = _scale(array)
+
+    if slim is None:
+        if variant is not None and variant.lower() in ("classic", "slim"):
+            slim = variant.lower() == "slim"
+        else:
+            slim = is_slim(array)
+
+    for rect in _OPAQUE:
+        array[_rect(scale, *rect)][..., 3] = 255
+
+    if legacy:
+        # Old skins often have an opaque hat that hides the head. Like in
+        # game, the pixels with an alpha below 128 are transparent
+        hat = array[_rect(scale, *_LEGACY_HAT)]
+        opaque = (hat[..., 3] >= 128).all(axis=(-2, -1))
+        hat[opaque] = 0
+
+    masks = np.where(
+        np.asarray(slim)[..., np.newaxis, np.newaxis],
+        _SLIM_MASK,
+        _CLASSIC_MASK,
+    )
+    if scale > 1:
+        masks = masks.repeat(scale, axis=-2).repeat(scale, axis=-1)
+
+    array[~masks | (array[..., 3] == 0)] = 0
+    return array
+
+
+def encode(skin: SkinLike) -> bytes:
+    """Encode the pixels of a skin as a PNG image. The encoding is lossless
+    and doesn't keep any metadata
+
+    :param skin: A skin, the content of a skin image, or an array
+    """
+    buffer = io.BytesIO()
+    image = Image.fromarray(np.ascontiguousarray(as_array(skin)), "RGBA")
+    image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+_Item = Tuple[Hashable, Union["Skin", bytes, np.ndarray]]
+
+
+def _iter_directory(directory: str) -> Iterator[_Item]:
+    for name in sorted(os.listdir(directory)):
+        stem, extension = os.path.splitext(name)
+        path = os.path.join(directory, name)
+        if extension.lower() == ".png" and os.path.isfile(path):
+            with open(path, "rb") as fp:
+                yield stem, fp.read()
+
+
+def _normalize_chunk(chunk: list[_Item]) -> Iterator[tuple[Hashable, np.ndarray]]:
+    arrays = [
+        (key, as_array(skin), getattr(skin, "variant", None)) for key, skin in chunk
+    ]
+
+    groups: dict[tuple[int, ...], list[int]] = {}
+    for i, (_, array, _) in enumerate(arrays):
+        groups.setdefault(array.shape, []).append(i)
+
+    normalized: list[np.ndarray | None] = [None] * len(arrays)
+    for indices in groups.values():
+        batch = np.stack([arrays[i][1] for i in indices])
+        slim = is_slim(batch)
+        for j, i in enumerate(indices):
+            variant = arrays[i][2]
+            if variant is not None and variant.lower() in ("classic", "slim"):
+                slim[j] = variant.lower() == "slim"
+        for i, array in zip(indices, normalize(batch, slim=slim)):
+            normalized[i] = array
+
+    for (key, _, _), array in zip(arrays, normalized):
+        yield key, array
+
+
+def normalize_batch(
+    skins: str | Mapping[Hashable, SkinLike] | Iterable[SkinLike],
+    directory: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int | None = None,
+) -> list[bytes] | list[str]:
+    """Normalize and re-encode many skins. For more details checkout
+    :func:`normalize`
+
+    The skins of the same size are normalized together, `chunk_size` skins
+    at a time, with vectorized operations. The images are encoded by a pool
+    of threads.
+
+    :param skins: A directory of PNG images, a mapping of names to skins,
+        or skins, contents of skin images, or arrays
+    :param str directory: If given, the skins are written to this directory,
+        named after the names of `skins` or, if they have no name, the
+        SHA-256 digest of the normalized image
+    :param int chunk_size: The number of skins normalized at once
+    :param int max_workers: The number of threads encoding the images
+        (default to the number of cores)
+
+    :returns: The normalized images or, if `directory` is given, their
+        paths, in the same order as `skins`
+
+    :Example:
+
+    >>> from mojang.skins.convert import normalize_batch
+    >>> normalize_batch("./archive", directory="./normalized")
+    ['./normalized/Notch.png', ...]
+    """
+    if isinstance(skins, (str, os.PathLike)):
+        items: Iterable[_Item] = _iter_directory(os.fspath(skins))
+    elif isinstance(skins, Mapping):
+        items = skins.items()
+    else:
+        items = ((None, skin) for skin in skins)
+
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+
+    def _output(item: tuple[Hashable, np.ndarray]) -> bytes | str:
+        key, array = item
+        data = encode(array)
+        if directory is None:
+            return data
+
+        name = key if key is not None else hashlib.sha256(data).hexdigest()
+        path = os.path.join(directory, f"{name}.png")
+        with open(path, "wb") as fp:
+            fp.write(data)
+        return path
+
+    results: list = []
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        chunk: list[_Item] = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                results.extend(pool.map(_output, _normalize_chunk(chunk)))
+                chunk = []
+        results.extend(pool.map(_output, _normalize_chunk(chunk)))
+
+    return results
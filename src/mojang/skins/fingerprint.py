@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import Hashable, Iterable, Mapping, NamedTuple
+
+import numpy as np
+
+from mojang.skins.array import SkinLike, as_array
+
+#: The number of bits of a perceptual hash
+HASH_BITS = 64
+#: The number of skins hashed at once by :meth:`FingerprintIndex.add_many`
+DEFAULT_CHUNK_SIZE = 1024
+
+_GRID = 8
+_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+class Fingerprint(NamedTuple):
+    #: The SHA-256 digest of the pixels, identical for identical skins
+    content: str
+    #: The perceptual hash, close for skins that look alike
+    perceptual: int
+
+
+class Match(NamedTuple):
+    key: Hashable
+    distance: int
+
+
+def _normalize(array: np.ndarray) -> np.ndarray:
+    # The color of transparent pixels is invisible, ignore it
+    array = np.array(array, dtype=np.uint8, copy=True)
+    array[array[..., 3] == 0] = 0
+    return array
+
+
+def content_hash(skin: SkinLike) -> str:
+    """Returns the SHA-256 digest of the pixels of a skin. Unlike a digest of
+    the file, it doesn't depend on how the image was encoded, and the color
+    of the transparent pixels is ignored
+
+    :param skin: A skin, the content of a skin image, or an array
+    """
+    array = _normalize(as_array(skin))
+    shape = np.array(array.shape, dtype=np.uint32).tobytes()
+    return hashlib.sha256(shape + array.tobytes()).hexdigest()
+
+
+def perceptual_hashes(batch: np.ndarray) -> list[int]:
+    """Returns the perceptual hashes of a batch of skins
+
+    The luminance of each skin, weighted by the alpha channel, is averaged
+    over a 8x8 grid and each cell gives one bit: 1 if it is brighter than
+    the mean of the skin. Skins that look alike have hashes with a small
+    Hamming distance.
+
+    :param batch: The skins, as a ``(N, H, W, 4)`` array
+    """
+    batch = np.asarray(batch)
+    n, height, width, _ = batch.shape
+    if height % _GRID != 0 or width % _GRID != 0:
+        msg = f"invalid skin size: {width}x{height}"
+        raise ValueError(msg)
+
+    pixels = batch.astype(np.float32)
+    luminance = (pixels[..., :3] @ _WEIGHTS) * (pixels[..., 3] / 255.0)
+    cells = luminance.reshape(n, _GRID, height // _GRID, _GRID, width // _GRID).mean(
+        axis=(2, 4)
+    )
+    bits = cells.reshape(n, HASH_BITS) > cells.reshape(n, HASH_BITS).mean(
+        axis=1, keepdims=True
+    )
+    packed = np.packbits(bits, axis=1)
+    return [int.from_bytes(row.tobytes(), "big") for row in packed]
+
+
+def perceptual_hash(skin: SkinLike) -> int:
+    """Returns the perceptual hash of a skin. For more details checkout
+    :func:`perceptual_hashes`
+
+    :param skin: A skin, the content of a skin image, or an array
+    """
+    return perceptual_hashes(as_array(skin)[np.newaxis])[0]
+
+
+def fingerprint(skin: SkinLike) -> Fingerprint:
+    """Returns the content hash and the perceptual hash of a skin
+
+    :param skin: A skin, the content of a skin image, or an array
+    """
+    array = as_array(skin)
+    return Fingerprint(content_hash(array), perceptual_hash(array))
+
+
+def hamming(a: int, b: int) -> int:
+    """Returns the number of bits that differ between two hashes"""
+    return bin(a ^ b).count("1")
+
+
+class _Node:
+    __slots__ = ("children", "keys", "value")
+
+    def __init__(self, value: int, key: Hashable) -> None:
+        self.value = value
+        self.keys = [key]
+        self.children: dict[int, _Node] = {}
+
+
+class FingerprintIndex:
+    """Index of skin fingerprints, to find identical and similar skins
+
+    Identical skins are found by content hash in constant time. Similar
+    skins are found by perceptual hash with a BK-tree, which only compares
+    the query with a small part of the index instead of every skin.
+
+    :Example:
+
+    >>> from mojang.skins.fingerprint import FingerprintIndex
+    >>> index = FingerprintIndex()
+    >>> index.add_many({uuid: profile.skin for uuid, profile in profiles.items()})
+    >>> index.duplicates(skin)
+    ['069a79f444e94726a5befca90e38aaf5', ...]
+    >>> index.query(skin, 4)
+    [Match(key='069a79f444e94726a5befca90e38aaf5', distance=0), ...]
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__root: _Node | None = None
+        self.__contents: dict[str, list[Hashable]] = {}
+        self.__fingerprints: dict[Hashable, Fingerprint] = {}
+
+    def __len__(self) -> int:
+        return len(self.__fingerprints)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__fingerprints
+
+    def get(self, key: Hashable) -> Fingerprint | None:
+        """Returns the fingerprint of a skin of the index
+
+        :param key: The key of the skin
+        """
+        return self.__fingerprints.get(key)
+
+    def _insert(self, key: Hashable, value: Fingerprint) -> None:
+        if key in self.__fingerprints:
+            msg = f"key {key!r} is already in the index"
+            raise KeyError(msg)
+
+        self.__fingerprints[key] = value
+        self.__contents.setdefault(value.content, []).append(key)
+
+        if self.__root is None:
+            self.__root = _Node(value.perceptual, key)
+            return
+
+        node = self.__root
+        while True:
+            distance = hamming(node.value, value.perceptual)
+            if distance == 0:
+                node.keys.append(key)
+                return
+
+            child = node.children.get(distance)
+            if child is None:
+                node.children[distance] = _Node(value.perceptual, key)
+                return
+            node = child
+
+    def add(self, key: Hashable, skin: SkinLike) -> Fingerprint:
+        """Add a skin to the index
+
+        :param key: The key of the skin, for instance the uuid of its player
+        :param skin: A skin, the content of a skin image, or an array
+
+        :raises KeyError: if the key is already in the index
+        """
+        value = fingerprint(skin)
+        with self.__lock:
+            self._insert(key, value)
+        return value
+
+    def add_many(
+        self,
+        skins: Mapping[Hashable, SkinLike] | Iterable[tuple[Hashable, SkinLike]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """Add many skins to the index. The perceptual hashes of the skins of
+        the same size are computed together, `chunk_size` skins at a time
+
+        :param skins: A mapping of keys to skins, or ``(key, skin)`` tuples
+        :param int chunk_size: The number of skins hashed at once
+
+        :returns: The number of skins added
+
+        :raises KeyError: if a key is already in the index or is repeated.
+            The skins of the chunk with that key are not added
+        """
+        items = skins.items() if isinstance(skins, Mapping) else skins
+
+        count = 0
+        chunk: list[tuple[Hashable, np.ndarray]] = []
+        for key, skin in items:
+            chunk.append((key, as_array(skin)))
+            if len(chunk) >= chunk_size:
+                count += self._add_chunk(chunk)
+                chunk = []
+
+        return count + self._add_chunk(chunk)
+
+    def _add_chunk(self, chunk: list[tuple[Hashable, np.ndarray]]) -> int:
+        groups: dict[tuple[int, ...], list[tuple[Hashable, np.ndarray]]] = {}
+        for key, array in chunk:
+            groups.setdefault(array.shape, []).append((key, array))
+
+        values: list[tuple[Hashable, Fingerprint]] = []
+        for group in groups.values():
+            hashes = perceptual_hashes(np.stack([array for _, array in group]))
+            values.extend(
+                (key, Fingerprint(content_hash(array), value))
+                for (key, array), value in zip(group, hashes)
+            )
+
+        with self.__lock:
+            # Check every key first, so a failed chunk adds nothing
+            seen: set[Hashable] = set()
+            for key, _ in values:
+                if key in self.__fingerprints or key in seen:
+                    msg = f"key {key!r} is already in the index"
+                    raise KeyError(msg)
+                seen.add(key)
+
+            for key, value in values:
+                self._insert(key, value)
+        return len(values)
+
+    def duplicates(self, skin: SkinLike) -> list[Hashable]:
+        """Returns the keys of the skins identical to `skin`
+
+        :param skin: A skin, the content of a skin image, or an array
+        """
+        return list(self.__contents.get(content_hash(skin), []))
+
+    def groups(self) -> list[list[Hashable]]:
+        """Returns the groups of keys of identical skins, with at least
+        two skins"""
+        with self.__lock:
+            return [list(keys) for keys in self.__contents.values() if len(keys) > 1]
+
+    def query(self, skin: SkinLike | int, max_distance: int) -> list[Match]:
+        """Returns the skins whose perceptual hash is within `max_distance`
+        of the hash of `skin`, closest first
+
+        :param skin: A skin, the content of a skin image, an array, or a
+            perceptual hash
+        :param int max_distance: The maximum Hamming distance
+        """
+        value = skin if isinstance(skin, int) else perceptual_hash(skin)
+
+        matches: list[Match] = []
+        with self.__lock:
+            stack = [self.__root] if self.__root is not None else []
+            while stack:
+                node = stack.pop()
+                distance = hamming(node.value, value)
+                if distance <= max_distance:
+                    matches.extend(Match(key, distance) for key in node.keys)
+
+                # By the triangle inequality, only these children can match
+                low, high = distance - max_distance, distance + max_distance
+                stack.extend(
+                    child
+                    for child_distance, child in node.children.items()
+                    if low <= child_distance <= high
+                )
+
+        matches.sort(key=lambda match: match.distance)
+        return matches
+
+    def nearest(self, skin: SkinLike | int, max_distance: int) -> Match | None:
+        """Returns the closest skin within `max_distance`, or None
+
+        :param skin: A skin, the content of a skin image, an array, or a
+            perceptual hash
+        :param int max_distance: The maximum Hamming distance
+        """
+        matches = self.query(skin, max_distance)
+        return matches[0] if matches else None
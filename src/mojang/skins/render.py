@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import io
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Iterable, Mapping
+
+import numpy as np
+from PIL import Image
+
+from mojang.skins.array import SKIN_SIZE, _scale, as_array, is_slim
+
+if TYPE_CHECKING:
+    from mojang.api.models import Skin
+
+#: The views that can be rendered
+VIEWS = ("face", "head", "bust")
+
+# Front faces of the parts drawn in a bust, as (x, y, width, height) of a
+# 64x64 skin, and their overlay
+_FACE = ((8, 8, 8, 8), (40, 8, 8, 8))
+_BODY = ((20, 20, 8, 12), (20, 36, 8, 12))
+_RIGHT_ARM = ((44, 20, 4, 12), (44, 36, 4, 12))
+_LEFT_ARM = ((36, 52, 4, 12), (52, 52, 4, 12))
+
+
+def _crop(
+    array: np.ndarray, rect: tuple[int, int, int, int], scale: int
+) -> Image.Image:
+    x, y, width, height = (v * scale for v in rect)
+    return Image.fromarray(np.ascontiguousarray(array[y : y + height, x : x + width]))
+
+
+def _part(
+    array: np.ndarray,
+    rects: tuple[tuple[int, int, int, int], tuple[int, int, int, int]],
+    scale: int,
+    overlay: bool,
+    width: int | None = None,
+) -> Image.Image:
+    base, layer = rects
+    if width is not None:
+        base = (base[0], base[1], width, base[3])
+        layer = (layer[0], layer[1], width, layer[3])
+
+    image = _crop(array, base, scale)
+    # Legacy skins only have the overlay of the head
+    if overlay and (layer[1] + layer[3]) * scale <= array.shape[0]:
+        image = Image.alpha_composite(image, _crop(array, layer, scale))
+    return image
+
+
+def _render_face(array: np.ndarray, scale: int, overlay: bool) -> Image.Image:
+    return _part(array, _FACE, scale, overlay)
+
+
+def _render_head(
+    array: np.ndarray, scale: int, overlay: bool, size: int
+) -> Image.Image:
+    # The hat is drawn 9/8 of the size of the face, like in game. The head
+    # is drawn at the size of the avatar, so both layers are scaled up by an
+    # integer factor: the hat fills the avatar and the face is centered in it
+    texel = max(1, size // 8)
+    face_texel = max(1, round(texel * 8 / 9))
+    offset = 4 * (texel - face_texel)
+
+    canvas = Image.new("RGBA", (8 * texel, 8 * texel))
+    face = _crop(array, _FACE[0], scale)
+    canvas.alpha_composite(
+        face.resize((8 * face_texel, 8 * face_texel), Image.NEAREST), (offset, offset)
+    )
+    if overlay:
+        hat = _crop(array, _FACE[1], scale)
+        canvas.alpha_composite(hat.resize(canvas.size, Image.NEAREST))
+    return canvas
+
+
+def _render_bust(
+    array: np.ndarray, scale: int, overlay: bool, slim: bool
+) -> Image.Image:
+    arm_width = 3 if slim else 4
+    legacy = array.shape[0] < SKIN_SIZE * scale
+
+    head = _part(array, _FACE, scale, overlay)
+    body = _part(array, _BODY, scale, overlay)
+    right_arm = _part(array, _RIGHT_ARM, scale, overlay, arm_width)
+    if legacy:
+        # Legacy skins only have one arm, mirrored for the other side
+        left_arm = right_arm.transpose(Image.FLIP_LEFT_RIGHT)
+    else:
+        left_arm = _part(array, _LEFT_ARM, scale, overlay, arm_width)
+
+    # Head, then the upper half of the body and arms
+    offset = arm_width * scale
+    canvas = Image.new("RGBA", ((8 + 2 * arm_width) * scale, 16 * scale))
+    canvas.alpha_composite(head, (offset, 0))
+    canvas.alpha_composite(body.crop((0, 0, 8 * scale, 8 * scale)), (offset, 8 * scale))
+    canvas.alpha_composite(
+        right_arm.crop((0, 0, arm_width * scale, 8 * scale)), (0, 8 * scale)
+    )
+    canvas.alpha_composite(
+        left_arm.crop((0, 0, arm_width * scale, 8 * scale)),
+        (offset + 8 * scale, 8 * scale),
+    )
+    return canvas
+
+
+def _variant_is_slim(array: np.ndarray, variant: str | None) -> bool:
+    if variant is not None and variant.lower() in ("classic", "slim"):
+        return variant.lower() == "slim"
+    return bool(is_slim(array))
+
+
+def render(
+    skin: Skin | bytes | np.ndarray,
+    view: str = "face",
+    size: int = 64,
+    overlay: bool = True,
+    variant: str | None = None,
+) -> Image.Image:
+    """Render an avatar from a skin
+
+    - ``face``: the front of the head, with the hat overlay
+    - ``head``: the front of the head, with the hat drawn slightly larger
+    - ``bust``: the head, the top of the body and the arms
+
+    :param skin: A skin, the content of a skin image, or an array
+    :param str view: The view to render, one of :data:`VIEWS`
+    :param int size: The height of the avatar, in pixels. The pixels of the
+        skin are scaled up without smoothing
+    :param bool overlay: If False, the second layer of the skin is not drawn
+    :param str variant: The variant of the skin, used for the arms of the
+        bust. Defaults to the variant of `skin`, or is detected
+
+    :raises ValueError: if the view doesn't exist
+
+    :Example:
+
+    >>> from mojang.skins.render import render
+    >>> render(profile.skin, "head", size=128).save("head.png")
+    """
+    if view not in VIEWS:
+        msg = f"invalid view {view!r}, expected one of {VIEWS}"
+        raise ValueError(msg)
+
+    if variant is None:
+        variant = getattr(skin, "variant", None)
+
+    array = as_array(skin)
+    scale = _scale(array)
+    if view == "face":
+        image = _render_face(array, scale, overlay)
+    elif view == "head":
+        image = _render_head(array, scale, overlay, size)
+    else:
+        image = _render_bust(array, scale, overlay, _variant_is_slim(array, variant))
+
+    width = max(1, round(image.width * size / image.height))
+    return image.resize((width, size), Image.NEAREST)
+
+
+def _render_one(
+    data: bytes,
+    variant: str | None,
+    view: str,
+    size: int,
+    overlay: bool,
+    image_format: str,
+    dest: str | None,
+) -> bytes | str:
+    image = render(data, view, size, overlay, variant)
+    if dest is not None:
+        image.save(dest, format=image_format)
+        return dest
+
+    buffer = io.BytesIO()
+    image.save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+def render_batch(
+    skins: Iterable[Skin] | Mapping[str, Skin],
+    view: str = "face",
+    size: int = 64,
+    overlay: bool = True,
+    directory: str | None = None,
+    image_format: str = "png",
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+) -> list[bytes] | list[str]:
+    """Render the avatars of many skins, the skins are decoded and rendered
+    in a pool of processes. For more details checkout :func:`render`
+
+    :param skins: The skins, or a mapping of names to skins, for instance
+        uuids to skins
+    :param str view: The view to render, one of :data:`VIEWS`
+    :param int size: The height of the avatars, in pixels
+    :param bool overlay: If False, the second layer of the skins is not drawn
+    :param str directory: If given, the avatars are written to this directory
+        by the workers, named after the keys of `skins` or the digest of
+        the skins
+    :param str image_format: The format of the avatars
+    :param int max_workers: The number of processes (default to the number
+        of cores)
+    :param Executor executor: An executor to use instead of a new process
+        pool, for instance to reuse the same pool for many batches
+
+    :returns: The avatars encoded in `image_format` or, if `directory` is
+        given, their paths, in the same order as `skins`
+
+    :Example:
+
+    >>> from mojang.skins.render import render_batch
+    >>> profiles = mojang.get_profiles(uuids)
+    >>> skins = {uuid: p.skin for uuid, p in profiles.items() if p and p.skin}
+    >>> mojang.prefetch_textures(skins.values())
+    >>> render_batch(skins, "head", directory="./avatars")
+    ['./avatars/069a79f444e94726a5befca90e38aaf5.png', ...]
+    """
+    if view not in VIEWS:
+        msg = f"invalid view {view!r}, expected one of {VIEWS}"
+        raise ValueError(msg)
+
+    if isinstance(skins, Mapping):
+        names, items = list(skins.keys()), list(skins.values())
+    else:
+        items = list(skins)
+        names = [skin.digest for skin in items]
+
+    dests: list[str | None] = [None] * len(items)
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+        extension = image_format.lower()
+        dests = [os.path.join(directory, f"{name}.{extension}") for name in names]
+
+    # Only the bytes of the skins are sent to the workers
+    args = (
+        [skin.data for skin in items],
+        [skin.variant for skin in items],
+        [view] * len(items),
+        [size] * len(items),
+        [overlay] * len(items),
+        [image_format] * len(items),
+        dests,
+    )
+
+    if executor is not None:
+        return list(executor.map(_render_one, *args))
+
+    if len(items) == 0:
+        return []
+
+    workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunksize = max(1, len(items) // (workers * 4))
+        return list(pool.map(_render_one, *args, chunksize=chunksize))
@@ -0,0 +1,124 @@
+import asyncio
+import base64
+import json
+import unittest
+
+import httpx
+import pytest
+
+import mojang
+from mojang import aio
+from mojang.api.models import Skin
+from mojang.api.structures import UnauthenticatedProfile
+from mojang.api.urls import (
+    api_get_blocked_servers,
+    api_get_username,
+    api_get_uuid,
+    api_get_uuids,
+    api_user_profile,
+)
+from mojang.exceptions import InvalidName, ServerError
+
+_UUID = "069a79f444e94726a5befca90e38aaf5"
+_SKIN_URL = "http://textures.minecraft.net/texture/292009a4925b58f02c77dadc3ecef07ea4c7472f64e0fdc32ce5522489362680"
+
+
+def _textures_property():
+    value = {"textures": {"SKIN": {"url": _SKIN_URL}}}
+    return base64.b64encode(json.dumps(value).encode()).decode()
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    url = str(request.url)
+    if url == api_get_blocked_servers:
+        return httpx.Response(200, text="hash1\nhash2")
+    if url == api_get_uuid("Notch"):
+        return httpx.Response(200, json={"id": _UUID, "name": "Notch"})
+    if url == api_get_uuid("UNEXISTENTPLAYER"):
+        return httpx.Response(204)
+    if url == api_get_uuids:
+        names = json.loads(request.content)
+        return httpx.Response(
+            200,
+            json=[{"id": _UUID, "name": "Notch"}] if "notch" in names else [],
+        )
+    if url == api_get_username(_UUID):
+        return httpx.Response(200, json={"id": _UUID, "name": "Notch"})
+    if url == api_user_profile(_UUID):
+        return httpx.Response(
+            200,
+            json={
+                "id": _UUID,
+                "name": "Notch",
+                "properties": [{"name": "textures", "value": _textures_property()}],
+            },
+        )
+    return httpx.Response(500)
+
+
+class TestAioBase(unittest.TestCase):
+    def _run(self, coro):
+        async def _main():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+            async with aio.AsyncTransport(client=client) as transport:
+                with aio.use_transport(transport):
+                    return await coro
+
+        return asyncio.run(_main())
+
+    def test_get_blocked_servers(self):
+        assert self._run(aio.get_blocked_servers()) == ["hash1", "hash2"]
+
+    def test_refresh_blocked_servers(self):
+        blocked = mojang.BlockedServers()
+        assert self._run(aio.refresh_blocked_servers(blocked))
+        assert blocked.hashes == {"hash1", "hash2"}
+
+    def test_get_uuid(self):
+        assert self._run(aio.get_uuid("Notch")) == _UUID
+        assert self._run(aio.get_uuid("UNEXISTENTPLAYER")) is None
+        pytest.raises(InvalidName, self._run, aio.get_uuid(""))
+
+    def test_get_uuids(self):
+        names = ["Notch"] + [f"player{i}" for i in range(15)]
+        uuids = self._run(aio.get_uuids(names))
+        assert list(uuids) == [n.lower() for n in names]
+        assert uuids["notch"] == _UUID
+        assert uuids["player0"] is None
+
+    def test_get_uuid_coalesced(self):
+        calls = []
+
+        def _counting(request):
+            calls.append(request)
+            return _handler(request)
+
+        async def _main():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(_counting))
+            async with aio.AsyncTransport(client=client) as transport:
+                with aio.use_transport(transport):
+                    return await asyncio.gather(
+                        *(aio.get_uuid("Notch") for _ in range(8))
+                    )
+
+        assert asyncio.run(_main()) == [_UUID] * 8
+        assert len(calls) == 1
+
+    def test_get_username(self):
+        assert self._run(aio.get_username(_UUID)) == "Notch"
+        pytest.raises(ServerError, self._run, aio.get_username("unknown"))
+
+    def test_get_profile(self):
+        profile = self._run(aio.get_profile(_UUID))
+        assert isinstance(profile, UnauthenticatedProfile)
+        assert profile.name == "Notch"
+        assert profile.uuid == _UUID
+        assert isinstance(profile.skin, Skin)
+        assert profile.skin.source == _SKIN_URL
+        assert profile.cape is None
+
+    def test_concurrent_lookups(self):
+        async def _lookups():
+            return await asyncio.gather(*(aio.get_uuid("Notch") for _ in range(500)))
+
+        assert self._run(_lookups()) == [_UUID] * 500
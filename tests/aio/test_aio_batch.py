@@ -0,0 +1,36 @@
+import asyncio
+import json
+import unittest
+
+import httpx
+
+from mojang import aio
+from mojang.aio.batch import AsyncUUIDBatcher
+from mojang.api.urls import api_get_uuids
+
+_UUIDS = {f"player{i}": f"{i:032x}" for i in range(15)}
+
+
+class TestAioUUIDBatcher(unittest.TestCase):
+    def test_get_uuid(self):
+        calls = []
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            assert str(request.url) == api_get_uuids
+            names = json.loads(request.content)
+            calls.append(names)
+            return httpx.Response(
+                200, json=[{"id": _UUIDS[n], "name": n} for n in names if n in _UUIDS]
+            )
+
+        async def _main():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+            async with aio.AsyncTransport(client=client) as transport:
+                with aio.use_transport(transport):
+                    batcher = AsyncUUIDBatcher(window=0.05)
+                    return await asyncio.gather(
+                        *(batcher.get_uuid(name) for name in [*_UUIDS, "unknown"])
+                    )
+
+        assert asyncio.run(_main()) == [*_UUIDS.values(), None]
+        assert [len(names) for names in calls] == [10, 6]
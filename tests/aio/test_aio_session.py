@@ -0,0 +1,114 @@
+import asyncio
+import functools
+import io
+import unittest
+
+import httpx
+import pytest
+
+from mojang import aio
+from mojang.api.structures import AuthenticatedUserProfile
+from mojang.api.urls import (
+    api_session_change_skin,
+    api_session_check_username,
+    api_session_name_change,
+    api_session_profile,
+    api_session_reset_skin,
+)
+from mojang.exceptions import Unauthorized
+
+_SKIN_URL = "http://textures.minecraft.net/texture/292009a4925b58f02c77dadc3ecef07ea4c7472f64e0fdc32ce5522489362680"
+
+
+@functools.lru_cache(maxsize=None)
+def _png(compress_level: int = 6) -> bytes:
+    image = pytest.importorskip("PIL.Image")
+    buffer = io.BytesIO()
+    image.new("RGBA", (64, 64), (255, 0, 0, 255)).save(
+        buffer, "PNG", compress_level=compress_level
+    )
+    return buffer.getvalue()
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    url = str(request.url)
+    if url == _SKIN_URL:
+        return httpx.Response(200, content=_png(9))
+
+    if request.headers.get("authorization") != "Bearer TOKEN":
+        return httpx.Response(401)
+
+    if url == api_session_check_username("lucino"):
+        return httpx.Response(200, json={"status": "AVAILABLE"})
+    if url == api_session_name_change:
+        return httpx.Response(
+            200,
+            json={"createdAt": "2021-01-01T00:00:00Z", "nameChangeAllowed": True},
+        )
+    if url == api_session_change_skin:
+        assert b'name="variant"' in request.content
+        assert b"PNG" in request.content
+        return httpx.Response(204)
+    if url == api_session_reset_skin:
+        return httpx.Response(200)
+    if url == api_session_profile:
+        return httpx.Response(
+            200,
+            json={
+                "id": "4ba22ce11f064d7f9f715634aa0d7973",
+                "name": "Lucino772",
+                "skins": [
+                    {
+                        "id": "6a6e65e5-76dd-4c3c-a625-162924514568",
+                        "state": "ACTIVE",
+                        "url": _SKIN_URL,
+                        "variant": "CLASSIC",
+                    }
+                ],
+                "capes": [],
+            },
+        )
+    return httpx.Response(500)
+
+
+class TestAioSession(unittest.TestCase):
+    def _run(self, coro):
+        async def _main():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+            async with aio.AsyncTransport(client=client) as transport:
+                with aio.use_transport(transport):
+                    return await coro
+
+        return asyncio.run(_main())
+
+    def test_check_username(self):
+        assert self._run(aio.session.check_username("TOKEN", "lucino"))
+        pytest.raises(
+            Unauthorized, self._run, aio.session.check_username("BAD", "lucino")
+        )
+
+    def test_get_user_name_change(self):
+        name_change = self._run(aio.session.get_user_name_change("TOKEN"))
+        assert name_change.allowed
+        assert name_change.created_at.year == 2021
+
+    def test_change_user_skin(self):
+        assert self._run(aio.session.change_user_skin("TOKEN", _SKIN_URL))
+
+    def test_change_user_skin_buffer(self):
+        assert self._run(aio.session.change_user_skin("TOKEN", memoryview(b"NEW PNG")))
+        # The served skin has the same pixels, encoded again
+        assert not self._run(
+            aio.session.change_user_skin("TOKEN", _png(), skip_unchanged=True)
+        )
+
+    def test_reset_user_skin(self):
+        assert self._run(aio.session.reset_user_skin("TOKEN"))
+
+    def test_get_profile(self):
+        profile = self._run(aio.session.get_profile("TOKEN"))
+        assert isinstance(profile, AuthenticatedUserProfile)
+        assert profile.name == "Lucino772"
+        assert len(profile.skins) == 1
+        assert profile.skins[0].state == "ACTIVE"
+        assert profile.capes == []
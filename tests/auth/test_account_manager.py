@@ -0,0 +1,186 @@
+import threading
+import time
+import unittest
+
+import pytest
+
+from mojang.api.auth.manager import AccountManager
+
+
+class _User:
+    auto_refresh = False
+
+    def __init__(self, uuid, name, expires_in, calls=None):
+        self.uuid = uuid
+        self.name = name
+        self.expires_at = time.time() + expires_in
+        self.calls = calls if calls is not None else []
+        self.refreshed = threading.Event()
+
+    def refresh(self):
+        self.calls.append(self.name)
+        self.expires_at = time.time() + 3600
+        self.refreshed.set()
+
+
+class TestAccountManager(unittest.TestCase):
+    def test_lookup(self):
+        notch = _User("069a79f444e94726a5befca90e38aaf5", "Notch", 3600)
+        jeb = _User("853c80ef3c3749fdaa49938b674adae6", "jeb_", 3600)
+
+        with AccountManager() as manager:
+            assert manager.add_many([notch, jeb]) == 2
+            assert len(manager) == 2
+            assert manager.get("069a79f4-44e9-4726-a5be-fca90e38aaf5") is notch
+            assert manager.get("NOTCH") is notch
+            assert "jeb_" in manager
+            assert set(manager) == {notch, jeb}
+            pytest.raises(KeyError, manager.get, "Dinnerbone")
+            pytest.raises(KeyError, manager.add, notch)
+
+            # The users can't refresh their own session
+            user = _User("1", "Dinnerbone", 3600)
+            user.auto_refresh = True
+            pytest.raises(ValueError, manager.add, user)
+
+            assert manager.remove("jeb_") is jeb
+            assert "jeb_" not in manager
+            pytest.raises(KeyError, manager.remove, "jeb_")
+
+        pytest.raises(RuntimeError, manager.add, jeb)
+
+    def test_refresh_order(self):
+        calls = []
+        users = [
+            _User("3", "c", 3600, calls),
+            _User("2", "b", 0.1, calls),
+            _User("1", "a", 0.05, calls),
+        ]
+
+        with AccountManager(refresh_margin=0) as manager:
+            for user in users:
+                manager.add(user)
+
+            assert users[1].refreshed.wait(5)
+            assert calls == ["a", "b"]
+            assert not users[0].refreshed.is_set()
+            # The refreshed accounts are scheduled again
+            assert manager.next_refresh() == pytest.approx(users[0].expires_at)
+
+    def test_refresh_retry(self):
+        user = _User("1", "a", 0)
+        failures = []
+
+        def _refresh():
+            if not failures:
+                failures.append(True)
+                raise RuntimeError
+            _User.refresh(user)
+
+        user.refresh = _refresh
+        with AccountManager(refresh_margin=0, retry_delay=0.05) as manager:
+            manager.add(user)
+            assert user.refreshed.wait(5)
+            assert failures == [True]
+
+    def test_refresh_delay(self):
+        calls = []
+        user = _User("1", "a", 0, calls)
+
+        # The new token is already in the refresh margin, the account is not
+        # refreshed again right away
+        with AccountManager(refresh_margin=7200) as manager:
+            manager.add(user)
+            assert user.refreshed.wait(5)
+            time.sleep(0.2)
+            assert calls == ["a"]
+            assert manager.next_refresh() >= time.time() + 0.5
+
+    def test_bounded_workers(self):
+        lock = threading.Lock()
+        running, peak = [0], [0]
+        done = threading.Semaphore(0)
+
+        class _SlowUser(_User):
+            def refresh(self):
+                with lock:
+                    running[0] += 1
+                    peak[0] = max(peak[0], running[0])
+                time.sleep(0.05)
+                with lock:
+                    running[0] -= 1
+                super().refresh()
+                done.release()
+
+        with AccountManager(max_workers=2, refresh_margin=0) as manager:
+            for i in range(6):
+                manager.add(_SlowUser(str(i), str(i), 0))
+            for _ in range(6):
+                assert done.acquire(timeout=5)
+
+        assert peak[0] == 2
+
+    def test_lease(self):
+        notch = _User("1", "Notch", 3600)
+        jeb = _User("2", "jeb_", 3600)
+
+        with AccountManager() as manager:
+            manager.add(notch)
+            manager.add(jeb)
+
+            assert manager.lease("notch") is notch
+            pytest.raises(TimeoutError, manager.lease, "Notch", 0.01)
+            # Leased users can still be looked up
+            assert manager.get("Notch") is notch
+
+            with manager.leased(timeout=0.01) as user:
+                assert user is jeb
+                pytest.raises(TimeoutError, manager.lease, timeout=0.01)
+
+            # The name is indexed again when the user is returned
+            notch.name = "Notch2"
+            manager.release(notch)
+            assert manager.get("notch2") is notch
+            assert "Notch" not in manager
+
+            # A user whose session expired is refreshed before the lease
+            jeb.expires_at = time.time() - 1
+            assert manager.lease("jeb_") is jeb
+            assert jeb.calls == ["jeb_"]
+            manager.release(jeb)
+
+    def test_release_failure(self):
+        class _OfflineUser(_User):
+            offline = False
+
+            @property
+            def name(self):
+                if self.offline:
+                    raise ConnectionError
+                return self._name
+
+            @name.setter
+            def name(self, value):
+                self._name = value
+
+        user = _OfflineUser("1", "a", 3600)
+        with AccountManager() as manager:
+            manager.add(user)
+
+            # The profile can't be fetched when the user is returned, it is
+            # returned anyway and the error of the block is kept
+            logs = self.assertLogs("mojang.api.auth.manager", "WARNING")
+            with logs, pytest.raises(RuntimeError), manager.leased("a"):
+                user.offline = True
+                raise RuntimeError
+
+            assert manager.lease("a", timeout=0.01) is user
+
+    def test_lease_wait(self):
+        user = _User("1", "a", 3600)
+
+        with AccountManager() as manager:
+            manager.add(user)
+            manager.lease("a")
+            threading.Timer(0.05, manager.release, (user,)).start()
+            assert manager.lease("a", timeout=5) is user
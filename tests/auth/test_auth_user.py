@@ -1,14 +1,29 @@
+import datetime as dt
+import gc
+import threading
+import time
 import unittest
+import weakref
+from unittest import mock
 
+import jwt
 import responses
+from responses.matchers import header_matcher
 
+from mojang.api.auth.microsoft import (
+    XboxLiveToken,
+    XboxLiveTokenCache,
+    get_token_expiry,
+)
 from mojang.api.auth.models import MicrosoftAuthenticatedUser
 from mojang.api.urls import (
     api_ms_xbl_authenticate,
     api_ms_xbl_authorize,
     api_ms_xbl_login,
+    api_session_change_skin,
     api_session_name_change,
     api_session_profile,
+    api_session_reset_skin,
 )
 
 
@@ -146,3 +161,247 @@ class TestAuthUser(unittest.TestCase):
         user.close()
         assert user._access_token is None  # noqa: SLF001
         assert user._refresh_token is None  # noqa: SLF001
+
+    @responses.activate
+    def test_refresh_cached_xsts(self):
+        self._mock_auth_mc200()
+        calls = []
+
+        class _Client:
+            def acquire_token_by_refresh_token(self, refresh_token, scopes):  # noqa: ARG002
+                calls.append(refresh_token)
+                return {"access_token": "ACCESS_TOKEN", "refresh_token": "NEW"}
+
+        tokens = XboxLiveTokenCache()
+        future = dt.datetime(2999, 1, 1, tzinfo=dt.timezone.utc)
+        xbl = XboxLiveToken("XBL_TOKEN", "USERHASH", future)
+        with mock.patch("mojang.api.auth.microsoft._request_xbl", return_value=xbl):
+            with mock.patch(
+                "mojang.api.auth.microsoft._request_xsts", return_value=xbl
+            ) as request_xsts:
+                tokens.authenticate(lambda: "ACCESS_TOKEN")
+                user = MicrosoftAuthenticatedUser(
+                    "ACCESS_TOKEN", "REFRESH_TOKEN", _Client(), xbox_tokens=tokens
+                )
+                user.refresh()
+                assert request_xsts.call_count == 1
+
+        # The XSTS token is still valid, Microsoft is not called
+        assert calls == []
+        assert user._access_token == self._mc_token  # noqa: SLF001
+        assert user._refresh_token == "REFRESH_TOKEN"  # noqa: SLF001
+        user.close()
+
+    @responses.activate
+    def test_lazy_profile(self):
+        self._mock_fetch_profile200()
+        user = MicrosoftAuthenticatedUser(
+            "ACCESS_TOKEN",
+            "REFRESH_TOKEN",
+            TestAuthUser._MockedMsalClientApplication(),
+        )
+        assert len(responses.calls) == 0
+
+        # The profile and the name change are fetched together, once
+        assert user.name == self._name
+        assert user.name_change_allowed
+        assert len(responses.calls) == 2
+
+        user.invalidate()
+        assert user.uuid == self._uuid
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_mutation_response(self):
+        new_skin_url = "http://textures.minecraft.net/texture/292009a4925b58f02c77dadc3ecef07ea4c7472f64e0fdc32ce5522489362680"
+        responses.add(
+            method=responses.POST,
+            url=api_session_change_skin,
+            json={
+                "id": self._uuid,
+                "name": self._name,
+                "skins": [
+                    {
+                        "id": "6a6e65e5-76dd-4c3c-a625-162924514568",
+                        "state": "ACTIVE",
+                        "url": new_skin_url,
+                        "variant": "SLIM",
+                    }
+                ],
+                "capes": [],
+            },
+            status=200,
+        )
+        responses.add(method=responses.DELETE, url=api_session_reset_skin, status=200)
+        user = MicrosoftAuthenticatedUser(
+            "ACCESS_TOKEN",
+            "REFRESH_TOKEN",
+            TestAuthUser._MockedMsalClientApplication(),
+        )
+
+        # The profile is updated from the response, without fetching it
+        user.change_skin(b"PNG", "slim")
+        assert user.skin.source == new_skin_url
+        assert user.skin.variant == "SLIM"
+        assert len(responses.calls) == 1
+
+        # Without a profile in the response, the profile is fetched again
+        self._mock_fetch_profile200()
+        user.reset_skin()
+        assert user.skin.source == self._skin_url
+        assert len(responses.calls) == 4
+
+    @staticmethod
+    def _jwt(expires_in: float) -> str:
+        return jwt.encode({"exp": int(time.time() + expires_in)}, "secret")
+
+    def test_token_expiry(self):
+        exp = int(time.time()) + 60
+        assert get_token_expiry(jwt.encode({"exp": exp}, "secret")) == exp
+        assert get_token_expiry(jwt.encode({}, "secret")) is None
+        assert get_token_expiry("ACCESS_TOKEN") is None
+        assert get_token_expiry(None) is None
+
+    @responses.activate
+    def test_background_refresh(self):
+        self._mock_auth_xbl200()
+        self._mock_auth_xsts200()
+        self._mock_auth_mc200()
+
+        # The token expires in the refresh margin, it is refreshed right away
+        user = MicrosoftAuthenticatedUser(
+            self._jwt(10),
+            "REFRESH_TOKEN",
+            TestAuthUser._MockedMsalClientApplication(),
+            auto_refresh=True,
+            refresh_margin=60,
+        )
+        assert user.expires_at is not None
+
+        deadline = time.monotonic() + 5
+        while user._access_token != self._mc_token and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert user._access_token == self._mc_token
+        assert user.expires_at is None
+        user.close()
+
+    @responses.activate
+    def test_background_refresh_retry(self):
+        self._mock_auth_xbl200()
+        self._mock_auth_xsts200()
+        self._mock_auth_mc200()
+        calls = []
+
+        class _Client:
+            def acquire_token_by_refresh_token(self, refresh_token, scopes):
+                calls.append(refresh_token)
+                if len(calls) == 1:
+                    raise ConnectionError
+                return {"access_token": "ACCESS_TOKEN", "refresh_token": "NEW"}
+
+        # The failed refresh is logged and tried again after the delay
+        with self.assertLogs("mojang.api.auth.models", "WARNING"):
+            user = MicrosoftAuthenticatedUser(
+                self._jwt(10),
+                "REFRESH_TOKEN",
+                _Client(),
+                auto_refresh=True,
+                retry_delay=0.05,
+            )
+            deadline = time.monotonic() + 5
+            while user._access_token != self._mc_token and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert len(calls) == 2
+        assert user._access_token == self._mc_token
+        user.close()
+
+    def test_timer_weakref(self):
+        user = MicrosoftAuthenticatedUser(
+            self._jwt(3600),
+            "REFRESH_TOKEN",
+            TestAuthUser._MockedMsalClientApplication(),
+            auto_refresh=True,
+        )
+        timer = user._MicrosoftAuthenticatedUser__timer  # noqa: SLF001
+        ref = weakref.ref(user)
+
+        # The pending refresh timer doesn't keep the user alive, and it is
+        # cancelled when the user is collected
+        del user
+        gc.collect()
+        assert ref() is None
+        timer.join(5)
+        assert not timer.is_alive()
+
+    def test_no_auto_refresh(self):
+        user = MicrosoftAuthenticatedUser(
+            self._jwt(10), "REFRESH_TOKEN", TestAuthUser._MockedMsalClientApplication()
+        )
+        assert not user.auto_refresh
+        assert user._MicrosoftAuthenticatedUser__timer is None  # noqa: SLF001
+
+    @responses.activate
+    def test_single_refresh(self):
+        self._mock_auth_xbl200()
+        self._mock_auth_xsts200()
+        self._mock_auth_mc200()
+
+        calls = []
+
+        class _SlowClient(TestAuthUser._MockedMsalClientApplication):
+            def acquire_token_by_refresh_token(self, refresh_token, scopes):
+                calls.append(refresh_token)
+                time.sleep(0.1)
+                return super().acquire_token_by_refresh_token(refresh_token, scopes)
+
+        user = MicrosoftAuthenticatedUser(
+            "ACCESS_TOKEN", "REFRESH_TOKEN", _SlowClient(), auto_refresh=True
+        )
+        threads = [
+            threading.Thread(target=user._on_unauthorized, args=("ACCESS_TOKEN",))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert calls == ["REFRESH_TOKEN"]
+        assert user._access_token == self._mc_token
+
+        # A request rejected with an old token uses the new one, without
+        # refreshing again
+        assert user._on_unauthorized("ACCESS_TOKEN")
+        assert len(calls) == 1
+
+    @responses.activate
+    def test_expired_token_retry(self):
+        self._mock_auth_xbl200()
+        self._mock_auth_xsts200()
+        self._mock_auth_mc200()
+        bearer = header_matcher({"authorization": f"Bearer {self._mc_token}"})
+        responses.add(
+            method=responses.GET,
+            url=api_session_profile,
+            json={"id": self._uuid, "name": self._name, "skins": [], "capes": []},
+            match=[bearer],
+        )
+        responses.add(
+            method=responses.GET,
+            url=api_session_name_change,
+            json={"createdAt": "2021-01-01T00:00:00Z", "nameChangeAllowed": True},
+            match=[bearer],
+        )
+        responses.add(method=responses.GET, url=api_session_profile, status=401)
+        responses.add(method=responses.GET, url=api_session_name_change, status=401)
+
+        # The token is rejected, the requests are sent again with a new one
+        user = MicrosoftAuthenticatedUser(
+            "ACCESS_TOKEN",
+            "REFRESH_TOKEN",
+            TestAuthUser._MockedMsalClientApplication(),
+        )
+        assert user.name == self._name
+        assert user.name_change_allowed
+        assert user._access_token == self._mc_token
@@ -1,9 +1,12 @@
+import datetime as dt
 import unittest
 
 import pytest
 import responses
 
 from mojang.api.auth.microsoft import (
+    XboxLiveTokenCache,
+    _parse_not_after,
     authenticate_minecraft,
     authenticate_xbl,
     authenticate_xsts,
@@ -98,3 +101,99 @@ class TestMicrosoftAuth(unittest.TestCase):
     def test_auth_mc401(self):
         responses.add(method=responses.POST, url=api_ms_xbl_login, status=401)
         pytest.raises(Unauthorized, authenticate_minecraft, "USERHASH", "XSTS_TOKEN")
+
+
+class TestXboxLiveTokenCache(unittest.TestCase):
+    def _mock_xbox(self, url, token, not_after):
+        responses.add(
+            method=responses.POST,
+            url=url,
+            json={
+                "IssueInstant": "2020-12-07T19:52:08.4463796Z",
+                "NotAfter": not_after,
+                "Token": token,
+                "DisplayClaims": {"xui": [{"uhs": "USERHASH"}]},
+            },
+            status=200,
+        )
+
+    def _mock_mc(self, status=200):
+        responses.add(
+            method=responses.POST,
+            url=api_ms_xbl_login,
+            json={"access_token": "MC_TOKEN", "expires_in": 86400},
+            status=status,
+        )
+
+    def _count(self, url):
+        return sum(call.request.url == url for call in responses.calls)
+
+    def test_parse_not_after(self):
+        expected = dt.datetime(2020, 12, 21, 19, 52, 8, 446379, dt.timezone.utc)
+        assert _parse_not_after("2020-12-21T19:52:08.4463796Z") == expected
+        assert _parse_not_after("2020-12-21T19:52:08Z") == expected.replace(
+            microsecond=0
+        )
+        # Short fractions, only supported by fromisoformat since Python 3.11
+        assert _parse_not_after("2020-12-21T19:52:08.4Z") == expected.replace(
+            microsecond=400000
+        )
+        assert _parse_not_after("2020-12-21T19:52:08.23Z") == expected.replace(
+            microsecond=230000
+        )
+
+    @responses.activate
+    def test_skip_valid_tokens(self):
+        self._mock_xbox(api_ms_xbl_authenticate, "XBL", "2999-01-01T00:00:00.0Z")
+        self._mock_xbox(api_ms_xbl_authorize, "XSTS", "2999-01-01T00:00:00.0Z")
+        self._mock_mc()
+
+        auth_tokens = []
+
+        def _auth_token():
+            auth_tokens.append("RPS_TOKEN")
+            return "RPS_TOKEN"
+
+        cache = XboxLiveTokenCache()
+        assert cache.authenticate(_auth_token) == "MC_TOKEN"
+        assert cache.authenticate(_auth_token) == "MC_TOKEN"
+
+        # Only the Minecraft login is repeated
+        assert len(auth_tokens) == 1
+        assert self._count(api_ms_xbl_authenticate) == 1
+        assert self._count(api_ms_xbl_authorize) == 1
+        assert self._count(api_ms_xbl_login) == 2
+        assert cache.xsts.token == "XSTS"
+
+    @responses.activate
+    def test_expired_xsts(self):
+        self._mock_xbox(api_ms_xbl_authenticate, "XBL", "2999-01-01T00:00:00.0Z")
+        self._mock_xbox(api_ms_xbl_authorize, "XSTS", "2020-12-08T11:52:09.2345095Z")
+        self._mock_mc()
+
+        cache = XboxLiveTokenCache()
+        cache.authenticate(lambda: "RPS_TOKEN")
+        cache.authenticate(pytest.fail)
+
+        # The Xbox Live token is still valid, only the XSTS token is renewed
+        assert self._count(api_ms_xbl_authenticate) == 1
+        assert self._count(api_ms_xbl_authorize) == 2
+
+        cache.clear()
+        assert cache.xbl is None
+        assert cache.xsts is None
+
+    @responses.activate
+    def test_revoked_tokens(self):
+        self._mock_xbox(api_ms_xbl_authenticate, "XBL", "2999-01-01T00:00:00.0Z")
+        self._mock_xbox(api_ms_xbl_authorize, "XSTS", "2999-01-01T00:00:00.0Z")
+        self._mock_mc()
+        self._mock_mc(401)
+        self._mock_mc()
+
+        cache = XboxLiveTokenCache()
+        cache.authenticate(lambda: "RPS_TOKEN")
+        # The cached tokens are rejected, the whole chain is requested again
+        assert cache.authenticate(lambda: "RPS_TOKEN") == "MC_TOKEN"
+        assert self._count(api_ms_xbl_authenticate) == 2
+        assert self._count(api_ms_xbl_login) == 3
@@ -0,0 +1,12 @@
+import pytest
+
+from mojang.api.transport import set_transport
+
+
+@pytest.fixture(autouse=True)
+def _default_transport():
+    # Each test starts with a new default transport, so the requests of the
+    # previous tests don't count in its rate limits
+    set_transport(None)
+    yield
+    set_transport(None)
@@ -1,3 +1,7 @@
+import io
+import mmap
+import os
+import tempfile
 import unittest
 
 import pytest
@@ -6,10 +10,20 @@ from responses.matchers import multipart_matcher
 
 from mojang.api import session
 from mojang.api.models import Skin
-from mojang.api.urls import api_session_change_skin
+from mojang.api.transport import Transport, use_transport
+from mojang.api.urls import api_session_change_skin, api_session_profile
 from mojang.exceptions import Unauthorized
 
 
+def _png(color: tuple, compress_level: int = 6) -> bytes:
+    image = pytest.importorskip("PIL.Image")
+    buffer = io.BytesIO()
+    image.new("RGBA", (64, 64), color).save(
+        buffer, "PNG", compress_level=compress_level
+    )
+    return buffer.getvalue()
+
+
 class TestMojangChangeSkin(unittest.TestCase):
     def _path_skin_url(self, url: str):
         responses.add(method=responses.GET, url=url, status=200, body=b"")
@@ -50,3 +64,116 @@ class TestMojangChangeSkin(unittest.TestCase):
         responses.add(method=responses.POST, url=api_session_change_skin, status=401)
 
         pytest.raises(Unauthorized, session.change_user_skin, "TOKEN", skin_url)
+
+    def _mock_change_skin(self, content: bytes, variant: str = "classic"):
+        responses.add(
+            method=responses.POST,
+            url=api_session_change_skin,
+            status=204,
+            match=[
+                multipart_matcher(
+                    {"file": ("image.png", content, "image/png")},
+                    data={"variant": variant},
+                )
+            ],
+        )
+
+    @responses.activate
+    def test_buffers(self):
+        self._mock_change_skin(b"PNG CONTENT")
+        assert session.change_user_skin("TOKEN", b"PNG CONTENT")
+        assert session.change_user_skin("TOKEN", bytearray(b"PNG CONTENT"))
+        assert session.change_user_skin("TOKEN", memoryview(b"PNG CONTENT"))
+
+        with tempfile.TemporaryFile() as fp:
+            fp.write(b"PNG CONTENT")
+            fp.flush()
+            with mmap.mmap(fp.fileno(), 0) as buffer:
+                assert session.change_user_skin("TOKEN", buffer)
+
+        # Non contiguous buffers are copied
+        assert session.change_user_skin(
+            "TOKEN", memoryview(b"PxNxGx xCxOxNxTxExNxTx")[::2]
+        )
+        pytest.raises(TypeError, session.change_user_skin, "TOKEN", 42)
+
+    @responses.activate
+    def test_files(self):
+        self._mock_change_skin(b"PNG CONTENT", "slim")
+
+        # The file is read from its current position
+        fp = io.BytesIO(b"HEADERPNG CONTENT")
+        fp.seek(6)
+        assert session.change_user_skin("TOKEN", fp, "slim")
+        assert not fp.closed
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "skin.png")
+            with open(path, "wb") as fp:
+                fp.write(b"PNG CONTENT")
+            assert session.change_user_skin("TOKEN", path, "slim")
+
+    def test_upload_body(self):
+        with session._SkinUpload(b"PNG CONTENT", "classic") as upload:
+            body = upload.read()
+            assert len(body) == len(upload)
+            assert upload.read(10) == b""
+
+            # The body can be rewound
+            upload.seek(0)
+            assert b"".join(iter(lambda: upload.read(3), b"")) == body
+            assert upload.tell() == len(body)
+            pytest.raises(io.UnsupportedOperation, upload.seek, 10)
+
+    @responses.activate
+    def test_retry(self):
+        responses.add(
+            method=responses.POST,
+            url=api_session_change_skin,
+            status=429,
+            headers={"Retry-After": "0"},
+        )
+        self._mock_change_skin(b"PNG CONTENT")
+
+        with Transport() as transport, use_transport(transport):
+            assert session.change_user_skin("TOKEN", io.BytesIO(b"PNG CONTENT"))
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_skip_unchanged(self):
+        red, green = _png((255, 0, 0, 255)), _png((0, 255, 0, 255))
+        # The texture server sends the same pixels, encoded again
+        served = _png((255, 0, 0, 255), compress_level=9)
+        assert served != red
+        skin_url = "http://textures.minecraft.net/texture/292009a4925b58f02c77dadc3ecef07ea4c7472f64e0fdc32ce5522489362680"
+        responses.add(method=responses.GET, url=skin_url, body=served)
+        responses.add(
+            method=responses.GET,
+            url=api_session_profile,
+            json={
+                "id": "4ba22ce11f064d7f9f715634aa0d7973",
+                "name": "Lucino772",
+                "skins": [
+                    {
+                        "id": "6a6e65e5-76dd-4c3c-a625-162924514568",
+                        "state": "ACTIVE",
+                        "url": skin_url,
+                        "variant": "CLASSIC",
+                    }
+                ],
+                "capes": [],
+            },
+        )
+        self._mock_change_skin(green)
+        self._mock_change_skin(red, "slim")
+
+        changed = session.change_user_skin("TOKEN", red, skip_unchanged=True)
+        assert not changed
+        changed = session.change_user_skin(
+            "TOKEN", io.BytesIO(red), skip_unchanged=True
+        )
+        assert not changed
+        changed = session.change_user_skin("TOKEN", green, skip_unchanged=True)
+        assert changed
+        changed = session.change_user_skin("TOKEN", red, "slim", skip_unchanged=True)
+        assert changed
@@ -63,6 +63,32 @@ class TestMojangGetProfile(unittest.TestCase):
             )
         ]
 
+    @responses.activate
+    def test_no_textures(self):
+        responses.add(
+            method=responses.GET,
+            url=api_session_profile,
+            json={
+                "id": "4ba22ce11f064d7f9f715634aa0d7973",
+                "name": "Lucino772",
+                "skins": [
+                    {
+                        "id": "6a6e65e5-76dd-4c3c-a625-162924514568",
+                        "state": "ACTIVE",
+                        "url": "http://textures.minecraft.net/texture/1a4af718455d4aab528e7a61f86fa25e6a369d1768dcb13f7df319a713eb810b",
+                        "variant": "CLASSIC",
+                    }
+                ],
+                "capes": [],
+            },
+            status=200,
+        )
+
+        profile = session.get_profile("TOKEN", load_textures=False)
+        assert not profile.skins[0].loaded
+        assert profile.skins[0].data == b""
+        assert len(responses.calls) == 1
+
     @responses.activate
     def test401(self):
         responses.add(method=responses.GET, url=api_session_profile, status=401)
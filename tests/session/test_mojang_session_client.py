@@ -0,0 +1,57 @@
+import unittest
+
+import pytest
+import responses
+from responses.matchers import header_matcher
+
+from mojang.api.session import SessionClient
+from mojang.api.transport import Transport
+from mojang.api.urls import (
+    api_session_check_username,
+    api_session_name_change,
+    api_session_reset_skin,
+)
+from mojang.exceptions import Unauthorized
+
+
+class TestMojangSessionClient(unittest.TestCase):
+    @responses.activate
+    def test_bound_token(self):
+        responses.add(
+            method=responses.GET,
+            url=api_session_check_username("lucino"),
+            json={"status": "AVAILABLE"},
+            match=[header_matcher({"authorization": "Bearer TOKEN"})],
+        )
+        responses.add(
+            method=responses.GET,
+            url=api_session_name_change,
+            json={"createdAt": "2021-01-01T00:00:00Z", "nameChangeAllowed": True},
+            match=[header_matcher({"authorization": "Bearer NEW_TOKEN"})],
+        )
+        responses.add(method=responses.GET, url=api_session_name_change, status=401)
+
+        with SessionClient("TOKEN") as client:
+            assert client.access_token == "TOKEN"
+            assert client.check_username("lucino")
+            pytest.raises(Unauthorized, client.get_user_name_change)
+
+            # The token can be swapped without a new client
+            client.access_token = "NEW_TOKEN"
+            assert client.get_user_name_change().allowed
+
+    @responses.activate
+    def test_transport(self):
+        responses.add(method=responses.DELETE, url=api_session_reset_skin, status=200)
+
+        with Transport() as transport:
+            client = SessionClient("TOKEN", transport)
+            assert client.transport is transport
+            assert client.reset_user_skin()
+            client.close()
+
+            # The transport is not owned by the client, it is still open
+            assert client.reset_user_skin()
+
+        with SessionClient("TOKEN") as client:
+            assert isinstance(client.transport, Transport)
@@ -0,0 +1,74 @@
+import io
+import os
+import unittest
+
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+from mojang.api.models import Skin
+from mojang.skins import array as skin_array
+
+_ASSETS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets")
+
+
+def _png(array) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(array, "RGBA").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _skin(slim: bool = False, height: int = 64):
+    array = np.full((height, 64, 4), 255, dtype=np.uint8)
+    if slim:
+        array[20:32, 54:56, 3] = 0
+    return array
+
+
+class TestSkinsArray(unittest.TestCase):
+    def test_decode(self):
+        skin = Skin(os.path.join(_ASSETS, "skin.png"), "classic")
+        array = skin.array
+
+        assert array.shape == (64, 64, 4)
+        assert array.dtype == np.uint8
+        assert not array.flags.writeable
+        # The array is cached on the skin
+        assert skin.array is array
+        assert skin_array.as_array(skin) is array
+
+    def test_region(self):
+        array = np.arange(64 * 64 * 4, dtype=np.uint32).reshape(64, 64, 4)
+
+        face = skin_array.region(array, "face")
+        assert face.shape == (8, 8, 4)
+        assert (face == array[8:16, 8:16]).all()
+
+        # High resolution skins are scaled
+        hd = np.zeros((128, 128, 4), dtype=np.uint8)
+        assert skin_array.region(hd, "body").shape == (32, 48, 4)
+
+        batch = np.zeros((5, 64, 64, 4), dtype=np.uint8)
+        assert skin_array.region(batch, "left_arm_overlay").shape == (5, 16, 16, 4)
+
+        legacy = np.zeros((32, 64, 4), dtype=np.uint8)
+        pytest.raises(ValueError, skin_array.region, legacy, "left_leg")
+        pytest.raises(KeyError, skin_array.region, array, "tail")
+
+    def test_variant(self):
+        assert skin_array.detect_variant(_skin()) == "classic"
+        assert skin_array.detect_variant(_png(_skin(slim=True))) == "slim"
+        assert skin_array.detect_variant(_skin(height=32)) == "classic"
+
+        batch = skin_array.stack([_skin(), _skin(slim=True), _skin(height=32)])
+        assert batch.shape == (3, 64, 64, 4)
+        assert skin_array.is_slim(batch).tolist() == [False, True, False]
+
+    def test_stack(self):
+        assert skin_array.stack([]).shape == (0, 64, 64, 4)
+        pytest.raises(
+            ValueError,
+            skin_array.stack,
+            [_skin(), np.zeros((128, 128, 4), dtype=np.uint8)],
+        )
@@ -0,0 +1,146 @@
+import io
+import os
+import tempfile
+import unittest
+
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+from mojang.api.models import Skin
+from mojang.skins import convert
+from mojang.skins.array import decode
+
+_ASSETS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets")
+
+
+def _png(array) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(array, "RGBA").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _legacy_skin():
+    array = np.zeros((32, 64, 4), dtype=np.uint8)
+    array[..., 3] = 255
+    array[20:32, 0:4] = (255, 0, 0, 255)  # Outside of the right leg
+    array[20:32, 4:8] = (0, 255, 0, 255)  # Front of the right leg
+    array[20:32, 44:48] = (0, 0, 255, 255)  # Front of the right arm
+    array[20:32, 47] = (255, 255, 0, 255)  # Left column of the arm front
+    return array
+
+
+class TestSkinsConvert(unittest.TestCase):
+    def test_convert_legacy(self):
+        legacy = _legacy_skin()
+        assert convert.is_legacy(legacy)
+
+        array = convert.convert_legacy(legacy)
+        assert array.shape == (64, 64, 4)
+        assert not convert.is_legacy(array)
+        assert (array[:32] == legacy).all()
+        # The outside of the right leg becomes the outside of the left leg
+        assert (array[52:64, 24:28] == (255, 0, 0, 255)).all()
+        assert (array[52:64, 20:24] == (0, 255, 0, 255)).all()
+        # The front of the arm is mirrored
+        assert (array[52:64, 37:40] == (0, 0, 255, 255)).all()
+        assert (array[52:64, 36] == (255, 255, 0, 255)).all()
+        # The overlays of the body and limbs are empty
+        assert (array[32:48] == 0).all()
+
+        standard = np.ones((64, 64, 4), dtype=np.uint8)
+        copy = convert.convert_legacy(standard)
+        assert copy is not standard
+        assert (copy == standard).all()
+
+    def test_convert_batch(self):
+        batch = np.stack([_legacy_skin(), np.zeros((32, 64, 4), dtype=np.uint8)])
+        converted = convert.convert_legacy(batch)
+        assert converted.shape == (2, 64, 64, 4)
+        assert (converted[0] == convert.convert_legacy(batch[0])).all()
+
+        hd = _legacy_skin().repeat(2, axis=0).repeat(2, axis=1)
+        converted = convert.convert_legacy(hd)
+        assert converted.shape == (128, 128, 4)
+        assert (converted[104:128, 40:48] == (0, 255, 0, 255)).all()
+
+    def test_normalize(self):
+        array = np.zeros((64, 64, 4), dtype=np.uint8)
+        array[8:16, 8:16] = (10, 20, 30, 0)  # Transparent face
+        array[0:8, 0:8] = (255, 255, 255, 255)  # Unused corner
+        array[8:16, 40:48] = (1, 2, 3, 0)  # Transparent hat
+        array[20:32, 54:56] = (9, 9, 9, 255)  # Right arm, classic only
+
+        normalized = convert.normalize(array, variant="classic")
+        assert (normalized[8:16, 8:16] == (10, 20, 30, 255)).all()
+        assert (normalized[0:8, 0:8] == 0).all()
+        assert (normalized[8:16, 40:48] == 0).all()
+        assert (normalized[20:32, 54:56] == (9, 9, 9, 255)).all()
+
+        slim = convert.normalize(array, variant="slim")
+        assert (slim[20:32, 54:56] == 0).all()
+        # The input is not modified
+        assert (array[0:8, 0:8] == 255).all()
+
+    def test_normalize_legacy_hat(self):
+        legacy = _legacy_skin()
+        normalized = convert.normalize(legacy)
+        # The hat is fully opaque, it is removed like in game
+        assert (normalized[0:16, 32:64] == 0).all()
+
+        # The game sees the pixels with an alpha of 128 or more as opaque
+        legacy[0:16, 32:64, 3] = 128
+        normalized = convert.normalize(legacy)
+        assert (normalized[0:16, 32:64] == 0).all()
+
+        legacy[0:8, 40:48, 3] = 127
+        normalized = convert.normalize(legacy)
+        assert (normalized[8:16, 40:48, 3] == 128).all()
+
+    def test_normalize_skin(self):
+        skin = Skin(os.path.join(_ASSETS, "skin.png"), "classic", id="1")
+        normalized = skin.normalize()
+
+        assert isinstance(normalized, Skin)
+        assert normalized.id == "1"
+        assert normalized.variant == "classic"
+        assert normalized.extension == "png"
+        assert normalized.data.startswith(b"\x89PNG")
+        assert (normalized.array == convert.normalize(skin)).all()
+        # Normalizing is idempotent and the encoding lossless
+        assert (normalized.normalize().array == normalized.array).all()
+
+    def test_encode(self):
+        array = convert.normalize(_legacy_skin())
+        assert (decode(convert.encode(array)) == array).all()
+
+    def test_normalize_batch(self):
+        skins = [_legacy_skin(), _png(_legacy_skin()), np.zeros((64, 64, 4), np.uint8)]
+        results = convert.normalize_batch(skins, chunk_size=2, max_workers=2)
+
+        assert len(results) == 3
+        assert (decode(results[0]) == convert.normalize(skins[0])).all()
+        assert results[1] == results[0]
+        empty = decode(results[2])
+        assert (empty[8:16, 8:16] == (0, 0, 0, 255)).all()
+        assert (empty[0:8, 0:8] == 0).all()
+
+    def test_normalize_batch_directory(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "source")
+            os.makedirs(source)
+            for name in ("a", "b"):
+                with open(os.path.join(source, f"{name}.png"), "wb") as fp:
+                    fp.write(_png(_legacy_skin()))
+            with open(os.path.join(source, "notes.txt"), "w") as fp:
+                fp.write("not a skin")
+
+            dest = os.path.join(tmp, "dest")
+            paths = convert.normalize_batch(source, directory=dest)
+            assert paths == [os.path.join(dest, "a.png"), os.path.join(dest, "b.png")]
+            with open(paths[0], "rb") as fp:
+                assert decode(fp.read()).shape == (64, 64, 4)
+
+            paths = convert.normalize_batch([_legacy_skin()], directory=dest)
+            assert len(os.path.basename(paths[0])) == 64 + 4
@@ -0,0 +1,95 @@
+import random
+import unittest
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from mojang.skins.fingerprint import (
+    Fingerprint,
+    FingerprintIndex,
+    content_hash,
+    hamming,
+    perceptual_hash,
+    perceptual_hashes,
+)
+
+
+def _random_skin(seed: int):
+    # Blocks of 8x8 pixels, either dark or bright, with some noise
+    rng = np.random.default_rng(seed)
+    blocks = rng.choice([40, 220], size=(8, 8, 1)).astype(np.int16)
+    pixels = np.kron(blocks, np.ones((8, 8, 3), dtype=np.int16))
+    pixels = pixels + rng.integers(-20, 20, size=pixels.shape)
+    alpha = np.full((64, 64, 1), 255, dtype=np.int16)
+    return np.concatenate([pixels, alpha], axis=2).clip(0, 255).astype(np.uint8)
+
+
+class TestSkinsFingerprint(unittest.TestCase):
+    def test_content_hash(self):
+        skin = _random_skin(0)
+        skin[0, 0] = (10, 20, 30, 0)
+        other = skin.copy()
+        other[0, 0] = (40, 50, 60, 0)
+
+        # The color of transparent pixels is ignored
+        assert content_hash(skin) == content_hash(other)
+        other[0, 0, 3] = 255
+        assert content_hash(skin) != content_hash(other)
+
+    def test_perceptual_hash(self):
+        skin = _random_skin(1)
+        similar = skin.copy()
+        similar[0:2, 0:2] = 0
+
+        assert 0 <= perceptual_hash(skin) < 2**64
+        assert hamming(perceptual_hash(skin), perceptual_hash(similar)) <= 2
+        assert perceptual_hashes(np.stack([skin, similar])) == [
+            perceptual_hash(skin),
+            perceptual_hash(similar),
+        ]
+        pytest.raises(ValueError, perceptual_hashes, np.zeros((1, 60, 60, 4)))
+
+    def test_index(self):
+        skins = {f"player{i}": _random_skin(i) for i in range(200)}
+        skins["copy"] = skins["player3"].copy()
+        skins["legacy"] = np.ones((32, 64, 4), dtype=np.uint8)
+
+        index = FingerprintIndex()
+        assert index.add_many(skins, chunk_size=64) == len(skins)
+        assert len(index) == len(skins)
+        assert "player3" in index
+        pytest.raises(KeyError, index.add, "copy", skins["copy"])
+
+        # A chunk with a known or repeated key adds nothing
+        chunk = [("new", _random_skin(500)), ("player0", skins["player0"])]
+        pytest.raises(KeyError, index.add_many, chunk)
+        pytest.raises(KeyError, index.add_many, [chunk[0], chunk[0]])
+        assert "new" not in index
+        assert len(index) == len(skins)
+
+        assert index.duplicates(skins["player3"]) == ["player3", "copy"]
+        assert index.groups() == [["player3", "copy"]]
+
+        similar = skins["player7"].copy()
+        similar[0:2, 0:2] = 0
+        match = index.nearest(similar, 4)
+        assert match is not None
+        assert match.key == "player7"
+
+    def test_query(self):
+        index = FingerprintIndex()
+        rng = random.Random(0)
+        hashes = [rng.getrandbits(64) for _ in range(500)]
+        for i, value in enumerate(hashes):
+            index._insert(i, Fingerprint(content=f"{value:064x}", perceptual=value))
+
+        query = hashes[42] ^ 0b1011
+        expected = sorted(
+            (hamming(value, query), i)
+            for i, value in enumerate(hashes)
+            if hamming(value, query) <= 10
+        )
+        matches = index.query(query, 10)
+        assert sorted((m.distance, m.key) for m in matches) == expected
+        assert matches[0] == (42, 3)
@@ -0,0 +1,100 @@
+import io
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+from mojang.api.models import Skin
+from mojang.skins import render, render_batch
+
+_ASSETS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets")
+
+
+def _skin_array(height: int = 64):
+    array = np.zeros((height, 64, 4), dtype=np.uint8)
+    array[8:16, 8:16] = (255, 0, 0, 255)  # Face
+    array[8:16, 40:48] = (0, 0, 255, 0)  # Transparent hat
+    array[9, 41] = (0, 255, 0, 255)  # One pixel of hat
+    array[20:32, 16:56] = (0, 0, 0, 255)  # Body and arms
+    if height == 64:
+        array[52:64, 32:48] = (0, 0, 0, 255)  # Left arm
+    return array
+
+
+class TestSkinsRender(unittest.TestCase):
+    def setUp(self) -> None:
+        self.skin = Skin(os.path.join(_ASSETS, "skin.png"), "classic")
+
+    def test_face(self):
+        image = render(_skin_array(), "face", size=8)
+        assert image.size == (8, 8)
+        assert image.getpixel((0, 0)) == (255, 0, 0, 255)
+        assert image.getpixel((1, 1)) == (0, 255, 0, 255)
+
+        image = render(_skin_array(), "face", size=16, overlay=False)
+        assert image.size == (16, 16)
+        assert image.getpixel((2, 2)) == (255, 0, 0, 255)
+
+    def test_head(self):
+        image = render(_skin_array(), "head", size=72)
+        assert image.size == (72, 72)
+        # The hat is drawn around the face
+        assert image.getpixel((0, 0))[3] == 0
+        assert image.getpixel((4, 4)) == (255, 0, 0, 255)
+        # Every pixel of the hat has the same size, 9/8 of a face pixel
+        for xy in ((9, 9), (17, 17)):
+            assert image.getpixel(xy) == (0, 255, 0, 255)
+        for xy in ((8, 8), (18, 18)):
+            assert image.getpixel(xy) == (255, 0, 0, 255)
+
+        # The head is drawn at the size of the avatar, the pixels of the hat
+        # are 8x8 and the ones of the face 7x7
+        pixels = np.asarray(render(_skin_array(), "head", size=64))
+        assert pixels.shape == (64, 64, 4)
+        assert (pixels[8:16, 8:16] == (0, 255, 0, 255)).all()
+        assert (pixels[16, 16] == (255, 0, 0, 255)).all()
+        assert (pixels[4:60, 4] == (255, 0, 0, 255)).all()
+        assert (pixels[:, :4, 3] == 0).all()
+        assert (pixels[:, 60:, 3] == 0).all()
+
+    def test_bust(self):
+        image = render(_skin_array(), "bust", size=16, variant="classic")
+        assert image.size == (16, 16)
+        assert image.getpixel((0, 8)) == (0, 0, 0, 255)
+        assert image.getpixel((15, 8)) == (0, 0, 0, 255)
+
+        assert render(_skin_array(), "bust", size=16, variant="slim").size == (14, 16)
+        assert render(_skin_array(32), "bust", size=32).size == (32, 32)
+
+        pytest.raises(ValueError, render, _skin_array(), "feet")
+
+    def test_render_batch(self):
+        skins = [self.skin, Skin(os.path.join(_ASSETS, "skin.png"), "slim")]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            avatars = render_batch(skins, "bust", size=32, executor=executor)
+
+        assert len(avatars) == 2
+        assert Image.open(io.BytesIO(avatars[0])).size == (32, 32)
+        assert Image.open(io.BytesIO(avatars[1])).size == (28, 32)
+
+    def test_render_batch_processes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = render_batch(
+                {"a": self.skin, "b": self.skin},
+                "head",
+                size=36,
+                directory=directory,
+                max_workers=2,
+            )
+
+            assert paths == [os.path.join(directory, f"{n}.png") for n in "ab"]
+            with Image.open(paths[1]) as image:
+                assert image.size == (36, 36)
+
+        assert render_batch([], "face") == []
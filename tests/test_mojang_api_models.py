@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import os
 import unittest
 from contextlib import contextmanager
+from unittest import mock
 
+import pytest
 import responses
 
-from mojang.api.models import _Resource
+from mojang.api.models import Cape, Skin, _Resource
+from mojang.exceptions import ServerError
 
 
 @contextmanager
@@ -68,6 +73,51 @@ class TestMojangAPIModels(unittest.TestCase):
         assert resource.extension == "png"
         assert resource.data == self.skin_data
 
+    @responses.activate
+    def test_load_on_access(self):
+        url = "http://textures.minecraft.net/texture/1a4af718455d4aab528e7a61f86fa25e6a369d1768dcb13f7df319a713eb810b"
+        self._patch_skin_url(url, "image/png")
+
+        resource = _Resource(source=url)
+        assert not resource.loaded
+        assert len(responses.calls) == 0
+
+        assert resource.data == self.skin_data
+        assert resource.extension == "png"
+        assert resource.loaded
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_no_autoload(self):
+        url = "http://textures.minecraft.net/texture/1a4af718455d4aab528e7a61f86fa25e6a369d1768dcb13f7df319a713eb810b"
+        self._patch_skin_url(url, "image/png")
+
+        resource = _Resource(source=url, autoload=False)
+        assert resource.data == b""
+        assert resource.extension is None
+        assert len(responses.calls) == 0
+
+        resource.load()
+        assert resource.data == self.skin_data
+
+    @responses.activate
+    def test_load_failure(self):
+        url = "http://textures.minecraft.net/texture/1a4af718455d4aab528e7a61f86fa25e6a369d1768dcb13f7df319a713eb810b"
+        responses.add(method=responses.GET, url=url, status=500)
+        self._patch_skin_url(url, "image/png")
+
+        # The failed download is not kept, the next access tries again
+        resource = _Resource(source=url)
+        pytest.raises(ServerError, resource.load)
+        assert not resource.loaded
+        assert resource.data == self.skin_data
+        assert resource.loaded
+
+        missing = _Resource(source=os.path.join(self.assets, "missing.png"))
+        pytest.raises(FileNotFoundError, missing.load)
+        pytest.raises(FileNotFoundError, missing.save, io.BytesIO())
+        assert not missing.loaded
+
     @responses.activate
     def test_filename_from_url(self):
         url = "https://pngset.com/images/best-36-minecraft-skins-boy-hd-wallpapers-skin-minecraft-pe-cute-boy-bottle-beverage-drink-costume-transparent-png-780399.png"
@@ -89,3 +139,69 @@ class TestMojangAPIModels(unittest.TestCase):
 
             assert os.path.exists(filename)
             assert self.skin_data == content
+
+    @responses.activate
+    def test_save_stream(self):
+        url = "http://textures.minecraft.net/texture/1a4af718455d4aab528e7a61f86fa25e6a369d1768dcb13f7df319a713eb810b"
+        self._patch_skin_url(url, "image/png")
+
+        resource = _Resource(source=url)
+        buffer = io.BytesIO()
+        assert resource.save(buffer, chunk_size=128) is buffer
+        assert buffer.getvalue() == self.skin_data
+        assert not resource.loaded
+
+        filename = os.path.join(self.assets, "test_save_stream.png")
+        with ensure_deleted(filename):
+            dest = resource.save(os.path.join(self.assets, "test_save_stream"))
+            assert dest == filename
+            with open(filename, "rb") as fp:
+                assert fp.read() == self.skin_data
+
+        assert not resource.loaded
+        assert resource.extension == "png"
+        assert len(responses.calls) == 2
+
+    def test_save_stream_local(self):
+        resource = _Resource(source=self.skin_path)
+        buffer = io.BytesIO()
+        resource.save(buffer, chunk_size=128)
+
+        assert buffer.getvalue() == self.skin_data
+        assert not resource.loaded
+
+    def test_digest(self):
+        skin = Skin(self.skin_path, "classic", load=True)
+        other = Skin(self.skin_path, "classic", load=True)
+        assert skin.digest == hashlib.sha256(self.skin_data).hexdigest()
+        assert not hasattr(skin, "__dict__")
+
+        # The digest is computed once, when the data is loaded
+        with mock.patch("mojang.api.models.hashlib.sha256") as sha256:
+            assert skin == other
+            assert len({skin, other}) == 1
+            sha256.assert_not_called()
+
+        assert skin != Skin(self.skin_path, "slim", load=True)
+        assert Cape(self.skin_path, load=True) == Cape(self.skin_path, load=True)
+        assert Cape(self.skin_path, load=True) != skin
+
+    @responses.activate
+    def test_hash_lazy(self):
+        url = "http://textures.minecraft.net/texture/1a4af718455d4aab528e7a61f86fa25e6a369d1768dcb13f7df319a713eb810b"
+        self._patch_skin_url(url, "image/png")
+
+        # The textures are downloaded once to be hashed, then the digest
+        # is reused
+        skin = Skin(url, "classic")
+        skins = {skin, Skin(url, "classic")}
+        assert len(skins) == 1
+        assert len(responses.calls) == 2
+        assert skin in skins
+        assert len(responses.calls) == 2
+
+        # Resources with a different content are never equal
+        other = Skin(url, "classic", autoload=False)
+        other._fill("png", b"other", None)
+        assert skin != other
+        assert other != skin
@@ -0,0 +1,101 @@
+import json
+import unittest
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+import responses
+
+from mojang.api.batch import UUIDBatcher
+from mojang.api.cache import LookupCache, use_cache
+from mojang.api.urls import api_get_uuids
+from mojang.exceptions import InvalidName, ServerError
+
+_UUIDS = {f"player{i}": f"{i:032x}" for i in range(25)}
+
+
+def _callback(request):
+    names = json.loads(request.body)
+    body = [{"id": _UUIDS[n], "name": n} for n in names if n in _UUIDS]
+    return (200, {}, json.dumps(body))
+
+
+class TestMojangUUIDBatcher(unittest.TestCase):
+    def _add_callback(self):
+        responses.add_callback(
+            method=responses.POST, url=api_get_uuids, callback=_callback
+        )
+
+    @responses.activate
+    def test_get_uuid(self):
+        self._add_callback()
+        batcher = UUIDBatcher(window=0.2)
+        names = [*_UUIDS, "unknown", "player0"]
+
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            uuids = list(executor.map(batcher.get_uuid, names))
+
+        assert uuids == [*_UUIDS.values(), None, _UUIDS["player0"]]
+        # 26 distinct names, 10 per request
+        assert len(responses.calls) == 3
+        for call in responses.calls:
+            assert len(json.loads(call.request.body)) <= 10
+
+    @responses.activate
+    def test_window(self):
+        self._add_callback()
+        batcher = UUIDBatcher(window=0)
+
+        assert batcher.get_uuid("player1") == _UUIDS["player1"]
+        assert batcher.get_uuid("Player2") == _UUIDS["player2"]
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_cache(self):
+        self._add_callback()
+        batcher = UUIDBatcher(window=0)
+
+        with use_cache(LookupCache()):
+            assert batcher.get_uuid("player1") == _UUIDS["player1"]
+            assert batcher.get_uuid("player1") == _UUIDS["player1"]
+
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_error(self):
+        responses.add(method=responses.POST, url=api_get_uuids, status=500)
+        batcher = UUIDBatcher(window=0.1)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(batcher.get_uuid, f"player{i}") for i in range(4)
+            ]
+            for future in futures:
+                pytest.raises(ServerError, future.result)
+
+        assert len(responses.calls) == 1
+
+    def test_leader_interrupted(self):
+        class _Interrupt(BaseException):
+            pass
+
+        batcher = UUIDBatcher(window=0.1)
+        with mock.patch(
+            "mojang.api.batch._fetch_uuids_chunk", side_effect=_Interrupt
+        ), ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(batcher.get_uuid, f"player{i}") for i in range(4)
+            ]
+            errors = [type(future.exception(5)) for future in futures]
+
+        # The leader is interrupted, the other lookups are cancelled
+        assert sorted(errors, key=lambda e: e.__name__) == [
+            CancelledError,
+            CancelledError,
+            CancelledError,
+            _Interrupt,
+        ]
+
+    def test_invalid(self):
+        pytest.raises(ValueError, UUIDBatcher, max_batch=11)
+        pytest.raises(InvalidName, UUIDBatcher().get_uuid, "")
@@ -0,0 +1,65 @@
+import hashlib
+import unittest
+
+import responses
+
+from mojang.api.blocked import BlockedServers, server_patterns
+from mojang.api.urls import api_get_blocked_servers
+
+
+def _sha1(value: str) -> str:
+    return hashlib.sha1(value.encode()).hexdigest()
+
+
+class TestMojangBlockedServersIndex(unittest.TestCase):
+    def test_server_patterns(self):
+        assert server_patterns("MC.Example.com.") == [
+            "mc.example.com",
+            "*.example.com",
+            "*.com",
+        ]
+        assert server_patterns("192.168.0.1") == [
+            "192.168.0.1",
+            "192.168.0.*",
+            "192.168.*",
+            "192.*",
+        ]
+        assert server_patterns("") == []
+
+    def test_is_blocked(self):
+        blocked = BlockedServers(
+            [_sha1("*.example.com"), _sha1("10.0.*"), _sha1("play.server.net")]
+        )
+
+        assert len(blocked) == 3
+        assert blocked.is_blocked("example.com") is False
+        assert blocked.is_blocked("mc.example.com")
+        assert blocked.match("a.b.example.com") == "*.example.com"
+        assert blocked.is_blocked("10.0.12.1")
+        assert not blocked.is_blocked("10.1.0.1")
+        assert "PLAY.server.net" in blocked
+        assert "server.net" not in blocked
+
+    @responses.activate
+    def test_refresh(self):
+        responses.add(
+            method=responses.GET,
+            url=api_get_blocked_servers,
+            body=_sha1("*.example.com") + "\n" + _sha1("mc.test.org") + "\n",
+            headers={"ETag": '"abc"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+            status=200,
+        )
+        responses.add(method=responses.GET, url=api_get_blocked_servers, status=304)
+
+        blocked = BlockedServers()
+        assert blocked.refresh()
+        assert len(blocked) == 2
+        assert blocked.etag == '"abc"'
+        assert blocked.is_blocked("mc.test.org")
+
+        assert not blocked.refresh()
+        assert len(blocked) == 2
+
+        headers = responses.calls[1].request.headers
+        assert headers["if-none-match"] == '"abc"'
+        assert headers["if-modified-since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
@@ -0,0 +1,102 @@
+import base64
+import json
+import unittest
+
+import pytest
+import responses
+
+import mojang
+from mojang.api.structures import UnauthenticatedProfile
+from mojang.api.urls import api_get_username, api_user_profile
+from mojang.exceptions import ServerError
+
+_SKIN_URL = "http://textures.minecraft.net/texture/292009a4925b58f02c77dadc3ecef07ea4c7472f64e0fdc32ce5522489362680"
+_UUIDS = [f"{i:032x}" for i in range(20)]
+
+
+def _textures_property():
+    value = {"textures": {"SKIN": {"url": _SKIN_URL}}}
+    return base64.b64encode(json.dumps(value).encode()).decode()
+
+
+class TestMojangBulk(unittest.TestCase):
+    def _mock_usernames(self):
+        for i, uuid in enumerate(_UUIDS):
+            if i % 5 == 0:
+                responses.add(
+                    method=responses.GET, url=api_get_username(uuid), status=204
+                )
+            else:
+                responses.add(
+                    method=responses.GET,
+                    url=api_get_username(uuid),
+                    json={"id": uuid, "name": f"Player{i}"},
+                    status=200,
+                )
+
+    def _mock_profiles(self):
+        responses.add(method=responses.GET, url=_SKIN_URL, body=b"", status=200)
+        for i, uuid in enumerate(_UUIDS):
+            if i % 5 == 0:
+                responses.add(
+                    method=responses.GET, url=api_user_profile(uuid), status=204
+                )
+            else:
+                responses.add(
+                    method=responses.GET,
+                    url=api_user_profile(uuid),
+                    json={
+                        "id": uuid,
+                        "name": f"Player{i}",
+                        "properties": [
+                            {"name": "textures", "value": _textures_property()}
+                        ],
+                    },
+                    status=200,
+                )
+
+    @responses.activate
+    def test_get_usernames(self):
+        self._mock_usernames()
+
+        usernames = mojang.get_usernames(_UUIDS, max_workers=4)
+        assert list(usernames) == _UUIDS
+        assert usernames[_UUIDS[0]] is None
+        assert usernames[_UUIDS[1]] == "Player1"
+        assert usernames[_UUIDS[19]] == "Player19"
+
+    @responses.activate
+    def test_iter_usernames(self):
+        self._mock_usernames()
+
+        results = dict(mojang.iter_usernames(iter(_UUIDS), max_workers=4))
+        assert results == mojang.get_usernames(_UUIDS)
+
+    @responses.activate
+    def test_iter_usernames_early_stop(self):
+        self._mock_usernames()
+
+        iterator = mojang.iter_usernames(iter(_UUIDS), max_workers=2)
+        uuid, _ = next(iterator)
+        iterator.close()
+
+        assert uuid in _UUIDS
+        assert len(responses.calls) < len(_UUIDS)
+
+    @responses.activate
+    def test_get_profiles(self):
+        self._mock_profiles()
+
+        profiles = mojang.get_profiles(_UUIDS, max_workers=4)
+        assert list(profiles) == _UUIDS
+        assert profiles[_UUIDS[0]] is None
+        assert isinstance(profiles[_UUIDS[3]], UnauthenticatedProfile)
+        assert profiles[_UUIDS[3]].name == "Player3"
+        assert profiles[_UUIDS[3]].skin.source == _SKIN_URL
+
+    @responses.activate
+    def test_iter_profiles_error(self):
+        responses.add(method=responses.GET, url=api_user_profile(_UUIDS[0]), status=500)
+
+        with pytest.raises(ServerError):
+            list(mojang.iter_profiles(_UUIDS[:1]))
@@ -0,0 +1,222 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import responses
+
+import mojang
+from mojang.api.cache import LookupCache, SQLiteLookupCache, get_cache, use_cache
+from mojang.api.models import Skin
+from mojang.api.structures import UnauthenticatedProfile
+from mojang.api.urls import api_get_username, api_get_uuid, api_get_uuids
+
+_SKIN_URL = "http://textures.minecraft.net/texture/292009a4925b58f02c77dadc3ecef07ea4c7472f64e0fdc32ce5522489362680"
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMojangLookupCache(unittest.TestCase):
+    def test_ttl(self):
+        clock = _FakeClock()
+        cache = LookupCache(ttl={"uuid": 10}, negative_ttl=2, clock=clock)
+        cache.set("uuid", "notch", "069a79f444e94726a5befca90e38aaf5")
+        cache.set("uuid", "unexistentplayer", None)
+
+        assert cache.get("uuid", "notch") == (True, "069a79f444e94726a5befca90e38aaf5")
+        assert cache.get("uuid", "unexistentplayer") == (True, None)
+
+        clock.now = 5
+        assert cache.get("uuid", "notch") == (True, "069a79f444e94726a5befca90e38aaf5")
+        assert cache.get("uuid", "unexistentplayer") == (False, None)
+
+        clock.now = 10
+        assert cache.get("uuid", "notch") == (False, None)
+        assert cache.stats == (3, 2, 0, 2)
+
+    def test_lru_eviction(self):
+        cache = LookupCache(maxsize=2)
+        cache.set("uuid", "a", "1")
+        cache.set("uuid", "b", "2")
+        cache.get("uuid", "a")
+        cache.set("uuid", "c", "3")
+
+        assert len(cache) == 2
+        assert cache.get("uuid", "b") == (False, None)
+        assert cache.get("uuid", "a") == (True, "1")
+        assert cache.get("uuid", "c") == (True, "3")
+        assert cache.stats.evictions == 1
+
+    def test_invalidate_clear(self):
+        cache = LookupCache()
+        cache.set("username", "x", "Notch")
+        cache.set("username", "y", "jeb_")
+        cache.invalidate("username", "x")
+        assert cache.get("username", "x") == (False, None)
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_use_cache(self):
+        cache = LookupCache()
+        assert get_cache() is None
+        with use_cache(cache):
+            assert get_cache() is cache
+        assert get_cache() is None
+
+
+class TestMojangCachedLookups(unittest.TestCase):
+    @responses.activate
+    def test_get_uuid(self):
+        responses.add(
+            method=responses.GET,
+            url=api_get_uuid("Notch"),
+            json={"id": "069a79f444e94726a5befca90e38aaf5", "name": "Notch"},
+            status=200,
+        )
+        responses.add(
+            method=responses.GET, url=api_get_uuid("UNEXISTENTPLAYER"), status=204
+        )
+
+        with use_cache(LookupCache()) as cache:
+            for _ in range(3):
+                assert mojang.get_uuid("Notch") == "069a79f444e94726a5befca90e38aaf5"
+                assert mojang.get_uuid("UNEXISTENTPLAYER") is None
+
+        assert len(responses.calls) == 2
+        assert cache.stats.hits == 4
+        assert cache.stats.misses == 2
+
+    @responses.activate
+    def test_get_username_404(self):
+        uuid = "069a79f444e94726a5befca90e38aaf5"
+        responses.add(method=responses.GET, url=api_get_username(uuid), status=404)
+
+        with use_cache(LookupCache()):
+            assert mojang.get_username(uuid) is None
+            assert mojang.get_username(uuid) is None
+
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_get_uuids(self):
+        responses.add(
+            method=responses.POST,
+            url=api_get_uuids,
+            json=[{"id": "45f50155c09f4fdcb5cee30af2ebd1f0", "name": "_jeb"}],
+            status=200,
+        )
+
+        with use_cache(LookupCache()) as cache:
+            cache.set("uuid", "notch", "069a79f444e94726a5befca90e38aaf5")
+            uuids = mojang.get_uuids(["Notch", "_jeb"])
+            assert uuids == {
+                "notch": "069a79f444e94726a5befca90e38aaf5",
+                "_jeb": "45f50155c09f4fdcb5cee30af2ebd1f0",
+            }
+            assert mojang.get_uuid("_jeb") == "45f50155c09f4fdcb5cee30af2ebd1f0"
+
+        assert len(responses.calls) == 1
+        assert responses.calls[0].request.body == b'["_jeb"]'
+
+
+class TestMojangSQLiteLookupCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "cache.sqlite3")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _profile(self):
+        return UnauthenticatedProfile(
+            name="Notch",
+            uuid="069a79f444e94726a5befca90e38aaf5",
+            is_legacy=False,
+            is_demo=False,
+            skin=Skin(_SKIN_URL, "classic", load=False),
+            cape=None,
+        )
+
+    def test_persistence(self):
+        cache = SQLiteLookupCache(self.path)
+        cache.set("uuid", "notch", "069a79f444e94726a5befca90e38aaf5")
+        cache.set("uuid", "unexistentplayer", None)
+        cache.set("profile", "069a79f444e94726a5befca90e38aaf5", self._profile())
+        cache.close()
+
+        cache = SQLiteLookupCache(self.path)
+        assert len(cache) == 3
+        assert cache.get("uuid", "notch") == (True, "069a79f444e94726a5befca90e38aaf5")
+        assert cache.get("uuid", "unexistentplayer") == (True, None)
+        assert cache.get("uuid", "jeb_") == (False, None)
+
+        found, profile = cache.get("profile", "069a79f444e94726a5befca90e38aaf5")
+        assert found
+        assert profile.name == "Notch"
+        assert profile.skin.source == _SKIN_URL
+        assert profile.skin.variant == "classic"
+        assert profile.cape is None
+        assert cache.stats.hits == 3
+        assert cache.stats.misses == 1
+
+    def test_expiration(self):
+        cache = SQLiteLookupCache(self.path, negative_ttl=0)
+        cache.set("uuid", "notch", "069a79f444e94726a5befca90e38aaf5", ttl=-1)
+        cache.set("uuid", "unexistentplayer", None)
+        cache.set("uuid", "_jeb", "45f50155c09f4fdcb5cee30af2ebd1f0")
+
+        assert cache.get("uuid", "notch") == (False, None)
+        assert cache.get("uuid", "unexistentplayer") == (False, None)
+        assert len(cache) == 1
+        assert cache.purge() == 0
+        assert cache.stats.expirations == 0
+
+    def test_concurrent_writers(self):
+        def _write(n):
+            cache = SQLiteLookupCache(self.path)
+            cache.set_many("uuid", [(f"p{n}-{i}", str(i)) for i in range(50)])
+            cache.close()
+
+        SQLiteLookupCache(self.path).close()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(_write, range(8)))
+
+        assert len(SQLiteLookupCache(self.path)) == 400
+
+    def test_export_warm(self):
+        cache = SQLiteLookupCache(self.path)
+        cache.set("uuid", "notch", "069a79f444e94726a5befca90e38aaf5")
+        cache.set("profile", "069a79f444e94726a5befca90e38aaf5", self._profile())
+
+        memory = LookupCache()
+        assert memory.warm(cache.export()) == 2
+        assert memory.get("uuid", "notch") == (True, "069a79f444e94726a5befca90e38aaf5")
+
+        other = SQLiteLookupCache(os.path.join(self.tmpdir.name, "other.sqlite3"))
+        assert other.warm(memory.export()) == 2
+        found, profile = other.get("profile", "069a79f444e94726a5befca90e38aaf5")
+        assert found
+        assert profile.name == "Notch"
+
+    @responses.activate
+    def test_cached_lookup(self):
+        responses.add(
+            method=responses.GET,
+            url=api_get_uuid("Notch"),
+            json={"id": "069a79f444e94726a5befca90e38aaf5", "name": "Notch"},
+            status=200,
+        )
+
+        with use_cache(SQLiteLookupCache(self.path)):
+            assert mojang.get_uuid("Notch") == "069a79f444e94726a5befca90e38aaf5"
+
+        with use_cache(SQLiteLookupCache(self.path)):
+            assert mojang.get_uuid("Notch") == "069a79f444e94726a5befca90e38aaf5"
+
+        assert len(responses.calls) == 1
@@ -0,0 +1,84 @@
+import os
+import unittest
+
+import responses
+
+import mojang
+from mojang.api.models import Cape, Skin
+from mojang.api.structures import AuthenticatedUserProfile, UnauthenticatedProfile
+
+_URL = "http://textures.minecraft.net/texture/{}"
+
+
+class TestMojangPrefetchTextures(unittest.TestCase):
+    def setUp(self) -> None:
+        path = os.path.join(os.path.dirname(__file__), "assets", "skin.png")
+        with open(path, "rb") as fp:
+            self.skin_data = fp.read()
+
+    def _add_texture(self, i: int):
+        responses.add(
+            method=responses.GET,
+            url=_URL.format(f"{i:064x}"),
+            body=self.skin_data,
+            status=200,
+            content_type="image/png",
+        )
+
+    @responses.activate
+    def test_prefetch(self):
+        for i in range(4):
+            self._add_texture(i)
+
+        profiles = [
+            UnauthenticatedProfile(
+                name=f"player{i}",
+                uuid=f"{i:032x}",
+                is_legacy=False,
+                is_demo=False,
+                skin=Skin(_URL.format(f"{i % 3:064x}"), "classic"),
+                cape=None,
+            )
+            for i in range(6)
+        ]
+        cape = Cape(_URL.format(f"{3:064x}"), autoload=False)
+        user = AuthenticatedUserProfile(
+            name="user",
+            uuid=f"{9:032x}",
+            is_legacy=False,
+            is_demo=False,
+            skins=[Skin(_URL.format(f"{0:064x}"), "slim")],
+            capes=[cape],
+        )
+
+        assert mojang.prefetch_textures([*profiles, user, None], max_workers=4) == 4
+        assert len(responses.calls) == 4
+
+        for profile in profiles:
+            assert profile.skin.loaded
+            assert profile.skin.data == self.skin_data
+            assert profile.skin.extension == "png"
+        assert user.skins[0].data == self.skin_data
+        assert cape.data == self.skin_data
+
+        # Everything is loaded already
+        assert mojang.prefetch_textures(profiles) == 0
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_prefetch_failure(self):
+        self._add_texture(0)
+        url = _URL.format(f"{1:064x}")
+        responses.add(method=responses.GET, url=url, status=500)
+        self._add_texture(1)
+
+        skins = [Skin(_URL.format(f"{0:064x}"), "classic")] + [
+            Skin(url, "classic") for _ in range(2)
+        ]
+        assert mojang.prefetch_textures(skins) == 1
+
+        # The skins of the failed url are not filled with empty content
+        assert skins[0].loaded
+        assert not skins[1].loaded
+        assert not skins[2].loaded
+        assert skins[1].data == self.skin_data
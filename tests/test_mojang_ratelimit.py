@@ -0,0 +1,147 @@
+import threading
+import unittest
+
+import pytest
+import responses
+
+import mojang
+from mojang.api.ratelimit import HostRateLimiter, RateLimiter
+from mojang.api.transport import Transport, use_transport
+from mojang.api.urls import api_get_uuid, api_get_uuids
+from mojang.exceptions import TooManyRequests
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.sleeps.append(delay)
+
+
+class TestMojangRateLimiter(unittest.TestCase):
+    def test_invalid_rate(self):
+        pytest.raises(ValueError, RateLimiter, 0)
+
+    def test_burst(self):
+        clock = _FakeClock()
+        limiter = RateLimiter(2, burst=3, clock=clock, sleep=clock.sleep)
+
+        assert limiter.try_acquire()
+        assert limiter.try_acquire()
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+
+        clock.now += 0.5
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+
+    def test_acquire_waits_in_order(self):
+        clock = _FakeClock()
+        limiter = RateLimiter(4, burst=1, clock=clock, sleep=clock.sleep)
+
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == pytest.approx(0.25)
+        assert limiter.acquire() == pytest.approx(0.5)
+        assert clock.sleeps == [pytest.approx(0.25), pytest.approx(0.5)]
+
+        clock.now += 2
+        assert limiter.acquire() == 0
+
+    def test_pause(self):
+        clock = _FakeClock()
+        limiter = RateLimiter(None, clock=clock, sleep=clock.sleep)
+
+        assert limiter.acquire() == 0
+        limiter.pause(3)
+        assert not limiter.try_acquire()
+        assert limiter.acquire() == 3
+
+        clock.now += 3
+        assert limiter.try_acquire()
+
+    def test_queue_depth(self):
+        started, release = threading.Event(), threading.Event()
+
+        def _sleep(_):
+            started.set()
+            release.wait(5)
+
+        limiter = RateLimiter(1, burst=1, sleep=_sleep)
+        limiter.acquire()
+
+        thread = threading.Thread(target=limiter.acquire)
+        thread.start()
+        started.wait(5)
+        assert limiter.queue_depth == 1
+
+        release.set()
+        thread.join()
+        assert limiter.queue_depth == 0
+
+
+class TestMojangHostRateLimiter(unittest.TestCase):
+    def test_limits(self):
+        limiter = HostRateLimiter(
+            {"api.mojang.com": (2, 10), "sessionserver.mojang.com": 5}
+        )
+
+        assert limiter.limiter(api_get_uuids) is limiter.limiter("api.mojang.com")
+        assert limiter.limiter("api.mojang.com").rate == 2
+        assert limiter.limiter("api.mojang.com").burst == 10
+        assert limiter.limiter("sessionserver.mojang.com").rate == 5
+        assert limiter.limiter("textures.minecraft.net").rate is None
+        assert limiter.queue_depth() == 0
+        assert limiter.queue_depths() == dict.fromkeys(
+            ["api.mojang.com", "sessionserver.mojang.com", "textures.minecraft.net"], 0
+        )
+
+    def test_default_limits(self):
+        limiter = HostRateLimiter()
+        assert limiter.limiter("api.mojang.com").rate == 1.0
+        assert limiter.limiter("api.mojang.com").burst == 60
+        assert limiter.limiter("textures.minecraft.net").rate is None
+        assert HostRateLimiter({}).limiter("api.mojang.com").rate is None
+
+    def test_retry_delay(self):
+        limiter = HostRateLimiter(max_retries=2, backoff=1, max_retry_after=10)
+
+        assert limiter.retry_delay(api_get_uuids, 0, {"retry-after": "4"}) == 4
+        assert limiter.retry_delay(api_get_uuids, 1, {}) == 2
+        assert limiter.retry_delay(api_get_uuids, 2, {}) is None
+        assert limiter.retry_delay(api_get_uuids, 0, {"retry-after": "60"}) is None
+        assert not limiter.limiter("api.mojang.com").try_acquire()
+
+    @responses.activate
+    def test_transport_retry_after(self):
+        responses.add(
+            method=responses.GET,
+            url=api_get_uuid("Notch"),
+            status=429,
+            headers={"Retry-After": "0"},
+        )
+        responses.add(
+            method=responses.GET,
+            url=api_get_uuid("Notch"),
+            json={"id": "069a79f444e94726a5befca90e38aaf5", "name": "Notch"},
+            status=200,
+        )
+
+        with Transport() as transport, use_transport(transport):
+            assert mojang.get_uuid("Notch") == "069a79f444e94726a5befca90e38aaf5"
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_transport_too_many_requests(self):
+        responses.add(method=responses.GET, url=api_get_uuid("Notch"), status=429)
+
+        limiter = HostRateLimiter(max_retries=0)
+        with Transport(limiter=limiter) as transport, use_transport(transport):
+            pytest.raises(TooManyRequests, mojang.get_uuid, "Notch")
+
+        assert len(responses.calls) == 1
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+
+import mojang
+from mojang.api.singleflight import AsyncSingleFlight, SingleFlight
+from mojang.api.urls import api_get_uuid
+
+_UUID = "069a79f444e94726a5befca90e38aaf5"
+
+
+class TestMojangSingleFlight(unittest.TestCase):
+    def test_do(self):
+        group = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def _func():
+            calls.append(1)
+            release.wait(5)
+            return _UUID
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(group.do, "notch", _func) for _ in range(8)]
+            while group.in_flight() == 0:
+                time.sleep(0.001)
+            time.sleep(0.05)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert results == [_UUID] * 8
+        assert len(calls) == 1
+        assert group.in_flight() == 0
+
+        # Once the call is done, the function runs again
+        assert group.do("notch", lambda: "other") == "other"
+
+    def test_do_error(self):
+        group = SingleFlight()
+        release = threading.Event()
+
+        def _func():
+            release.wait(5)
+            raise ValueError
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(group.do, "notch", _func) for _ in range(4)]
+            time.sleep(0.05)
+            release.set()
+            for future in futures:
+                pytest.raises(ValueError, future.result)
+
+        assert group.in_flight() == 0
+
+    def test_do_async(self):
+        group = AsyncSingleFlight()
+        calls = []
+
+        async def _func():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return _UUID
+
+        async def _main():
+            return await asyncio.gather(*(group.do("notch", _func) for _ in range(8)))
+
+        assert asyncio.run(_main()) == [_UUID] * 8
+        assert len(calls) == 1
+        assert group.in_flight() == 0
+
+    def test_do_async_cancelled(self):
+        group = AsyncSingleFlight()
+
+        async def _func():
+            await asyncio.sleep(0.01)
+            return _UUID
+
+        async def _main():
+            first = asyncio.ensure_future(group.do("notch", _func))
+            second = asyncio.ensure_future(group.do("notch", _func))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(_main()) == _UUID
+
+    @responses.activate
+    def test_get_uuid(self):
+        def _callback(_):
+            time.sleep(0.1)
+            return (200, {}, f'{{"id": "{_UUID}", "name": "Notch"}}')
+
+        responses.add_callback(
+            method=responses.GET, url=api_get_uuid("Notch"), callback=_callback
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(mojang.get_uuid, ["Notch"] * 8))
+
+        assert results == [_UUID] * 8
+        assert len(responses.calls) == 1
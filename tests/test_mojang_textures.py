@@ -0,0 +1,99 @@
+import os
+import tempfile
+import time
+import unittest
+
+import pytest
+import responses
+
+from mojang.api.models import Skin
+from mojang.api.textures import TextureStore, texture_hash, use_texture_store
+
+_HASH = "1a4af718455d4aab528e7a61f86fa25e6a369d1768dcb13f7df319a713eb810b"
+_URL = f"http://textures.minecraft.net/texture/{_HASH}"
+
+
+def _key(i: int) -> str:
+    return f"{i:064x}"
+
+
+class TestMojangTextureStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.directory = self.tmpdir.name
+        with open(
+            os.path.join(os.path.dirname(__file__), "assets", "skin.png"), "rb"
+        ) as fp:
+            self.skin_data = fp.read()
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_texture_hash(self):
+        assert texture_hash(_URL) == _HASH
+        assert texture_hash("https://example.com/texture/" + _HASH) is None
+        assert texture_hash("http://textures.minecraft.net/texture/skin.png") is None
+
+    def test_put_get(self):
+        store = TextureStore(self.directory)
+        assert store.get(_HASH) is None
+
+        store.put(_HASH, [b"abc", b"def"])
+        assert _HASH in store
+        assert store.get(_HASH) == b"abcdef"
+        assert store.size == 6
+        assert store.stats == (1, 1, 0)
+
+        # A new store picks up the textures already on disk
+        assert TextureStore(self.directory).size == 6
+
+        store.remove(_HASH)
+        assert _HASH not in store
+        assert store.size == 0
+
+        pytest.raises(ValueError, store.put, "../file", b"")
+
+    def test_eviction(self):
+        store = TextureStore(self.directory, max_size=30)
+        for i in range(3):
+            store.put(_key(i), b"x" * 10)
+            os.utime(store._path(_key(i)), (time.time() - 100 + i,) * 2)
+
+        # Reading a texture marks it as recently used
+        assert store.get(_key(0)) is not None
+        store.put(_key(3), b"x" * 10)
+
+        assert _key(0) in store
+        assert _key(1) not in store
+        assert len(store) == 3
+        assert store.size == 30
+        assert store.stats.evictions == 1
+
+    def test_partial_tee(self):
+        store = TextureStore(self.directory)
+        chunks = store.tee(_HASH, iter([b"abc", b"def"]))
+        next(chunks)
+        chunks.close()
+
+        assert _HASH not in store
+        assert os.listdir(os.path.join(self.directory, _HASH[:2])) == []
+
+    @responses.activate
+    def test_load(self):
+        responses.add(
+            method=responses.GET,
+            url=_URL,
+            body=self.skin_data,
+            status=200,
+            content_type="image/png",
+        )
+
+        with use_texture_store(TextureStore(self.directory)) as store:
+            assert Skin(_URL, "classic").data == self.skin_data
+            assert _HASH in store
+
+            skin = Skin(_URL, "classic")
+            assert skin.data == self.skin_data
+            assert skin.extension == "png"
+
+        assert len(responses.calls) == 1
@@ -0,0 +1,65 @@
+import unittest
+
+import requests
+import responses
+
+import mojang
+from mojang.api import transport
+from mojang.api.urls import api_get_uuid
+
+
+class _RecordingSession(requests.Session):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def request(self, method, url, *args, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return super().request(method, url, *args, **kwargs)
+
+
+class TestMojangTransport(unittest.TestCase):
+    def _mock_uuid(self, username: str):
+        responses.add(
+            method=responses.GET,
+            url=api_get_uuid(username),
+            json={"id": "069a79f444e94726a5befca90e38aaf5", "name": username},
+            status=200,
+        )
+
+    def test_default_transport_is_shared(self):
+        assert transport.get_transport() is transport.get_transport()
+
+    def test_set_transport(self):
+        previous = transport.get_transport()
+        custom = transport.Transport()
+        try:
+            transport.set_transport(custom)
+            assert transport.get_transport() is custom
+        finally:
+            transport.set_transport(previous)
+            custom.close()
+
+    @responses.activate
+    def test_use_transport(self):
+        self._mock_uuid("Notch")
+        session = _RecordingSession()
+
+        with transport.Transport(session=session, timeout=3) as custom:
+            with transport.use_transport(custom):
+                assert transport.get_transport() is custom
+                assert mojang.get_uuid("Notch") == "069a79f444e94726a5befca90e38aaf5"
+
+            assert transport.get_transport() is not custom
+
+        assert len(session.calls) == 1
+        method, url, kwargs = session.calls[0]
+        assert method == "GET"
+        assert url == api_get_uuid("Notch")
+        assert kwargs["timeout"] == 3
+
+    def test_pool_settings(self):
+        with transport.Transport(pool_connections=4, pool_maxsize=32) as custom:
+            adapter = custom.session.get_adapter("https://api.mojang.com")
+            assert adapter._pool_connections == 4
+            assert adapter._pool_maxsize == 32
@@ -58,6 +58,17 @@ class TestMojangStatus(unittest.TestCase):
         assert profile.skin.variant == "classic"
         assert profile.cape is None
 
+        # The skin is only downloaded when its data is accessed
+        assert len(responses.calls) == 1
+        assert profile.skin.data == b""
+        assert len(responses.calls) == 2
+
+        profile = mojang.get_profile(uuid, load_textures=False)
+        assert profile.skin.source.startswith("http://textures.minecraft.net/")
+        assert not profile.skin.autoload
+        assert profile.skin.data == b""
+        assert len(responses.calls) == 3
+
     @responses.activate
     def test204(self):
         uuid = "069a79f444e94726a5befca90e38aaf6"  # Does not exists
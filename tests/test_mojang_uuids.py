@@ -1,11 +1,14 @@
+import json
 import unittest
 
 import pytest
 import responses
 
 import mojang
+from mojang.api.cache import LookupCache, use_cache
 from mojang.api.urls import api_get_uuids
 from mojang.exceptions import (
+    ChunkLookupError,
     InvalidName,
     MethodNotAllowed,
     NotFound,
@@ -62,14 +65,75 @@ class TestMojangStatus(unittest.TestCase):
     @responses.activate
     def test404(self):
         responses.add(method=responses.POST, url=api_get_uuids, status=404)
-        pytest.raises(NotFound, mojang.get_uuids, ["Notch", "_jeb"])
+        with pytest.raises(ChunkLookupError) as excinfo:
+            mojang.get_uuids(["Notch", "_jeb"])
+        assert excinfo.value.usernames == ["notch", "_jeb"]
+        assert isinstance(excinfo.value.__cause__, NotFound)
 
     @responses.activate
     def test405(self):
         responses.add(method=responses.POST, url=api_get_uuids, status=405)
-        pytest.raises(MethodNotAllowed, mojang.get_uuids, ["Notch", "_jeb"])
+        with pytest.raises(ChunkLookupError) as excinfo:
+            mojang.get_uuids(["Notch", "_jeb"])
+        assert excinfo.value.usernames == ["notch", "_jeb"]
+        assert isinstance(excinfo.value.__cause__, MethodNotAllowed)
 
     @responses.activate
     def test500(self):
         responses.add(method=responses.POST, url=api_get_uuids, status=500)
-        pytest.raises(ServerError, mojang.get_uuids, ["Notch", "_jeb"])
+        with pytest.raises(ChunkLookupError) as excinfo:
+            mojang.get_uuids(["Notch", "_jeb"])
+        assert excinfo.value.usernames == ["notch", "_jeb"]
+        assert isinstance(excinfo.value.__cause__, ServerError)
+
+    @responses.activate
+    def test_concurrent(self):
+        def _callback(request):
+            names = json.loads(request.body)
+            body = [{"id": f"uuid-{n}", "name": n.upper()} for n in names if n != "p7"]
+            return (200, {}, json.dumps(body))
+
+        responses.add_callback(
+            method=responses.POST, url=api_get_uuids, callback=_callback
+        )
+
+        usernames = [f"P{i}" for i in range(45)]
+        uuids = mojang.get_uuids(usernames, max_workers=4, rate_limit=1000)
+        assert len(responses.calls) == 5
+        assert list(uuids) == [u.lower() for u in usernames]
+        assert uuids["p0"] == "uuid-p0"
+        assert uuids["p44"] == "uuid-p44"
+        assert uuids["p7"] is None
+
+    @responses.activate
+    def test_concurrent_failing_chunk(self):
+        def _callback(request):
+            names = json.loads(request.body)
+            if "p15" in names:
+                return (500, {}, "")
+            return (200, {}, "[]")
+
+        responses.add_callback(
+            method=responses.POST, url=api_get_uuids, callback=_callback
+        )
+
+        usernames = [f"P{i}" for i in range(30)]
+        with pytest.raises(ChunkLookupError) as excinfo:
+            mojang.get_uuids(usernames, max_workers=3)
+
+        assert excinfo.value.usernames == [f"p{i}" for i in range(10, 20)]
+        assert isinstance(excinfo.value.__cause__, ServerError)
+
+    @responses.activate
+    def test_empty(self):
+        assert mojang.get_uuids([], max_workers=4) == {}
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_all_cached(self):
+        with use_cache(LookupCache()) as cache:
+            cache.set("uuid", "notch", "069a79f444e94726a5befca90e38aaf5")
+            uuids = mojang.get_uuids(["Notch"], max_workers=4)
+
+        assert uuids == {"notch": "069a79f444e94726a5befca90e38aaf5"}
+        assert len(responses.calls) == 0